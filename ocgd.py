@@ -12,16 +12,29 @@
 import os
 import sys
 import datetime
+import time
+import math
 from pathlib import Path
 import json
 import re
+import io
+import contextlib
+import codecs
+import hashlib
+import threading
+import queue
 import logging
-import unicodedata
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import Union, Optional, Dict, Any
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 import wmi
 import pytz
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import arcpy
 from arcpy import metadata as md
 from arcgis.features import GeoAccessor, GeoSeriesAccessor
@@ -232,6 +245,481 @@ class DualOutput:
                 pass
 
 
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the CensusCache class for HTTP response caching ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class CensusCache:
+    """
+    A persistent, content-addressed on-disk cache for Census API responses.
+    Entries are keyed by the URL plus its query parameters (with the API key removed), expire according to per-endpoint TTLs, and are evicted least-recently-used first once the cache grows beyond its size cap.
+    """
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Class initialization ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 ** 3, catalog_ttl: float = 86400, current_ttl: float = 7 * 86400):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # TTL (seconds) for the data.json discovery catalog
+        self.catalog_ttl = catalog_ttl
+        # TTL (seconds) for the current and previous vintages, which may still be revised
+        self.current_ttl = current_ttl
+        # Hit, miss and eviction counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None
+        self._lock = threading.Lock()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Cache key ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def make_key(self, url: str, params: Union[dict, list, None] = None) -> tuple:
+        # Merge the URL query string with the params, dropping the API key
+        parts = urlsplit(url)
+        items = parse_qsl(parts.query, keep_blank_values = True)
+        if isinstance(params, dict):
+            items += list(params.items())
+        elif params:
+            items += list(params)
+        items = sorted((str(k), str(v)) for k, v in items if k != "key")
+        canonical = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(items), ""))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest(), canonical
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Time to live ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def ttl_for(self, url: str) -> Optional[float]:
+        # The discovery catalog changes whenever a new vintage is published
+        path = urlsplit(url).path
+        if path.endswith("/data.json"):
+            return self.catalog_ttl
+        # Past vintages are immutable and never expire
+        vintage = re.search(r"/data/(\d{4})/", path)
+        if vintage and int(vintage.group(1)) < datetime.datetime.now().year - 1:
+            return None
+        return self.current_ttl
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Get cached response ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get(self, url: str, params: Union[dict, list, None] = None) -> Optional[requests.Response]:
+        key, _ = self.make_key(url, params)
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(path, "r", encoding = "utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        # Expired entries count as misses (they are overwritten by the next put)
+        if entry["expires"] is not None and entry["expires"] < time.time():
+            with self._lock:
+                self.misses += 1
+            return None
+        # Touch the entry so its modification time tracks its last use (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        # Rebuild a response object so callers can use it like a live response
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = entry["url"]
+        response.encoding = entry["encoding"]
+        response._content = entry["content"].encode(entry["encoding"])
+        return response
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Store response ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def put(self, url: str, params: Union[dict, list, None], response: requests.Response) -> None:
+        key, canonical = self.make_key(url, params)
+        ttl = self.ttl_for(url)
+        entry = {
+            "url": canonical,
+            "created": time.time(),
+            "expires": None if ttl is None else time.time() + ttl,
+            "status": response.status_code,
+            "encoding": response.encoding or "utf-8",
+            "content": response.text
+        }
+        os.makedirs(self.cache_dir, exist_ok = True)
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding = "utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._size is not None:
+                self._size += os.path.getsize(path)
+        self.evict()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Evict least recently used entries ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def evict(self) -> None:
+        with self._lock:
+            if self._size is not None and self._size <= self.max_bytes:
+                return
+            if not os.path.isdir(self.cache_dir):
+                self._size = 0
+                return
+            # Only the response entries (<sha256>.json) are evicted, not the index files kept next to them
+            entries = [e for e in os.scandir(self.cache_dir) if re.fullmatch(r"[0-9a-f]{64}\.json", e.name)]
+            stats = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in entries]
+            self._size = sum(size for _, size, _ in stats)
+            # Remove the least recently used entries until the cache fits its cap
+            for _, size, path in sorted(stats):
+                if self._size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                self._size -= size
+                self.evictions += 1
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Cache statistics ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size_bytes": self._size, "max_bytes": self.max_bytes}
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the SpatialFrameCache class for in-memory spatial data frames ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class SpatialFrameCache:
+    """
+    A size-bounded, in-memory LRU cache of spatial data frames read from geodatabase feature classes.
+    Entries are keyed by (geodatabase path, feature class, geodatabase modification time), so an edited geodatabase is read again, and the least recently used entries are evicted once the cached frames exceed the memory budget.
+    """
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Class initialization ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def __init__(self, max_bytes: int = 2 * 1024 ** 3):
+        self.max_bytes = max_bytes
+        # Cached frames (most recently used last) and their estimated sizes
+        self._frames = OrderedDict()
+        self._sizes = {}
+        self._size = 0
+        # Hit, miss and eviction counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Get cached frame ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get(self, key: tuple) -> Optional[pd.DataFrame]:
+        with self._lock:
+            sdf = self._frames.get(key)
+            if sdf is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+        # Return a shallow copy so callers adding or dropping columns do not change the cached frame
+        return sdf.copy(deep = False)
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Store frame ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def put(self, key: tuple, sdf: pd.DataFrame) -> None:
+        # Estimate the frame size (the geometries are counted by the serialized JSON length of a sample)
+        size = int(sdf.memory_usage(index = True, deep = False).sum())
+        if "SHAPE" in sdf.columns:
+            geometries = sdf["SHAPE"].dropna()
+            if len(geometries) > 0:
+                sample = geometries.sample(min(len(geometries), 100), random_state = 0)
+                size += int(sample.map(lambda g: len(g.JSON)).mean() * len(geometries))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            # Drop the entries of older versions of the same feature class
+            for old_key in [k for k in self._frames if k[:2] == key[:2]]:
+                self._size -= self._sizes.pop(old_key)
+                del self._frames[old_key]
+            self._frames[key] = sdf.copy(deep = False)
+            self._sizes[key] = size
+            self._size += size
+            # Evict the least recently used frames until the cache fits its budget
+            while self._size > self.max_bytes:
+                old_key, _ = self._frames.popitem(last = False)
+                self._size -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Clear cache ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Cache statistics ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self._frames), "size_bytes": self._size, "max_bytes": self.max_bytes}
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the LabelNormalizer class for Census variable labels ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class LabelNormalizer:
+    """
+    Normalizes Census API variable labels (e.g. "Estimate!!Total:!!Male:") into the codebook labels ("Estimate: Total: Male") and aliases ("Total: Male").
+    The cleanup rules are compiled once and applied to a whole column of labels with the pandas string methods, and the normalized labels are memoized, so the labels repeated across years and variables are only normalized once.
+    """
+    # The cleanup rules (pattern, replacement), applied in order after the "!!" separators and the non-ASCII characters are converted.
+    # The result is a fixed point of the rules, so the second pass of the legacy implementation is not needed (see scripts/ocacs_golden_labels.py)
+    RULES = [
+        (r"[^A-Za-z0-9\s:\-]", ""),
+        (r"\s*-\s*", "-"),
+        (r"-{2,}", "-"),
+        (r"(?<![A-Za-z0-9])-|-(?![A-Za-z0-9])", ""),
+        (r":{2,}", ":"),
+        (r"\s*:\s*", ": "),
+        (r"\s+", " ")
+    ]
+    STRIP_CHARS = " \t\n\r:-"
+    ALIAS_PATTERN = r"^Estimate\s*: *"
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Class initialization ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def __init__(self, max_entries: int = 500000):
+        self.max_entries = max_entries
+        # Precompiled cleanup rules
+        self._rules = [(re.compile(pattern), repl) for pattern, repl in self.RULES]
+        self._alias = re.compile(self.ALIAS_PATTERN)
+        # Memoized labels (raw label to normalized label) and hit/miss counters
+        self._memo = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Normalize labels ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def normalize(self, labels: pd.Series) -> pd.Series:
+        # Normalize only the distinct labels that are not memoized yet
+        labels = labels.astype(str)
+        with self._lock:
+            mapping = {}
+            new = []
+            for label in labels.unique():
+                if label in self._memo:
+                    mapping[label] = self._memo[label]
+                else:
+                    new.append(label)
+            self.hits += len(mapping)
+            self.misses += len(new)
+        if new:
+            s = pd.Series(new, dtype = object).str.replace("!!", ": ", regex = False)
+            s = s.str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+            for pattern, repl in self._rules:
+                s = s.str.replace(pattern, repl, regex = True)
+            s = s.str.strip(self.STRIP_CHARS)
+            results = dict(zip(new, s.tolist()))
+            mapping.update(results)
+            with self._lock:
+                if len(self._memo) + len(results) > self.max_entries:
+                    self._memo.clear()
+                self._memo.update(results)
+        return labels.map(mapping)
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Normalize one label ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def normalize_one(self, label: str) -> str:
+        return self.normalize(pd.Series([label])).iloc[0]
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Label aliases ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def aliases(self, labels: pd.Series) -> pd.Series:
+        # The alias of a normalized label is the label without its leading "Estimate:"
+        return labels.str.replace(self._alias, "", regex = True)
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Clear memo ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Normalizer statistics ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._memo), "max_entries": self.max_entries}
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the TWRLayerClassifier class for TIGERweb layer names ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class TWRLayerClassifier:
+    """
+    Classifies TIGERweb layer names (e.g. "118th Congressional Districts") into their OCTL group, code and alias ("Legislative", "CD118", "Congressional Districts-118th US Congress").
+    The layer name terms are compiled into a single alternation, so all the terms contained in a name are found in one scan, and the classifications are memoized (the same layer names repeat across the TIGERweb services).
+    """
+    # The TIGERweb layer name terms mapped to the 2-letter OCTL codes and the OCTL feature dataset (group). The 2-letter codes should be unique.
+    # When a name contains several terms, the last one in this order wins.
+    TERMS = {
+        "Public Use Microdata Areas": {"code": "PU", "group": "Census"},
+        "ZIP Code Tabulation Areas": {"code": "ZC", "group": "Census"},
+        "Zip Code Tabulation Areas": {"code": "ZC", "group": "Census"},
+        "Tracts": {"code": "TR", "group": "Census"},
+        "Block Groups": {"code": "BG", "group": "Census"},
+        "Blocks": {"code": "BL", "group": "Census"},
+        "Unified School Districts": {"code": "SU", "group": "Schools"},
+        "Secondary School Districts": {"code": "SS", "group": "Schools"},
+        "Elementary School Districts": {"code": "SE", "group": "Schools"},
+        "County Subdivisions": {"code": "CS", "group": "Places"},
+        "Consolidated Cities": {"code": "CC", "group": "Places"},
+        "Incorporated Places": {"code": "CP", "group": "Places"},
+        "Designated Places": {"code": "DP", "group": "Places"},
+        "Congressional Districts": {"code": "CD", "group": "Legislative"},
+        "State Legislative Districts - Upper": {"code": "LU", "group": "Legislative"},
+        "State Legislative Districts - Lower": {"code": "LL", "group": "Legislative"},
+        "Urban Areas": {"code": "UA", "group": "Urban"},
+        "Urban Clusters": {"code": "UC", "group": "Urban"},
+        "Urban Growth Areas": {"code": "UG", "group": "Urban"},
+        "Urbanized Areas": {"code": "UR", "group": "Urban"},
+        "Combined Statistical Areas": {"code": "CA", "group": "Statistical"},
+        "Metropolitan Divisions": {"code": "MD", "group": "Statistical"},
+        "Metropolitan Statistical Areas": {"code": "MS", "group": "Statistical"},
+        "Micropolitan Statistical Areas": {"code": "MC", "group": "Statistical"},
+        "Counties": {"code": "CO", "group": "Places"},
+        "Economic Places": {"code": "EP", "group": "Places"},
+        "Traffic Analysis Zones": {"code": "TZ", "group": "Transportation"},
+        "Traffic Analysis Districts": {"code": "TD", "group": "Transportation"},
+        "Primary Roads": {"code": "PR", "group": "Transportation"},
+        "Secondary Roads": {"code": "SR", "group": "Transportation"},
+        "Local Roads": {"code": "LR", "group": "Transportation"},
+        "Railroads": {"code": "RL", "group": "Transportation"},
+        "Linear Hydrography": {"code": "LH", "group": "Hydro"},
+        "Areal Hydrography": {"code": "AH", "group": "Hydro"},
+        "National Park Service Areas": {"code": "NP", "group": "LandUse"},
+        "Correctional Facilities": {"code": "CF", "group": "LandUse"},
+        "Colleges and Universities": {"code": "UN", "group": "LandUse"},
+        "Military Installations": {"code": "MI", "group": "LandUse"}
+    }
+    # The compiled scans of the term tables, keyed by the terms (see _compile)
+    _COMPILED = {}
+    # The TIGERweb layer name terms excluded from the inventory (see OCGD.crawl_tigerweb)
+    EXCLUSIONS = ["Labels", "Tribal", "Estates", "Subbarrios", "Alaska", "American Indian", "Off-Reservation", "Hawaiian", "Census Divisions", "Census Regions", "New England", "States", "Oklahoma", "Voting Districts", "School District Administrative Areas", "Consolidated Cities", "Micropolitan", "Urban Growth Areas", "Glaciers"]
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Class initialization ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def __init__(self, terms: Optional[dict] = None):
+        # The term table ({term: {"code", "group"}}) and the rank of each term (later terms win)
+        self.terms = dict(self.TERMS if terms is None else terms)
+        self._rank = {term: i for i, term in enumerate(self.terms)}
+        # The compiled scan of the term table (shared by the classifiers of the same terms)
+        key = tuple(self.terms)
+        if key not in self._COMPILED:
+            self._COMPILED[key] = self._compile(key)
+        self._terms, self._contained, self._nested = self._COMPILED[key]
+        self._exclusions = re.compile("|".join(re.escape(term) for term in self.EXCLUSIONS))
+        # Leading 3-digit congress number ("118th ...") or 4-digit year ("2020 Census ...")
+        self._prefix = re.compile(r"^(?:(\d{3})th|(\d{4}))")
+        # Memoized classifications (layer name to (group, code, alias))
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Compile terms ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    @staticmethod
+    def _compile(terms: tuple) -> tuple:
+        # The terms contained in each term (e.g. "Urban Areas" in "Urban Areas - Corrected")
+        contained = {term: [other for other in terms if other in term] for term in terms}
+        nested = any(len(others) > 1 for others in contained.values())
+        # Longest terms first, so the term matched at a position contains every other term starting there. A plain scan skips the
+        # terms starting inside a match, which are found through the contained terms unless two terms overlap (the end of one is
+        # the start of another); only then the slower lookahead scan (a match at every position) is needed
+        overlapping = any(term[-k:] == other[:k] for term in terms for other in terms if term != other for k in range(1, min(len(term), len(other))))
+        alternation = "|".join(re.escape(term) for term in sorted(terms, key = len, reverse = True))
+        pattern = re.compile(f"(?=({alternation}))" if overlapping else f"({alternation})") if terms else None
+        return pattern, contained, nested
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Matching terms ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def matches(self, name: str) -> list:
+        # All the terms contained in the name, in table order
+        found = self._terms.findall(name) if self._terms is not None else []
+        if len(found) <= 1 and not self._nested:
+            return found
+        found = {other for term in found for other in self._contained[term]}
+        return sorted(found, key = self._rank.__getitem__)
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Excluded layer ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def excluded(self, name: str) -> bool:
+        return self._exclusions.search(name) is not None
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Classify layer ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def classify(self, name: str) -> tuple:
+        # Return the (group, code, alias) of a layer name (None for each part that no term gives)
+        with self._lock:
+            if name in self._memo:
+                return self._memo[name]
+        group = code = alias = None
+        matched = self.matches(name)
+        if matched:
+            alias = matched[-1]
+            code = self.terms[alias]["code"]
+            group = self.terms[alias]["group"]
+
+        if "Counties" in matched:
+            alias = "Orange County"
+        prefix = self._prefix.match(name)
+        if prefix and prefix.group(1) and "Congressional Districts" in matched:
+            congress = int(prefix.group(1))
+            alias = f"Congressional Districts-{congress}th US Congress"
+            code = f"{code}{congress}"
+        if "State Legislative Districts - Upper" in matched:
+            alias = "State Senate Legislative Districts"
+        if "State Legislative Districts - Lower" in matched:
+            alias = "State Assembly Legislative Districts"
+        if "Corrected" in name:
+            alias = f"{alias} Corrected"
+            code = f"{code}_Corrected"
+        if prefix and prefix.group(2):
+            year = int(prefix.group(2))
+            alias = f"{alias}-{year}"
+            code = f"{code}{year}"
+
+        result = (group, code, alias)
+        with self._lock:
+            self._memo[name] = result
+        return result
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Clear memo ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Define the OCGD Class ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -280,12 +768,28 @@ class OCGD:
             # Logger does not support 'meta' attribute; ignore safely
             pass
 
-        # Get the available ACS5 years
-        self.acs5_years = self.get_census_years(dataset = "acs5")
-        # self.acs5_years = self.get_available_acs5_years()
+        # Set the Census API base URL (can be redirected to a local stand-in server)
+        self.census_api_url = os.getenv("CENSUS_API_URL", "https://api.census.gov")
+        # Set the TIGERweb REST directory URL (can be redirected the same way)
+        self.tigerweb_url = os.getenv("TIGERWEB_URL", "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb")
 
-        # Get the available CR years
-        self.cr_years = self.get_census_years(dataset = "cr")
+        # Create the persistent Census API response cache
+        self.http_cache = CensusCache(self.prj_dirs["data_cache"])
+
+        # The shared pooled HTTP session is created on first use (see the session property)
+        self._session = None
+        self._session_lock = threading.RLock()
+        self.http_stats = {}
+
+        # Recently read geodatabase modification times (see gdb_modified_time)
+        self._gdb_mtimes = {}
+
+        # The compiled classifier of the TIGERweb layer names (see crawl_tigerweb and create_octl_master_cb)
+        self.layer_classifier = TWRLayerClassifier()
+
+        # The Census catalog index (acs5_years, cr_years, ...) is loaded on first use (see load_census_catalog)
+        self._census_catalog = None
+        self._catalog_lock = threading.RLock()
 
         # Set the Spatial Reference to Web Mercator
         self.sr = arcpy.SpatialReference(3857)  # Web Mercator
@@ -320,6 +824,7 @@ class OCGD:
             "codebook": os.path.join(self.base_path, "codebook"),
             "data": os.path.join(self.base_path, "data"),
             "data_archived": os.path.join(self.base_path, "data", "archived"),
+            "data_cache": os.path.join(self.base_path, "data", "cache"),
             "data_processed": os.path.join(self.base_path, "data", "processed"),
             "data_raw": os.path.join(self.base_path, "data", "raw"),
             "documentation": os.path.join(self.base_path, "documentation"),
@@ -367,42 +872,470 @@ class OCGD:
         return directories
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Load Census catalog ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def load_census_catalog(self, refresh: bool = False) -> dict:
+        """
+        Load the local index of the Census API discovery catalog (data.json), downloading it only when needed.
+        Args:
+            refresh (bool, optional): Whether to revalidate the index with the Census API even if it was checked recently. Defaults to False.
+        Returns:
+            dict: The catalog index, mapping each dataset path (e.g. "acs/acs5", "cr") to its vintages (as strings, sorted) and their API URLs.
+        Raises:
+            requests.RequestException: If the catalog cannot be downloaded and there is no local index to fall back on.
+            ValueError: If the downloaded catalog is incomplete and there is no local index to fall back on.
+        Example:
+            >>> catalog = load_census_catalog()
+            >>> catalog["acs/acs5"]["2022"]
+            'http://api.census.gov/data/2022/acs/acs5'
+        Notes:
+            The index is kept in memory and in data/cache/census_catalog.json together with the ETag and Last-Modified headers of the catalog. An index checked within the catalog TTL of the response cache (1 day) is used as is; an older one is revalidated with a conditional request (If-None-Match / If-Modified-Since) and the catalog is only downloaded again when it has changed. If the Census API cannot be reached, the stale local index is used.
+        """
+        with self._catalog_lock:
+            # Return the in-memory index
+            if self._census_catalog is not None and not refresh:
+                return self._census_catalog
+
+            # Read the local index (if any) for the current Census API base URL
+            url = f"{self.census_api_url}/data.json"
+            index_path = os.path.join(self.prj_dirs["data_cache"], "census_catalog.json")
+            stored = None
+            if os.path.exists(index_path):
+                try:
+                    with open(index_path, "r", encoding = "utf-8") as f:
+                        stored = json.load(f)
+                except (OSError, ValueError):
+                    stored = None
+            if stored is not None and stored.get("url") != url:
+                stored = None
+
+            # Use the local index as is if it was checked recently
+            if stored is not None and not refresh and time.time() - stored.get("checked", 0) < self.http_cache.catalog_ttl:
+                self._census_catalog = stored["index"]
+                return self._census_catalog
+
+            # Revalidate (or download) the catalog with a conditional request
+            headers = {}
+            if stored is not None:
+                if stored.get("etag"):
+                    headers["If-None-Match"] = stored["etag"]
+                if stored.get("last_modified"):
+                    headers["If-Modified-Since"] = stored["last_modified"]
+            try:
+                response = self.http_get(url, timeout = 60, headers = headers, stream = True)
+                if response.status_code == 304 and stored is not None:
+                    print("- Census catalog index is up to date")
+                else:
+                    response.raise_for_status()
+                    print("- Downloading the Census catalog (data.json) and rebuilding the local index")
+                    stored = {
+                        "url": url,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "index": self.build_census_catalog_index(response)
+                    }
+            except (requests.RequestException, ValueError) as e:
+                if stored is None:
+                    raise
+                print(f"Warning: Could not revalidate the Census catalog ({e}). Using the local index.")
+                self._census_catalog = stored["index"]
+                return self._census_catalog
+
+            # Save the index (write to a temporary file first so a partial write never replaces a good index)
+            stored["checked"] = time.time()
+            os.makedirs(self.prj_dirs["data_cache"], exist_ok = True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding = "utf-8") as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, index_path)
+
+            self._census_catalog = stored["index"]
+            return self._census_catalog
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Iterate Census catalog ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def iter_census_catalog(self, response: requests.Response, chunk_size: int = 64 * 1024):
+        """
+        Stream the datasets of a Census API discovery catalog (data.json) response one at a time.
+        Args:
+            response (requests.Response): The data.json response (requested with stream = True).
+            chunk_size (int, optional): The number of bytes read from the response at a time. Defaults to 64 KiB.
+        Yields:
+            tuple: (vintage, dataset path, API URL) for each dataset of the catalog; the vintage is None for timeseries datasets and the API URL is None when the dataset has no distribution accessURL.
+        Raises:
+            ValueError: If the document is not a catalog or ends before the dataset array is closed.
+        Example:
+            >>> for vintage, path, url in iter_census_catalog(self.http_get(f"{self.census_api_url}/data.json", stream = True)):
+            ...     print(vintage, path, url)
+        Notes:
+            The document is decoded incrementally: each element of the "dataset" array is decoded with json.JSONDecoder.raw_decode as soon as it is complete, reduced to the three fields and discarded, so memory stays at about one chunk plus one dataset entry instead of the whole multi-megabyte catalog.
+        """
+        decoder = json.JSONDecoder()
+        text = codecs.getincrementaldecoder("utf-8")()
+        chunks = response.iter_content(chunk_size = chunk_size)
+        buffer = ""
+        pos = 0
+        in_array = False
+        finished = False
+
+        def _read_more() -> bool:
+            # Append the next chunk to the unread part of the buffer; False once the response is exhausted
+            nonlocal buffer, pos
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            buffer = buffer[pos:] + text.decode(chunk)
+            pos = 0
+            return True
+
+        # Skip the catalog header up to the opening bracket of the "dataset" array
+        start = re.compile(r'"dataset"\s*:\s*\[')
+        while not in_array:
+            match = start.search(buffer, pos)
+            if match:
+                pos = match.end()
+                in_array = True
+            else:
+                # Keep only a short tail in case the key is split across chunks
+                pos = max(pos, len(buffer) - 32)
+                if not _read_more():
+                    raise ValueError("The document is not a Census API catalog (no dataset array)")
+
+        # Decode the dataset entries one at a time
+        while not finished:
+            # Skip whitespace and separators
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                if not _read_more():
+                    raise ValueError("The Census API catalog ended before the dataset array was closed")
+                continue
+            if buffer[pos] == "]":
+                finished = True
+                continue
+            try:
+                ds, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The entry is not complete yet
+                if not _read_more():
+                    raise ValueError("The Census API catalog ended in the middle of a dataset entry")
+                continue
+            pos = end
+            access_urls = [d.get("accessURL") for d in ds.get("distribution", []) if isinstance(d, dict) and d.get("accessURL")]
+            yield ds.get("c_vintage"), "/".join(ds.get("c_dataset", [])), access_urls[0] if access_urls else None
+        response.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Build Census catalog index ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def build_census_catalog_index(self, response: requests.Response) -> dict:
+        """
+        Build the catalog index from a Census API discovery catalog (data.json) response.
+        Args:
+            response (requests.Response): The data.json response (requested with stream = True).
+        Returns:
+            dict: The catalog index, mapping each dataset path to its vintages (as strings, sorted) and their API URLs.
+        Raises:
+            ValueError: If the document is not a complete catalog.
+        Example:
+            >>> index = build_census_catalog_index(self.http_get(f"{self.census_api_url}/data.json", stream = True))
+        Notes:
+            The catalog is parsed incrementally (see iter_census_catalog). Only the vintage datasets are indexed (timeseries datasets have no c_vintage).
+        """
+        index = {}
+        for vintage, path, api_url in self.iter_census_catalog(response):
+            if vintage is None or not path:
+                continue
+            index.setdefault(path, {})[str(vintage)] = api_url or f"{self.census_api_url}/data/{vintage}/{path}"
+
+        # Sort the vintages of each dataset
+        return {path: dict(sorted(vintages.items())) for path, vintages in sorted(index.items())}
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: Get available census years ----
-    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~        
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     def get_census_years(self, dataset: str = "acs5") -> list[int]:
         """
-        Get the available years for ACS5 data from the Census API.
+        Get the available years (vintages since 2010) of a Census API dataset.
+        Args:
+            dataset (str, optional): The dataset path (e.g. "acs/acs5") or its last component (e.g. "acs5", "cr"). Defaults to "acs5".
+        Returns:
+            years (list): A sorted list of the available years of the dataset.
+        Raises:
+            requests.RequestException: If the catalog cannot be downloaded and there is no local index.
+        Example:
+            >>> years = get_census_years(dataset = "acs5")
+        Notes:
+            The years are read from the local catalog index (see load_census_catalog).
+        """
+        catalog = self.load_census_catalog()
+        years = set()
+        for path, vintages in catalog.items():
+            if path == dataset or path.endswith(f"/{dataset}"):
+                years.update(int(v) for v in vintages if int(v) >= 2010)
+        return sorted(years)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS5 and CR years ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    @property
+    def acs5_years(self) -> list[int]:
+        """The available ACS 5-year vintages (read from the Census catalog index on first use)."""
+        return self.get_census_years(dataset = "acs5")
+
+    @property
+    def cr_years(self) -> list[int]:
+        """The available Community Resilience Estimates vintages (read from the Census catalog index on first use)."""
+        return self.get_census_years(dataset = "cr")
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Configure HTTP session ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def configure_http_session(self, pool_size: int = 16, retries: int = 5, backoff_factor: float = 0.5) -> requests.Session:
+        """
+        Create (or recreate) the pooled HTTP session shared by all OCGD HTTP calls.
+        Args:
+            pool_size (int, optional): The maximum number of keep-alive connections kept per host. Defaults to 16.
+            retries (int, optional): The maximum number of retries on connection errors and 429/5xx responses. Defaults to 5.
+            backoff_factor (float, optional): The exponential backoff factor between retries (0.5 gives 0.5s, 1s, 2s, ...). Defaults to 0.5.
+        Returns:
+            requests.Session: The configured session.
+        Raises:
+            None
+        Example:
+            >>> session = configure_http_session(pool_size = 32)
+        Notes:
+            The pool size should be at least as large as the number of concurrent workers used by the fetch methods, otherwise connections are discarded instead of reused. A Retry-After header sent with a 429 response is honored.
+        """
+        # Retry connection errors and throttled/server error responses with exponential backoff
+        retry = Retry(
+            total = retries,
+            backoff_factor = backoff_factor,
+            status_forcelist = (429, 500, 502, 503, 504),
+            allowed_methods = frozenset(["GET", "HEAD"]),
+            respect_retry_after_header = True,
+            raise_on_status = False
+        )
+        adapter = HTTPAdapter(pool_connections = pool_size, pool_maxsize = pool_size, max_retries = retry)
+
+        # Create the session with keep-alive and compressed transfers
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        session.hooks["response"].append(self._record_http_latency)
+
+        # Replace (and close) any existing session
+        with self._session_lock:
+            old_session, self._session = self._session, session
+        if old_session is not None:
+            old_session.close()
+        return session
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Shared HTTP session ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    @property
+    def session(self) -> requests.Session:
+        """The pooled HTTP session shared by the OCGD class family (created with the default settings on first use)."""
+        with self._session_lock:
+            if self._session is None:
+                self.configure_http_session()
+            return self._session
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: HTTP request ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def http_get(self, url: str, params: Union[dict, list, None] = None, timeout: float = 60, **kwargs) -> requests.Response:
+        """
+        Send a GET request through the shared pooled HTTP session.
+        Args:
+            url (str): The request URL.
+            params (dict | list, optional): The query parameters. Defaults to None.
+            timeout (float, optional): The request timeout in seconds. Defaults to 60.
+            **kwargs: Additional keyword arguments passed to requests.Session.get (e.g. headers, stream).
+        Returns:
+            requests.Response: The response (after any retries).
+        Raises:
+            requests.RequestException: If the request fails after all retries.
+        Example:
+            >>> resp = http_get("https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb", params = {"f": "json"})
+        Notes:
+            All HTTP calls of the OCGD classes go through this method so they share connections, retries and latency statistics.
+        """
+        return self.session.get(url, params = params, timeout = timeout, **kwargs)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Concurrent JSON requests ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def http_get_json_many(self, requests_list: list, max_workers: int = 8, per_host: int = 4, timeout: float = 60, validators: Optional[dict] = None) -> list:
+        """
+        Send several GET requests concurrently and return their JSON documents in the request order.
+        Args:
+            requests_list (list): The (url, params) tuples to request.
+            max_workers (int, optional): The maximum number of requests in flight. Defaults to 8.
+            per_host (int, optional): The maximum number of requests in flight to the same host. Defaults to 4.
+            timeout (float, optional): The timeout of each request in seconds. Defaults to 60.
+            validators (dict, optional): The {"etag", "last_modified"} validators of earlier responses, keyed by URL. When given, the requests are conditional (If-None-Match / If-Modified-Since) and the dictionary is updated in place with the validators of the new responses. Defaults to None.
+        Returns:
+            list: The JSON document of each request, in the order of requests_list (None for a request answered with 304 Not Modified).
+        Raises:
+            requests.HTTPError: If a request fails (after the retries of the shared session).
+        Example:
+            >>> docs = http_get_json_many([(url, {"f": "pjson"}) for url in layer_urls], max_workers = 8)
+        Notes:
+            The per-host limit keeps the crawl polite to a single server regardless of max_workers; the requests share the pooled session (see configure_http_session), so max_workers should not exceed its pool size.
+        """
+        # One semaphore per host bounds the requests in flight to that host
+        host_limits = {urlsplit(url).netloc: threading.BoundedSemaphore(max(1, per_host)) for url, _ in requests_list}
+
+        def fetch(request: tuple):
+            url, params = request
+            headers = {}
+            stored = validators.get(url) if validators is not None else None
+            if stored:
+                if stored.get("etag"):
+                    headers["If-None-Match"] = stored["etag"]
+                if stored.get("last_modified"):
+                    headers["If-Modified-Since"] = stored["last_modified"]
+            with host_limits[urlsplit(url).netloc]:
+                response = self.http_get(url, params = params, timeout = timeout, headers = headers)
+            if response.status_code == 304 and stored:
+                return None
+            response.raise_for_status()
+            if validators is not None and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+                validators[url] = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+            return response.json()
+
+        if max_workers <= 1 or len(requests_list) <= 1:
+            return [fetch(request) for request in requests_list]
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(requests_list))) as executor:
+            return list(executor.map(fetch, requests_list))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Record HTTP latency ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def _record_http_latency(self, response: requests.Response, *args, **kwargs) -> None:
+        # Session response hook: accumulate the request latency per host
+        host = urlsplit(response.url).netloc
+        seconds = response.elapsed.total_seconds()
+        with self._session_lock:
+            host_stats = self.http_stats.setdefault(host, {"requests": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            host_stats["requests"] += 1
+            host_stats["total_seconds"] += seconds
+            host_stats["max_seconds"] = max(host_stats["max_seconds"], seconds)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: HTTP latency statistics ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def http_latency_stats(self, silent: bool = True) -> dict:
+        """
+        Get the per-host request latency statistics of the shared HTTP session.
         Args:
+            silent (bool, optional): Whether to suppress printing the statistics. Defaults to True.
+        Returns:
+            stats (dict): A dictionary keyed by host with the request count and the total, mean and max latency in seconds.
+        Raises:
             None
+        Example:
+            >>> stats = http_latency_stats(silent = False)
+        Notes:
+            Latency is measured from sending the request to receiving the response headers, so connection reuse shows up as a lower mean latency.
+        """
+        with self._session_lock:
+            stats = {host: dict(values) for host, values in self.http_stats.items()}
+        for values in stats.values():
+            values["mean_seconds"] = values["total_seconds"] / values["requests"] if values["requests"] else 0.0
+
+        # If not silent, print the statistics
+        if not silent:
+            print("HTTP Latency Statistics:")
+            for host, values in stats.items():
+                print(f"- {host}: {values['requests']} request(s), mean {values['mean_seconds']:.3f}s, max {values['max_seconds']:.3f}s")
+
+        # Return the statistics
+        return stats
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Cached Census API request ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def cached_get(self, url: str, params: Union[dict, list, None] = None, timeout: float = 60, refresh: bool = False) -> requests.Response:
+        """
+        Send a GET request to the Census API through the persistent response cache.
+        Args:
+            url (str): The request URL.
+            params (dict | list, optional): The query parameters (a list of tuples preserves repeated keys). Defaults to None.
+            timeout (float, optional): The request timeout in seconds. Defaults to 60.
+            refresh (bool, optional): Whether to bypass the cached entry and re-download the response. Defaults to False.
+        Returns:
+            requests.Response: The cached or live response.
+        Raises:
+            requests.RequestException: If the live request fails.
+        Example:
+            >>> resp = cached_get("https://api.census.gov/data/2022/acs/acs5/variables.json")
+        Notes:
+            Only successful (200) responses are cached. The API key is never part of the cache key, so rotating keys does not invalidate the cache.
+        """
+        # Return the cached response if there is a valid entry
+        if not refresh:
+            cached = self.http_cache.get(url, params)
+            if cached is not None:
+                return cached
+
+        # Otherwise fetch the response and cache it when successful
+        response = self.http_get(url, params = params, timeout = timeout)
+        if response.status_code == 200:
+            self.http_cache.put(url, params, response)
+        return response
+
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Geodatabase modification time ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def gdb_modified_time(self, gdb_path: str, max_age: float = 0.0) -> float:
+        """
+        Get the last modification time of a file geodatabase.
+        Args:
+            gdb_path (str): The path of the file geodatabase (.gdb folder).
+            max_age (float, optional): Reuse a value read within this many seconds instead of scanning the folder again. Defaults to 0.0 (always scan).
         Returns:
-            years (list): A list of available years for ACS5 data.
+            float: The latest modification time (seconds since the epoch) of the geodatabase files, or 0.0 if it does not exist.
         Raises:
             None
         Example:
-            >>> years = get_available_acs5_years()
+            >>> mtime = gdb_modified_time(os.path.join(self.prj_dirs["gis"], "tl2022.gdb"))
         Notes:
-            This function gets the available years for ACS5 data from the Census API.
+            Edits to a feature class rewrite its files inside the folder without always touching the folder itself, so the files are checked (a single directory scan). The lock files (*.lock) are ignored because ArcGIS creates them whenever the geodatabase is read.
         """
-        # The discovery API lists all available endpoints
-        url = "https://api.census.gov/data.json"
-        response = requests.get(url, timeout = 20)
-        datasets = response.json()['dataset']
-        
-        # Filter for acs5 endpoints
-        years = []
-        for ds in datasets:
-            # We look for the specific acs5 path in the distribution links
-            if dataset in ds.get("c_dataset", ""):
-                # Extract the year from the identifier or title
-                # Example identifier: "https://api.census.gov/data/2022/acs/acs5"
-                year = ds.get("c_vintage")
-                if year and year >= 2010:
-                    years.append(year)
-        
-        # Return sorted unique years
-        return sorted(list(set(years)))
+        # Reuse a recent value
+        now = time.time()
+        memo = self._gdb_mtimes.get(gdb_path)
+        if max_age > 0 and memo is not None and now - memo[0] <= max_age:
+            return memo[1]
 
+        mtime = 0.0
+        try:
+            for entry in os.scandir(gdb_path):
+                if not entry.name.endswith(".lock"):
+                    mtime = max(mtime, entry.stat().st_mtime)
+        except OSError:
+            return 0.0
+        self._gdb_mtimes[gdb_path] = (now, mtime)
+        return mtime
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -442,107 +1375,188 @@ class OCGD:
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: Crawl TIGERweb REST API ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def crawl_tigerweb(self, export: bool = False) -> dict:
+    def crawl_tigerweb(self, export: bool = False, max_workers: int = 8, per_host: int = 4) -> dict:
         """
         Function to crawl the TIGERweb REST API and create a full inventory of services and layers.
         Args:
             export (bool, optional): Whether to export the inventory to a JSON file. Defaults to False.
+            max_workers (int, optional): The maximum number of requests in flight. Defaults to 8.
+            per_host (int, optional): The maximum number of requests in flight to the same host. Defaults to 4.
         Returns
             inventory (dict): A dictionary containing the full inventory of TIGERweb services and layers.
         Raises:
-            None
+            requests.HTTPError: If the directory, a service or a layer request fails.
         Example:
             >>> inventory = crawl_tigerweb(export=True)
         Notes:
-            The crawl_tigerweb function retrieves the full inventory of TIGERweb services and layers from the Census REST API.
+            The crawl_tigerweb function retrieves the full inventory of TIGERweb services and layers from the Census REST API. The service documents are fetched concurrently, then the layer documents, and the inventory is assembled in the directory listing order, so it is the same as the one of a serial crawl (max_workers = 1).
         """
 
-        # Set the base REST API URL for TIGERweb services
-        base_rest = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb"
-        base_params = {"f": "json"}
+        # Crawl all the services and layers (nothing is reused without a stored inventory)
+        inventory = self._crawl_tigerweb(max_workers = max_workers, per_host = per_host)
+        cs = inventory["metadata"]["total_services"]
+        cl = inventory["metadata"]["total_layers"]
 
-        # The 2-letter codes should be unique. No duplicates should be present.
-        cb_codes = {
-            "Public Use Microdata Areas": "PU",
-            "ZIP Code Tabulation Areas": "ZC",
-            "Zip Code Tabulation Areas": "ZC",
-            "Tracts": "TR",
-            "Block Groups": "BG",
-            "Blocks": "BL",
-            "Unified School Districts": "SU",
-            "Secondary School Districts": "SS",
-            "Elementary School Districts": "SE",
-            "County Subdivisions": "CS",
-            "Consolidated Cities": "CC",
-            "Incorporated Places": "CP",
-            "Designated Places": "DP",
-            "Congressional Districts": "CD",
-            "State Legislative Districts - Upper": "LU",
-            "State Legislative Districts - Lower": "LL",
-            "Urban Areas": "UA",
-            "Urban Clusters": "UC",
-            "Urban Growth Areas": "UG",
-            "Urbanized Areas": "UR",
-            "Combined Statistical Areas": "CA",
-            "Metropolitan Divisions": "MD",
-            "Metropolitan Statistical Areas": "MS",
-            "Micropolitan Statistical Areas": "MC",
-            "Counties": "CO",
-            "Economic Places": "EP",
-            "Traffic Analysis Zones": "TZ",
-            "Traffic Analysis Districts": "TD",
-            "Primary Roads": "PR",
-            "Secondary Roads": "SR",
-            "Local Roads": "LR",
-            "Railroads": "RL",
-            "Linear Hydrography": "LH",
-            "Areal Hydrography": "AH",
-            "National Park Service Areas": "NP",
-            "Correctional Facilities": "CF",
-            "Colleges and Universities": "UN",
-            "Military Installations": "MI",
-        }
+        # Print the totals of the inventory
+        print(f"\nTotal Services: {cs}, Total Layers: {cl}")
+        self.http_latency_stats(silent = False)
 
-        group_codes = {
-            "Public Use Microdata Areas": "Census",
-            "ZIP Code Tabulation Areas": "Census",
-            "Zip Code Tabulation Areas": "Census",
-            "Tracts": "Census",
-            "Block Groups": "Census",
-            "Blocks": "Census",
-            "Unified School Districts": "Schools",
-            "Secondary School Districts": "Schools",
-            "Elementary School Districts": "Schools",
-            "County Subdivisions": "Places",
-            "Consolidated Cities": "Places",
-            "Incorporated Places": "Places",
-            "Designated Places": "Places",
-            "Congressional Districts": "Legislative",
-            "State Legislative Districts - Upper": "Legislative",
-            "State Legislative Districts - Lower": "Legislative",
-            "Urban Areas": "Urban",
-            "Urban Clusters": "Urban",
-            "Urban Growth Areas": "Urban",
-            "Urbanized Areas": "Urban",
-            "Combined Statistical Areas": "Statistical",
-            "Metropolitan Divisions": "Statistical",
-            "Metropolitan Statistical Areas": "Statistical",
-            "Micropolitan Statistical Areas": "Statistical",
-            "Counties": "Places",
-            "Economic Places": "Places",
-            "Traffic Analysis Zones": "Transportation",
-            "Traffic Analysis Districts": "Transportation",
-            "Primary Roads": "Transportation",
-            "Secondary Roads": "Transportation",
-            "Local Roads": "Transportation",
-            "Railroads": "Transportation",
-            "Linear Hydrography": "Hydro",
-            "Areal Hydrography": "Hydro",
-            "National Park Service Areas": "LandUse",
-            "Correctional Facilities": "LandUse",
-            "Colleges and Universities": "LandUse",
-            "Military Installations": "LandUse",
-        }
+        if export:
+            # Export inventory to JSON file
+            output_path = os.path.join(self.prj_dirs["codebook"], "octl_cb_twr.json")
+            with open(output_path, "w", encoding = "utf-8") as f:
+                json.dump(inventory, f, indent=4)
+            print(f"Inventory exported to {output_path}")
+
+        # Return the final inventory
+        return inventory
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Refresh TIGERweb inventory ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def refresh_tigerweb(self, export: bool = True, max_workers: int = 8, per_host: int = 4, rebuild_master: bool = True) -> tuple:
+        """
+        Incrementally refresh the TIGERweb inventory (octl_cb_twr.json) and report the changes.
+        Args:
+            export (bool, optional): Whether to export the refreshed inventory to codebook/octl_cb_twr.json. Defaults to True.
+            max_workers (int, optional): The maximum number of requests in flight. Defaults to 8.
+            per_host (int, optional): The maximum number of requests in flight to the same host. Defaults to 4.
+            rebuild_master (bool, optional): Whether to rebuild the OCTL master codebook (octl_cb_master.json) when layers were added, removed or changed. Defaults to True.
+        Returns:
+            tuple: (inventory, diff), the refreshed inventory and the differences from the stored one (see diff_twr_inventories).
+        Raises:
+            requests.HTTPError: If the directory, a service or a layer request fails.
+        Example:
+            >>> inventory, diff = refresh_tigerweb()
+            >>> diff["layers"]["added"]
+            ['series/ACS/2025/Census Tracts', ...]
+        Notes:
+            The service documents are requested with the ETag / Last-Modified validators of the previous refresh (kept in data/cache/octl_twr_state.json), and only the layers of new services and of services whose currentVersion, cimVersion or feature layers changed are fetched; the other services keep their stored layers, so a routine refresh sends one request per service. Without a stored inventory this is a full crawl (see crawl_tigerweb). The validators are only used with the inventory they were saved with. The master codebook is only rebuilt when the layers changed (or it does not exist).
+        """
+        print("\nRefreshing the TIGERweb inventory...")
+        start = time.perf_counter()
+        requests_before = sum(values["requests"] for values in self.http_latency_stats().values())
+
+        # Load the stored inventory (if any)
+        inventory_path = os.path.join(self.prj_dirs["codebook"], "octl_cb_twr.json")
+        stored = None
+        if os.path.exists(inventory_path):
+            with open(inventory_path, "r", encoding = "utf-8") as f:
+                stored = json.load(f)
+
+        # Load the validators of the previous refresh (only valid for the same stored inventory and TIGERweb URL)
+        state_path = os.path.join(self.prj_dirs["data_cache"], "octl_twr_state.json")
+        state = {}
+        if os.path.exists(state_path):
+            try:
+                with open(state_path, "r", encoding = "utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+        validators = {}
+        if stored is not None and state.get("url") == self.tigerweb_url and state.get("inventory_hash") == self._twr_inventory_hash(stored):
+            validators = state.get("validators", {})
+
+        # Crawl the new and changed services and compare the inventories
+        inventory = self._crawl_tigerweb(stored = stored, validators = validators, max_workers = max_workers, per_host = per_host)
+        diff = self.diff_twr_inventories(stored or {}, inventory)
+        requests_sent = sum(values["requests"] for values in self.http_latency_stats().values()) - requests_before
+
+        # Print the differences
+        print(f"\nTotal Services: {inventory['metadata']['total_services']}, Total Layers: {inventory['metadata']['total_layers']}")
+        for kind in ("services", "layers"):
+            print(f"- {kind.capitalize()}: {len(diff[kind]['added'])} added, {len(diff[kind]['removed'])} removed, {len(diff[kind]['changed'])} changed")
+            for change in ("added", "removed", "changed"):
+                for item in diff[kind][change]:
+                    print(f"  - {change}: {item['key'] if isinstance(item, dict) else item}")
+
+        if export:
+            # Export inventory to JSON file
+            with open(inventory_path, "w", encoding = "utf-8") as f:
+                json.dump(inventory, f, indent=4)
+            print(f"Inventory exported to {inventory_path}")
+
+            # Save the validators for the next refresh (write to a temporary file first)
+            os.makedirs(self.prj_dirs["data_cache"], exist_ok = True)
+            tmp_path = f"{state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding = "utf-8") as f:
+                json.dump({"url": self.tigerweb_url, "inventory_hash": self._twr_inventory_hash(inventory), "checked": time.time(), "validators": validators}, f)
+            os.replace(tmp_path, state_path)
+
+        # Rebuild the master codebook only when the layers changed
+        master_path = os.path.join(self.prj_dirs["codebook"], "octl_cb_master.json")
+        layers_changed = any(diff["layers"][change] for change in ("added", "removed", "changed"))
+        if rebuild_master and (layers_changed or not os.path.exists(master_path)):
+            print("- Rebuilding the OCTL master codebook")
+            self.create_octl_master_cb(cb = inventory)
+        elif rebuild_master:
+            print("- The OCTL master codebook is up to date")
+
+        print(f"Refreshed the TIGERweb inventory in {time.perf_counter() - start:.2f}s ({requests_sent} request(s))")
+        return inventory, diff
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Compare TIGERweb inventories ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def diff_twr_inventories(self, old: dict, new: dict) -> dict:
+        """
+        Compare two TIGERweb inventories service by service and layer by layer.
+        Args:
+            old (dict): The previous inventory (an empty dictionary for none).
+            new (dict): The current inventory.
+        Returns:
+            dict: {"services": {...}, "layers": {...}}, each with the sorted "added" and "removed" keys and the "changed" entries ({"key", "fields"} with the names of the changed fields). Services are keyed as "series/{category}/{year}" or "standalone/{category}" and layers as "{service key}/{layer name}".
+        Raises:
+            None
+        Example:
+            >>> diff = diff_twr_inventories(old_inventory, new_inventory)
+        Notes:
+            The inventory metadata (project, version, date and totals) is not compared.
+        """
+        def _flatten(inventory: dict) -> tuple:
+            # Return the {key: service fields} and {key: layer record} of an inventory
+            services = {}
+            layers = {}
+            entries = [(f"series/{category}/{year}", entry) for category, years in inventory.get("series", {}).items() for year, entry in years.items()]
+            entries += [(f"standalone/{category}", entry) for category, entry in inventory.get("standalone", {}).items()]
+            for service_key, entry in entries:
+                services[service_key] = {key: value for key, value in entry.items() if key != "layers"}
+                for layer_label, layer in entry.get("layers", {}).items():
+                    layers[f"{service_key}/{layer_label}"] = layer
+            return services, layers
+
+        diff = {}
+        for kind, old_items, new_items in zip(("services", "layers"), _flatten(old), _flatten(new)):
+            diff[kind] = {
+                "added": sorted(set(new_items) - set(old_items)),
+                "removed": sorted(set(old_items) - set(new_items)),
+                "changed": [
+                    {"key": key, "fields": sorted(field for field in set(old_items[key]) | set(new_items[key]) if old_items[key].get(field) != new_items[key].get(field))}
+                    for key in sorted(set(old_items) & set(new_items)) if old_items[key] != new_items[key]
+                ]
+            }
+        return diff
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: TIGERweb inventory hash ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def _twr_inventory_hash(self, inventory: dict) -> str:
+        # SHA-256 of the services and layers of an inventory (the metadata is left out)
+        content = {key: value for key, value in inventory.items() if key != "metadata"}
+        return hashlib.sha256(json.dumps(content, sort_keys = True).encode("utf-8")).hexdigest()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: TIGERweb crawl ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def _crawl_tigerweb(self, stored: Optional[dict] = None, validators: Optional[dict] = None, max_workers: int = 8, per_host: int = 4) -> dict:
+        # Build the TIGERweb inventory (see crawl_tigerweb). The services of a stored inventory are reused, without
+        # fetching their layers, when their document is not modified (304) or keeps the same currentVersion, cimVersion
+        # and feature layers; the layers of new and changed services are fetched concurrently.
+        base_rest = self.tigerweb_url
+        base_params = {"f": "json"}
 
         # Initialize the inventory dictionary
         inventory = {
@@ -559,298 +1573,192 @@ class OCGD:
             "standalone": {}
             }
 
-        exclusion_list = ["Labels", "Tribal", "Estates", "Subbarrios", "Alaska", "American Indian", "Off-Reservation", "Hawaiian", "Census Divisions", "Census Regions", "New England", "States", "Oklahoma", "Voting Districts", "School District Administrative Areas", "Consolidated Cities", "Micropolitan", "Urban Growth Areas", "Glaciers"]
         cs = 0 # Service counter
         cl = 0 # Layer counter
 
+        # The stored services, keyed by service name
+        stored_services = {}
+        if stored is not None:
+            for category in stored.get("series", {}).values():
+                for entry in category.values():
+                    stored_services[entry["name"]] = entry
+            for entry in stored.get("standalone", {}).values():
+                stored_services[entry["name"]] = entry
+
         # Get the base REST services
-        base_response = requests.get(base_rest, params = base_params, timeout = 30)
+        base_response = self.http_get(base_rest, params = base_params, timeout = 30)
         base_response.raise_for_status()
         base_data = base_response.json()
         # only keep services that contain "TIGERweb/tigerWMS_" in the name
         base_data = [service for service in base_data.get("services", []) if "TIGERweb/tigerWMS_" in service["name"]]
+        service_names = [service["name"].replace("TIGERweb/tigerWMS_", "") for service in base_data]
+
+        # Fetch the details of all the services concurrently (results are kept in the listing order); the requests are conditional for the stored services only
+        service_rests = [f"{base_rest}/tigerWMS_{service_name}/{service['type']}" for service, service_name in zip(base_data, service_names)]
+        if validators is not None:
+            # Drop the validators of the services that are not in the stored inventory (the dictionary is updated in place)
+            stored_rests = {service_rest for service_rest, service_name in zip(service_rests, service_names) if service_name in stored_services}
+            for url in [url for url in validators if url not in stored_rests]:
+                del validators[url]
+        service_datas = self.http_get_json_many([(service_rest, {"f": "pjson"}) for service_rest in service_rests], max_workers = max_workers, per_host = per_host, timeout = 30, validators = validators)
+
+        # Collect the feature layers of the new and changed services and fetch their details concurrently
+        service_layers = []
+        layer_requests = []
+        for service, service_name, service_data in zip(base_data, service_names, service_datas):
+            stored_entry = stored_services.get(service_name)
+            if service_data is None:
+                # Not modified since the stored inventory
+                service_layers.append(None)
+                continue
+            layers = []
+            for layer in service_data.get("layers", []):
+                if layer.get("type") != "Feature Layer":
+                    continue
+                # If the layer["name"] contains any of the exclusion terms, skip it
+                if self.layer_classifier.excluded(layer["name"]):
+                    continue
+                layer_rest = f"{base_rest}//tigerWMS_{service_name}/{service['type']}/{layer['id']}"
+                layers.append((layer, layer_rest))
+            if (
+                stored_entry is not None
+                and stored_entry.get("type") == service["type"]
+                and stored_entry.get("currentVersion") == service_data.get("currentVersion")
+                and stored_entry.get("cimVersion") == service_data.get("cimVersion")
+                and ("layers" in stored_entry) == ("layers" in service_data)
+                and [(layer["name"], layer["id"]) for layer, _ in layers] == [(label, values["id"]) for label, values in stored_entry.get("layers", {}).items()]
+            ):
+                # Same versions and feature layers as the stored inventory
+                service_layers.append(None)
+                continue
+            service_layers.append([(layer, layer_rest, len(layer_requests) + i) for i, (layer, layer_rest) in enumerate(layers)])
+            layer_requests.extend((layer_rest, {"f": "pjson"}) for _, layer_rest in layers)
+        layer_datas = self.http_get_json_many(layer_requests, max_workers = max_workers, per_host = per_host, timeout = 30)
 
-        for service in base_data:
+        # Assemble the inventory in the listing order (the same order as a serial crawl)
+        for service, service_name, service_rest, service_data, layers in zip(base_data, service_names, service_rests, service_datas, service_layers):
             cs += 1 # Increment the service counter
-            service_name = service["name"].replace("TIGERweb/tigerWMS_", "")
-            service_type = service["type"]
-
-            # if the last four characters of service_name are digits:
-            if re.search(r'\d{4}$', service_name):                
-                # Get the unique names without the year
-                # category = "series"
-                category_name = re.sub(r'\d{4}$', '', service_name)
-                category_year = re.search(r'\d{4}$', service_name).group()
-
-                print(f"\nSeries Service: {category_name}, Year: {category_year} ({service_type})")
-
-                # Get the service REST URL and parameters
-                service_rest = f"{base_rest}/tigerWMS_{service_name}/{service_type}"
-                service_param = {"f": "pjson"}
-
-                # Add to the inventory dictionary
-                if category_name not in inventory["series"]:
-                    inventory["series"][category_name] = {}
-                if category_year not in inventory["series"][category_name]:
-                    inventory["series"][category_name][category_year] = {
-                        "rest": service_rest,
-                        "name": service_name,
-                        "type": service_type
-                    }
-
-                # Get the service details
-                service_response = requests.get(service_rest, params = service_param, timeout = 30)
-                service_response.raise_for_status()
-                service_data = service_response.json()
-
-                # Update the inventory with service details
-                inventory["series"][category_name][category_year].update({
-                    "currentVersion": service_data.get("currentVersion"),
-                    "cimVersion": service_data.get("cimVersion"),
-                    "mapName": service_data.get("mapName"),
-                    "description": service_data.get("description"),
-                    "spatialReference": service_data.get("spatialReference", {}).get("latestWkid", None),
-                })
-
-                # Get the layers for the service
-                if "layers" in service_data:
-                    inventory["series"][category_name][category_year]["layers"] = {}
-
-                    # Iterate through each layer in the service
-                    for layer in service_data.get("layers", []):
-                        if layer.get("type") != "Feature Layer":
-                            continue
-                        # If the layer["name"] contains any of the exclusion terms, skip it
-                        if any(exclusion in layer["name"] for exclusion in exclusion_list):
-                            continue
-                        
-                        cl += 1 # Increment the layer counter
-                        layer_type = layer["type"]
-                        layer_id = layer["id"]
-                        layer_name = layer["name"]
-                        layer_label = layer_name
-                        print(f"- {layer_type}: {layer_label} (ID: {layer_id})")
-
-                        # Get the layer REST URL and parameters
-                        layer_rest = f"{base_rest}//tigerWMS_{service_name}/{service_type}/{layer_id}"
-                        layer_param = {"f": "pjson"}
-
-                        # Get the layer details
-                        layer_response = requests.get(layer_rest, params = layer_param, timeout = 30)
-                        layer_response.raise_for_status()
-                        layer_data = layer_response.json()
-                        layer_id = layer_data["id"]
-                        layer_type = layer_data["type"]
-                        layer_name = layer_data["name"]
-                        layer_group = None
-                        layer_alias = None
-                        layer_code = None
-                        layer_description = layer_data["description"]
-                        layer_version = layer_data["currentVersion"]
-                        layer_cim_version = layer_data["cimVersion"]
-                        layer_geometry = layer_data["geometryType"]
-                        layer_fields = [f["name"] for f in layer_data["fields"]]
-                        # If both "STATE" and "COUNTY" are not in layer_fields set ocgd_method to "query", else if only "STATE" is in layer_fields set ocgd_method to "spatial with query", else set ocgd_method to "spatial only"
-                        if "STATE" in layer_fields and "COUNTY" in layer_fields:
-                            ocgd_method = "query"
-                        elif "STATE" in layer_fields:
-                            ocgd_method = "spatial with query"
-                        else:
-                            ocgd_method = "spatial only"
-
-                        # Determine the layer group based on the layer name and the group_codes dictionary
-                        for group_key, group_value in group_codes.items():
-                            if group_key in layer_name:
-                                layer_group = group_value
-
-                        # Determine the layer code and alias based on the layer name and the cb_codes dictionary
-                        for cb_code_key, cb_code_value in cb_codes.items():
-                            if cb_code_key in layer_name:
-                                layer_code = cb_code_value
-                                layer_alias = cb_code_key
-
-                        if "Counties" in layer_name:
-                            layer_alias = "Orange County"
-
-                        if "Congressional Districts" in layer_name and re.match(r'^\d{3}th', layer_name):
-                            layer_congress = int(re.match(r'^\d{3}', layer_name).group())
-                            layer_alias = f"Congressional Districts-{layer_congress}th US Congress"
-                            layer_code = f"{layer_code}{layer_congress}"
-
-                        if "State Legislative Districts - Upper" in layer_name:
-                            layer_alias = "State Senate Legislative Districts"
-
-                        if "State Legislative Districts - Lower" in layer_name:
-                            layer_alias = "State Assembly Legislative Districts"
-
-                        if "Corrected" in layer_name:
-                            layer_alias = f"{layer_alias} Corrected"
-                            layer_code = f"{layer_code}_Corrected"
-
-                        if re.match(r'^\d{4}', layer_name):
-                            layer_year = int(re.match(r'^\d{4}', layer_name).group())
-                            layer_alias = f"{layer_alias}-{layer_year}"
-                            layer_code = f"{layer_code}{layer_year}"
-
-                        # Update the inventory with layer details
-                        inventory["series"][category_name][category_year]["layers"][layer_label] = {
-                            "rest": layer_rest,
-                            "id": layer_id,
-                            "name": layer_name,
-                            "type": layer_type,
-                            "group": layer_group,
-                            "code": layer_code,
-                            "alias": layer_alias,
-                            "description": layer_description,
-                            "currentVersion": layer_version,
-                            "cimVersion": layer_cim_version,
-                            "geometryType": layer_geometry,
-                            "ocgd_method": ocgd_method,
-                            "fields": layer_fields
-                        }
-
-            else:
-                category_name = service_name
-
-                print(f"\nStandalone Service: {category_name} ({service_type})")
-
-                # Get the service REST URL and parameters
-                service_rest = f"{base_rest}/tigerWMS_{service_name}/{service_type}"
-                service_param = {"f": "pjson"}
-
-                if category_name not in inventory["standalone"]:
-                    inventory["standalone"][category_name] = {
-                        "rest": service_rest,
-                        "name": service_name,
-                        "type": service_type
-                    }
+            stored_entry = stored_services.get(service_name)
+
+            # Reuse the stored layers of an unchanged service
+            if layers is None:
+                if service_data is None:
+                    service_data = {key: stored_entry.get(key) for key in ("currentVersion", "cimVersion", "mapName", "description")}
+                    service_data["spatialReference"] = {"latestWkid": stored_entry.get("spatialReference")}
+                service_entry = self._twr_service_entry(inventory, service, service_rest, service_data, status = " - unchanged")
+                if "layers" in stored_entry:
+                    service_entry["layers"] = json.loads(json.dumps(stored_entry["layers"]))
+                    cl += len(service_entry["layers"])
+                continue
 
-                # Get the service details
-                service_response = requests.get(service_rest, params = service_param, timeout = 30)
-                service_response.raise_for_status()
-                service_data = service_response.json()
-
-                # Update the inventory with service details
-                inventory["standalone"][category_name].update({
-                    "currentVersion": service_data.get("currentVersion"),
-                    "cimVersion": service_data.get("cimVersion"),
-                    "mapName": service_data.get("mapName"),
-                    "description": service_data.get("description"),
-                    "spatialReference": service_data.get("spatialReference", {}).get("latestWkid", None),
-                })
-
-                # Get the layers for the service
-                if "layers" in service_data:
-                    inventory["standalone"][category_name]["layers"] = {}
-
-                    # Iterate through each layer in the service
-                    for layer in service_data.get("layers", []):
-                        if layer.get("type") != "Feature Layer":
-                            continue
+            status = "" if stored is None else (" - new" if stored_entry is None else " - changed")
+            service_entry = self._twr_service_entry(inventory, service, service_rest, service_data, status = status)
 
-                        # If the layer["name"] contains any of the exclusion terms, skip it
-                        if any(exclusion in layer["name"] for exclusion in exclusion_list):
-                            continue
+            # Add the layers of the service
+            if "layers" in service_data:
+                service_entry["layers"] = {}
+                for layer, layer_rest, layer_index in layers:
+                    cl += 1 # Increment the layer counter
+                    layer_label = layer["name"]
+                    print(f"- {layer['type']}: {layer_label} (ID: {layer['id']})")
+                    service_entry["layers"][layer_label] = self._twr_layer_record(layer_rest, layer_datas[layer_index])
 
-                        cl += 1 # Increment the layer counter
-                        layer_type = layer["type"]
-                        layer_id = layer["id"]
-                        layer_name = layer["name"]
-                        layer_label = layer_name                        
-                        print(f"- {layer_type}: {layer_label} (ID: {layer_id})")
-
-                        # Get the layer REST URL and parameters
-                        layer_rest = f"{base_rest}//tigerWMS_{service_name}/{service_type}/{layer_id}"
-                        layer_param = {"f": "pjson"}
-
-                        # Get the layer details
-                        layer_response = requests.get(layer_rest, params = layer_param, timeout = 30)
-                        layer_response.raise_for_status()
-                        layer_data = layer_response.json()
-                        layer_id = layer_data["id"]
-                        layer_type = layer_data["type"]
-                        layer_name = layer_data["name"]
-                        layer_group = None
-                        layer_alias = None
-                        layer_code = None
-                        layer_description = layer_data["description"]
-                        layer_version = layer_data["currentVersion"]
-                        layer_cim_version = layer_data["cimVersion"]
-                        layer_geometry = layer_data["geometryType"]
-                        layer_fields = [f["name"] for f in layer_data["fields"]]
-                        # If both "STATE" and "COUNTY" are not in layer_fields set ocgd_method to "query", else if only "STATE" is in layer_fields set ocgd_method to "spatial with query", else set ocgd_method to "spatial only"
-                        if "STATE" in layer_fields and "COUNTY" in layer_fields:
-                            ocgd_method = "query"
-                        elif "STATE" in layer_fields:
-                            ocgd_method = "spatial with query"
-                        else:
-                            ocgd_method = "spatial only"
-
-                        # Determine the layer group based on the layer name and the group_codes dictionary
-                        for group_key, group_value in group_codes.items():
-                            if group_key in layer_name:
-                                layer_group = group_value
-
-                        # Determine the layer code and alias based on the layer name and the cb_codes dictionary
-                        for cb_code_key, cb_code_value in cb_codes.items():
-                            if cb_code_key in layer_name:
-                                layer_code = cb_code_value
-                                layer_alias = cb_code_key
-
-                        if "Counties" in layer_name:
-                            layer_alias = "Orange County"
-
-                        if "Congressional Districts" in layer_name and re.match(r'^\d{3}th', layer_name):
-                            layer_congress = int(re.match(r'^\d{3}', layer_name).group())
-                            layer_alias = f"Congressional Districts-{layer_congress}th US Congress"
-                            layer_code = f"{layer_code}{layer_congress}"
-
-                        if "State Legislative Districts - Upper" in layer_name:
-                            layer_alias = "State Senate Legislative Districts"
-
-                        if "State Legislative Districts - Lower" in layer_name:
-                            layer_alias = "State Assembly Legislative Districts"
-
-                        if "Corrected" in layer_name:
-                            layer_alias = f"{layer_alias} Corrected"
-                            layer_code = f"{layer_code}_Corrected"
-
-                        if re.match(r'^\d{4}', layer_name):
-                            layer_year = int(re.match(r'^\d{4}', layer_name).group())
-                            layer_alias = f"{layer_alias}-{layer_year}"
-                            layer_code = f"{layer_code}{layer_year}"
-
-                        # Update the inventory with layer details
-                        inventory["standalone"][category_name]["layers"][layer_label] = {
-                            "rest": layer_rest,
-                            "id": layer_id,
-                            "name": layer_name,
-                            "type": layer_type,
-                            "group": layer_group,
-                            "code": layer_code,
-                            "alias": layer_alias,
-                            "description": layer_description,
-                            "currentVersion": layer_version,
-                            "cimVersion": layer_cim_version,
-                            "geometryType": layer_geometry,
-                            "ocgd_method": ocgd_method,
-                            "fields": layer_fields
-                        }
-        
         # Update the inventory metadata with total services and layers
         inventory["metadata"]["total_services"] = cs
         inventory["metadata"]["total_layers"] = cl
-        print(f"\nTotal Services: {cs}, Total Layers: {cl}")
+        return inventory
 
-        if export:
-            # Export inventory to JSON file
-            output_path = os.path.join(self.prj_dirs["codebook"], "octl_cb_twr.json")
-            with open(output_path, "w", encoding = "utf-8") as f:
-                json.dump(inventory, f, indent=4)
-            print(f"Inventory exported to {output_path}")
 
-        # Return the final inventory
-        return inventory
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: TIGERweb service entry ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def _twr_service_entry(self, inventory: dict, service: dict, service_rest: str, service_data: dict, status: str = "") -> dict:
+        # Add (or update) the inventory entry of a TIGERweb service from its pjson document and return it (see crawl_tigerweb)
+        service_name = service["name"].replace("TIGERweb/tigerWMS_", "")
+        service_type = service["type"]
+
+        # if the last four characters of service_name are digits:
+        if re.search(r'\d{4}$', service_name):
+            # Get the unique names without the year
+            # category = "series"
+            category_name = re.sub(r'\d{4}$', '', service_name)
+            category_year = re.search(r'\d{4}$', service_name).group()
+            print(f"\nSeries Service: {category_name}, Year: {category_year} ({service_type}){status}")
+
+            # Add to the inventory dictionary
+            if category_name not in inventory["series"]:
+                inventory["series"][category_name] = {}
+            if category_year not in inventory["series"][category_name]:
+                inventory["series"][category_name][category_year] = {
+                    "rest": service_rest,
+                    "name": service_name,
+                    "type": service_type
+                }
+            service_entry = inventory["series"][category_name][category_year]
+        else:
+            category_name = service_name
+            print(f"\nStandalone Service: {category_name} ({service_type}){status}")
+
+            if category_name not in inventory["standalone"]:
+                inventory["standalone"][category_name] = {
+                    "rest": service_rest,
+                    "name": service_name,
+                    "type": service_type
+                }
+            service_entry = inventory["standalone"][category_name]
+
+        # Update the inventory with service details
+        service_entry.update({
+            "currentVersion": service_data.get("currentVersion"),
+            "cimVersion": service_data.get("cimVersion"),
+            "mapName": service_data.get("mapName"),
+            "description": service_data.get("description"),
+            "spatialReference": service_data.get("spatialReference", {}).get("latestWkid", None),
+        })
+        return service_entry
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: TIGERweb layer record ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def _twr_layer_record(self, layer_rest: str, layer_data: dict) -> dict:
+        # Build the inventory record of a TIGERweb feature layer from its pjson document (see crawl_tigerweb)
+        layer_id = layer_data["id"]
+        layer_type = layer_data["type"]
+        layer_name = layer_data["name"]
+        layer_description = layer_data["description"]
+        layer_version = layer_data["currentVersion"]
+        layer_cim_version = layer_data["cimVersion"]
+        layer_geometry = layer_data["geometryType"]
+        layer_fields = [f["name"] for f in layer_data["fields"]]
+        # If both "STATE" and "COUNTY" are not in layer_fields set ocgd_method to "query", else if only "STATE" is in layer_fields set ocgd_method to "spatial with query", else set ocgd_method to "spatial only"
+        if "STATE" in layer_fields and "COUNTY" in layer_fields:
+            ocgd_method = "query"
+        elif "STATE" in layer_fields:
+            ocgd_method = "spatial with query"
+        else:
+            ocgd_method = "spatial only"
+
+        # Determine the layer group, code and alias from the layer name (see TWRLayerClassifier)
+        layer_group, layer_code, layer_alias = self.layer_classifier.classify(layer_name)
+
+        # Return the layer details
+        return {
+            "rest": layer_rest,
+            "id": layer_id,
+            "name": layer_name,
+            "type": layer_type,
+            "group": layer_group,
+            "code": layer_code,
+            "alias": layer_alias,
+            "description": layer_description,
+            "currentVersion": layer_version,
+            "cimVersion": layer_cim_version,
+            "geometryType": layer_geometry,
+            "ocgd_method": ocgd_method,
+            "fields": layer_fields
+        }
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: Create OCTL master codebook from TIGERweb inventory ----
@@ -960,6 +1868,13 @@ class OCGD:
             "National Park Service Areas": {"code": "NP", "group": "LandUse"}
         }
 
+        # Find the lookup keys contained in each layer name in one scan per layer (see TWRLayerClassifier), keeping the layer order
+        key_layers = dict()
+        lookup_classifier = TWRLayerClassifier(layer_lookup)
+        for layer in intermediate_dict:
+            for key in lookup_classifier.matches(layer):
+                key_layers.setdefault(key, []).append(layer)
+
         # Create a master lookup dictionary to map the layer names to their codes, groups, types, ocgd methods, and metadata
         master_dict = dict()
         for key, values in layer_lookup.items():
@@ -975,11 +1890,11 @@ class OCGD:
             master_dict[key]["type"] = "Feature Layer"
             master_dict[key]["ocgd_method"] = ""
             master_dict[key]["layers"] = {}
-            for layer, content in intermediate_dict.items():
-                if key in layer:
-                    master_dict[key]["type"] = content["type"]
-                    master_dict[key]["ocgd_method"] = content["ocgd_method"]
-                    master_dict[key]["layers"][layer] = content["code"]
+            for layer in key_layers.get(key, []):
+                content = intermediate_dict[layer]
+                master_dict[key]["type"] = content["type"]
+                master_dict[key]["ocgd_method"] = content["ocgd_method"]
+                master_dict[key]["layers"][layer] = content["code"]
             master_dict[key]["metadata"] = {
                 "title": f"OCTL {master_dict[key]['alias']}",
                 "tags": f"Orange County, California, OCTL, TigerLines, TIGERweb, {master_dict[key]['type']}, {master_dict[key]['group']}, {layer_lookup[key]['code']}, {master_dict[key]['alias']}",
@@ -1031,17 +1946,17 @@ class OCGD:
         with open(os.path.join(self.prj_dirs["codebook"], "octl_cb_master.json"), "r", encoding = "utf-8") as f:
             master_cb = json.load(f)
 
-        # Check if the codebook is older than 3 months. If it is, recrawl the TIGERweb REST API to update the full inventory and export it to a JSON file.
+        # Check if the codebook is older than 3 months. If it is, refresh the inventory from the TIGERweb REST API (only new and changed services are crawled) and export it to a JSON file.
         cb_date = datetime.datetime.strptime(inventory["metadata"]["date"], "%B %Y") if inventory["metadata"]["date"] else None
         if cb_date and (datetime.datetime.now() - cb_date).days > 90:
-            print("\nThe codebook is older than 3 months. Re-crawling TIGERweb REST API to update the full inventory...\n")
+            print("\nThe codebook is older than 3 months. Refreshing the TIGERweb inventory...\n")
             logger = self.logger
             logger.enable(meta = self.prj_meta, filename = f"octl_cb_twr_crawl_{self.version}.log", replace = True)
-            print("\nCrawling TIGERweb REST API to create full inventory...\n")
-            # Run the crawl_tigerweb method to get the full inventory
-            inventory = self.crawl_tigerweb(export = True)
-            # Update the codebook variable with the new inventory
-            master_cb = self.create_octl_master_cb()
+            # Run the refresh_tigerweb method (it rebuilds the master codebook only when the layers changed)
+            inventory, _ = self.refresh_tigerweb(export = True)
+            # Reload the master codebook
+            with open(os.path.join(self.prj_dirs["codebook"], "octl_cb_master.json"), "r", encoding = "utf-8") as f:
+                master_cb = json.load(f)
             logger.disable()
 
         # Find the key for the specified level in the full inventory
@@ -3505,6 +4420,34 @@ class OCACS(OCGD):
         # Create a prj_meta variable calling the project_metadata function
         self.prj_meta = self.project_metadata(silent = False)
 
+        # In-memory index of the ACS tables (groups) for each year (see get_acs_group_index)
+        self._acs_group_index = {}
+
+        # In-memory index of the ACS variable types for each year (see get_acs_dtype_index)
+        self._acs_dtype_index = {}
+
+        # Census API annotation values returned in place of an estimate or margin of error
+        self.acs_sentinels = [-999999999, -888888888, -666666666, -555555555, -333333333, -222222222]
+
+        # Variable to (level, section, section_name, alias) index of the master codebook (see get_acs_variable_index)
+        self._acs_variable_index = None
+
+        # Census variable label normalizer (memoized across years, see acs_cb_variables)
+        self.label_normalizer = LabelNormalizer()
+
+        # In-memory GEOID index for each (year, feature class) (see get_geoids)
+        self._geoid_index = {}
+
+        # In-memory cache of the TigerLine spatial data frames (see tl_to_sdf)
+        self.sdf_cache = SpatialFrameCache(max_bytes = 512 * 1024 ** 2)
+
+        # Adaptive request packing limits and the learned chunk sizes per geography (see fetch_acs_adaptive)
+        self.acs_max_variables = 49  # 50 fields per request, including GEO_ID
+        self.acs_max_url_length = 8000
+        self.acs_min_chunk_size = 5
+        self.acs_target_seconds = 4.0
+        self._acs_chunk_sizes = None
+
         # Define the data_levels list
         self.datasets = ["Demographic", "Social", "Economic", "Housing"]
 
@@ -3578,13 +4521,14 @@ class OCACS(OCGD):
             "version": self.version,
             "date": self.data_date,
             "author": "Dr. Kostas Alexandridis, GISP",
-            "years": self.acs5_years
+            # The available years are read from the Census catalog on first use (see acs5_years)
+            "years": "",
         }
 
         # If not silent, print the metadata
         if not silent:
             print(
-                f"\nProject Metadata:\n- Name: {metadata['name']}\n- Title: {metadata['title']}\n- Description: {metadata['description']}\n- Version: {metadata['version']}\n- Author: {metadata['author']}\n- Date: {metadata['date']}\n- Available ACS5 Years: {metadata['years']}\n"
+                f"\nProject Metadata:\n- Name: {metadata['name']}\n- Title: {metadata['title']}\n- Description: {metadata['description']}\n- Version: {metadata['version']}\n- Author: {metadata['author']}\n- Date: {metadata['date']}\n"
             )
 
         # Return the metadata
@@ -3606,46 +4550,17 @@ class OCACS(OCGD):
 
         # only keep the rows where the "used" column is True
         df_cb_vars = df_cb_vars[df_cb_vars["used"]]
-        #df_cb_vars_include = df_cb_vars[df_cb_vars["used"] == True]
 
-        # Create a master dictionary to store the variables for each year, level, and section
-        cb_master = dict()
+        # Reshape the year columns into one row per (year, variable) included in that year (year by year, in the excel row order)
+        df_long = df_cb_vars.melt(id_vars = ["variable", "alias", "level", "section", "section_name"], value_vars = [str(year) for year in years], var_name = "year", value_name = "included")
+        df_long = df_long[df_long["included"] == True]
+
+        # Create a master dictionary to store the variables for each year, level, and section (levels, sections and variables in order of first appearance, with the first section name and alias)
+        cb_master = {str(year): dict() for year in years}
+        for year, variable, alias, level, section, section_name in zip(df_long["year"], df_long["variable"], df_long["alias"], df_long["level"], df_long["section"], df_long["section_name"]):
+            section_info = cb_master[year].setdefault(level, dict()).setdefault(section, {"section": section, "section_name": section_name, "variables": {}})
+            section_info["variables"].setdefault(variable, alias)
 
-        # Loop through each of the ACS5 years
-        for year in years:
-            # Filter the dataframe to only include the rows where the column with the year as the name is True
-            df_year = df_cb_vars[df_cb_vars[str(year)]]
-            # df_year = df_cb_vars[df_cb_vars[str(year)] == True]
-            # Add the year as a key to the master dictionary
-            cb_master[str(year)] = dict()
-
-            # Loop through each level in the dataframe
-            for level in df_year["level"].unique():
-                # Filter the dataframe to only include the rows where the level is equal to the current level
-                df_level = df_year[df_year["level"] == level]
-                # Add the level as a key to the master dictionary under the year
-                cb_master[str(year)][level] = dict()
-                # Loop through each section in the dataframe
-                for section in df_level["section"].unique():
-                    # Filter the dataframe to only include the rows where the section is equal to the current section
-                    df_section = df_level[df_level["section"] == section]
-
-                    # for each section, add the key and the df_section["section_name"].unique()[0] as the value to the cb_master under the year and level
-                    cb_master[str(year)][level][section] = {"section": section, "section_name": df_section["section_name"].unique()[0], "variables": {}}
-
-                    # Create a dictionary to store the variables for the current section
-                    variables_dict = {}
-
-                    # For each variable in df_section, add them into a list and add that list to the cb_master under the year, level, and section
-                    for variable in df_section["variable"].unique():
-                        # for each variable, get the alias from the df_section
-                        variable_alias = df_section[df_section["variable"] == variable]["alias"].unique()[0]
-                        # Append the variables_dict with the pair of variable and variable_alias. It should look like {"variable1": "alias1", "variable2": "alias2", ...}
-                        variables_dict[variable] = variable_alias
-
-                    # Add the variables_dict to the cb_master under the year, level, and section
-                    cb_master[str(year)][level][section]["variables"] = variables_dict
-        
         # For each year and level in the cb_master, add the variables from each section into a single dictionary and add that dictionary to the cb_master under the year and level with the key "all_variables". 
         for year, levels in cb_master.items():
             for level, sections in levels.items():
@@ -3660,20 +4575,94 @@ class OCACS(OCGD):
             with open(output_file_path, "w", encoding = "utf-8") as json_file:
                 json.dump(cb_master, json_file, indent=4)
             print(f"Master variables dictionary written to {output_file_path}")
-        
+
+            # Rebuild the variable index of the new master dictionary
+            self.get_acs_variable_index(cb_master = cb_master)
+
         # Return the master dictionary
         return cb_master
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS variable index ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_acs_variable_index(self, year: Optional[int] = None, cb_master: Optional[dict] = None) -> Optional[dict]:
+        """
+        Get the index from each codebook variable to its (level, section, section_name, alias) for each year.
+        Args:
+            year (int, optional): The year whose index is returned. Defaults to None (the index of all the years).
+            cb_master (dict, optional): A master variables dictionary (see construct_master_variables_dict) to index instead of the ocacs_cb_vars.json file. Defaults to None.
+        Returns:
+            dict: For each year ("2022"), the variables mapped to [level, section, section_name, alias] (or the variables of the given year), or None if the master variables codebook does not exist.
+        Raises:
+            None
+        Example:
+            >>> get_acs_variable_index(2022)["B01001_002E"]
+            ['Demographic', 'D02', 'Sex and Age', 'Male']
+        Notes:
+            A variable listed under several levels is indexed under the first of Demographic, Social, Economic and Housing, and under the first of the level's sections that lists it, as acs_cb_variables classified it. The index is built in one pass over the master dictionary and stored in data/cache/ocacs_cb_vars_index.json together with the hash of the ocacs_cb_vars.json it was built from; it is rebuilt whenever that file changes.
+        """
+        index_path = os.path.join(self.prj_dirs["data_cache"], "ocacs_cb_vars_index.json")
+        master_path = os.path.join(self.prj_dirs["codebook"], "ocacs_cb_vars.json")
+
+        # The hash of the master variables codebook
+        if cb_master is None and not os.path.exists(master_path):
+            print(f"Master variables codebook not found at {master_path}")
+            return None
+        if cb_master is None:
+            with open(master_path, "rb") as f:
+                master_bytes = f.read()
+        else:
+            master_bytes = json.dumps(cb_master, indent = 4).encode("utf-8")
+        source = hashlib.sha256(master_bytes).hexdigest()
+
+        # Reuse the index in memory or on disk if it was built from the same master codebook
+        index = self._acs_variable_index if self._acs_variable_index and self._acs_variable_index.get("source") == source else None
+        if index is None and os.path.exists(index_path):
+            try:
+                with open(index_path, "r", encoding = "utf-8") as f:
+                    stored = json.load(f)
+                if stored.get("source") == source:
+                    index = stored
+            except (OSError, ValueError):
+                index = None
+
+        # Otherwise build it (one pass over the levels, in priority order, their sections and variables) and save it
+        if index is None:
+            if cb_master is None:
+                cb_master = json.loads(master_bytes.decode("utf-8"))
+            index = {"source": source, "years": {}}
+            for year, levels in cb_master.items():
+                year_index = index["years"][year] = {}
+                for level in ["Demographic", "Social", "Economic", "Housing"]:
+                    for section, section_info in levels.get(level, {}).items():
+                        if section == "all_variables":
+                            continue
+                        for var, alias in section_info.get("variables", {}).items():
+                            year_index.setdefault(var, [level, section_info["section"], section_info["section_name"], alias])
+            os.makedirs(self.prj_dirs["data_cache"], exist_ok = True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding = "utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+            print(f"ACS variable index written to {index_path}")
+        self._acs_variable_index = index
+
+        if year is None:
+            return index["years"]
+        return index["years"].get(str(year), {})
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: ACS variables codebook ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def acs_cb_variables(self, year: int, write_to_disk: Optional[bool] = False) -> pd.DataFrame:
+    def acs_cb_variables(self, year: int, write_to_disk: Optional[bool] = False, record_doc_hash: bool = True) -> pd.DataFrame:
         """
         Fetches the ACS CB variables for the specified year(s) and returns a DataFrame containing the variable information.
         Args:
             year (int): The year for which to fetch the ACS variables. Must be one of the available ACS5 years.
             write_to_disk (bool, optional): Whether to write the resulting DataFrame to a CSV file in the codebook directory. Defaults to False.
+            record_doc_hash (bool, optional): Whether to record the hash of the written codebook for render_acs_cb_docs (the workers of acs_cb_variables_batch leave it to the parent process). Defaults to True.
         Returns:
             cb (dict): A dictionary containing the variable information for the specified year(s).
             cb_df (pd.DataFrame): A DataFrame containing the variable information for the specified year(s).
@@ -3697,38 +4686,21 @@ class OCACS(OCGD):
                 elif year not in years:
                     raise ValueError(f"Year must be one of the following: {years}")
 
-        # Load the master JSON variables codebook
-        ocacs_cb_vars_path = os.path.join(self.prj_dirs["codebook"], "ocacs_cb_vars.json")
-        if os.path.exists(ocacs_cb_vars_path):
-            with open(ocacs_cb_vars_path, "r", encoding = "utf-8") as f:
-                ocacs_cb_vars = json.load(f)
-            print(f"Master variables codebook loaded from {ocacs_cb_vars_path}")
-        else:
-            print(f"Master variables codebook not found at {ocacs_cb_vars_path}")
+        # Load the index of the master JSON variables codebook (variable to level, section, section name and alias)
+        var_index = self.get_acs_variable_index(year)
+        if var_index is None:
             return None
-
-        # Get the variable dictionary for the specified year from the master codebook
-        var_cb = ocacs_cb_vars.get(str(year), {})
-
-        # Get the list of variables for each level and section for the specified year from the master codebook
-        demographic_variables = var_cb.get("Demographic", {}).get("all_variables", [])
-        social_variables = var_cb.get("Social", {}).get("all_variables", [])
-        economic_variables = var_cb.get("Economic", {}).get("all_variables", [])
-        housing_variables = var_cb.get("Housing", {}).get("all_variables", [])
-
-        # Combine all variables into a single list for easier filtering
-        all_variables = set(demographic_variables) | set(social_variables) | set(economic_variables) | set(housing_variables)
+        print(f"Master variables codebook index loaded for {year}: {len(var_index):,} variables")
 
         # Initialize the variable dictionary for the current year
         cb = dict()
         
         # Construct the API URL for the specified year
         print(f"\nFetching ACS variables for year {year}...")
-        api_url = f"https://api.census.gov/data/{year}/acs/acs5/variables.json"
-        s = requests.Session()
+        api_url = f"{self.census_api_url}/data/{year}/acs/acs5/variables.json"
 
-        # Make the API request and parse the JSON response
-        resp = s.get(api_url)
+        # Make the API request (through the response cache) and parse the JSON response
+        resp = self.cached_get(api_url, timeout = 60)
         resp.raise_for_status()
         data = resp.json()
 
@@ -3745,86 +4717,20 @@ class OCACS(OCGD):
         print(f"- Variables after filtering for {year}: {len(variables):,}")
 
         # Selecting only the variables that are in the master codebook for the current year
-        variables = {k: v for k, v in variables.items() if k in all_variables}
+        variables = {k: v for k, v in variables.items() if k in var_index}
         print(f"- Variables after selection for {year}: {len(variables):,}")
 
+        # Normalize the labels of all the variables at once (see LabelNormalizer)
+        labels = self.label_normalizer.normalize(pd.Series({var: values["label"] for var, values in variables.items()}, dtype = object))
+        aliases = self.label_normalizer.aliases(labels)
+
         for var, values in variables.items():
-            if "label" in values:
-                # make sure the label is string
-                if not isinstance(values["label"], str):
-                    values["label"] = str(values["label"])
-
-            s = values["label"]
-            # First pass
-            s = s.replace("!!", ": ")
-            s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-            s = re.sub(r"[^A-Za-z0-9\s:\-]", "", s)
-            s = re.sub(r"\s*-\s*", "-", s)
-            s = re.sub(r"-{2,}", "-", s)
-            s = re.sub(r"(?<![A-Za-z0-9])-|-(?![A-Za-z0-9])", "", s)
-            s = re.sub(r":{2,}", ":", s)
-            s = re.sub(r"\s*:\s*", ": ", s)
-            s = re.sub(r"\s+", " ", s)
-            s = s.strip(" \t\n\r:-")
-
-            # Second pass to ensure idempotency (remove any artifacts left by first pass)
-            s = re.sub(r"-{2,}", "-", s)
-            s = re.sub(r"(?<![A-Za-z0-9])-|-(?![A-Za-z0-9])", "", s)
-            s = re.sub(r":{2,}", ":", s)
-            s = re.sub(r"\s*:\s*", ": ", s)
-            s = re.sub(r"\s+", " ", s)
-            s = s.strip(" \t\n\r:-")
-
-            values["label"] = s
+            values["label"] = labels[var]
             values["table"] = var[:3]
-            values["alias"] = re.sub(r"^Estimate\s*: *", "", s)
+            values["alias"] = aliases[var]
 
             # Determine the level, section, and alias for the variable based on the master codebook for the current year
-            if var in demographic_variables:
-                values["level"] = "Demographic"
-                for section, section_content in var_cb.get("Demographic", {}).items():
-                    if section == "all_variables":
-                        continue
-                    if var in section_content.get("variables", []):
-                        values["section"] = section_content["section"]
-                        values["section_name"] = section_content["section_name"]
-                        values["alias"] = section_content["variables"].get(var, values["alias"])    
-                        break                
-            elif var in social_variables:
-                values["level"] = "Social"
-                for section, section_content in var_cb.get("Social", {}).items():
-                    if section == "all_variables":
-                        continue
-                    if var in section_content.get("variables", []):
-                        values["section"] = section_content["section"]
-                        values["section_name"] = section_content["section_name"]
-                        values["alias"] = section_content["variables"].get(var, values["alias"])
-                        break
-            elif var in economic_variables:
-                values["level"] = "Economic"
-                for section, section_content in var_cb.get("Economic", {}).items():
-                    if section == "all_variables":
-                        continue
-                    if var in section_content.get("variables", []):
-                        values["section"] = section_content["section"]
-                        values["section_name"] = section_content["section_name"]
-                        values["alias"] = section_content["variables"].get(var, values["alias"])
-                        break
-            elif var in housing_variables:
-                values["level"] = "Housing"
-                for section, section_content in var_cb.get("Housing", {}).items():
-                    if section == "all_variables":
-                        continue
-                    if var in section_content.get("variables", []):
-                        values["section"] = section_content["section"]
-                        values["section_name"] = section_content["section_name"]
-                        values["alias"] = section_content["variables"].get(var, values["alias"])
-                        break
-            else:
-                values["level"] = "Unknown"
-                values["section"] = None
-                values["section_name"] = None
-                values["alias"] = None
+            values["level"], values["section"], values["section_name"], values["alias"] = var_index[var]
 
             # Construct the variable dictionary for the current variable and add it to the main dictionary under the current year
             cb[var] = {
@@ -3869,56 +4775,246 @@ class OCACS(OCGD):
         print(f"- Variable dictionary and data frame construction for {year} complete.\n")
 
         # Create a markdown document with the variable information for the current year
-        md_path = os.path.join(self.prj_dirs["documentation"], f"ocacs_cb_vars_{year}.md")
-        with open(md_path, "w", encoding = "utf-8") as f:
-            f.write("""<img align="left" src="../graphics/ocacs_logo_demographic.jpg" width="300" hspace="25" vspace="15">\n\n""")
-            f.write(f"# Orange County Geodemographics<br>{year} ACS 5-Year Data Documentation\n\n")
-            f.write(f"*Orange County American Community Survey (ACS) Geodemographic Repository <br> Dr. Kostas Alexandridis, GISP. OC Public Works Geospatial Services*<br>Version: {self.version}, Date: {datetime.datetime.now().strftime('%B %Y')}\n\n")
-            f.write("[◀️ Back to ReadMe](../README.md)")
-            f.write("\n\n## Geodemographic Tables by Group <a name='tables'></a>\n")
-            f.write("\nFor each of the geographies described in the previous section, four categories of geodemographic characteristics are available:\n\n")    
-            for level in df_cb["level"].unique():
-                count_sections = len(df_cb[df_cb["level"] == level]["section"].dropna().unique())
-                count_level = len(df_cb[df_cb["level"] == level])
-                level_name = f"{level} Characteristics ({count_sections} sections, {count_level} variables)"
-                f.write(f"- [**{level_name}**](#{level.lower()})\n")
-            f.write("\nEach of the geographies is represented by a separate geodatabase structure. Within of each of the geographic level geodatabases, each of the four characteristics is represented by a _feature class_ respectively. In order to easily identify each of the sub-groups within each category, the name of the original census table field was adjusted by prepending to it the subgroup identification code. For example, the original field B01001e1 would become D01_B01001e1 in the new feature class for the demographic characteristics.\n")
-            f.write("\nMore detailed description of each sub-group within each of the four feature classes representing the ACS table characteristics is provided below. The table's columns represent: the subgroup's code; its descriptive name;the universe (summative) level of the reference; the ACS Census table in which the original fields are located; the fields/variables of the data, and; how many fields are included in the subgroup.\n")
-            f.write("\n---\n")
-            for level in df_cb["level"].unique():
-                count_sections = len(df_cb[df_cb["level"] == level]["section"].dropna().unique())
-                count_level = len(df_cb[df_cb["level"] == level])
-                level_header = f"\n\n\n## 📚 {level} Characteristics ({count_sections} sections, {count_level} variables) <a name='{level.lower()}'></a>\n"
-                f.write(level_header)
-                f.write("\nThe demographic characteristics selected for spatial representation can be found in ACS data tables X1-X5. They are divided in 8 subgroups: total population, sex and age, median age by sex and race, race, race alone or in combination with other races, hispanic or latino, and citizen voting age population.\n")
-                f.write("\nCode | Name | Variable Count |\n| --- | --- | --- |\n")
-                for section in df_cb[df_cb["level"] == level]["section"].dropna().unique():
-                    # find the section_name for the current level and section
-                    section_name = df_cb[(df_cb["level"] == level) & (df_cb["section"] == section)]["section_name"].dropna().unique()[0]
-                    count_section = len(df_cb[(df_cb["level"] == level) & (df_cb["section"] == section)])
-                    f.write(f"| [{section}](#{section.lower()}) | {section_name} | {count_section} |\n")
-                f.write("\n\n[🔙 Back to Tables](#tables)\n\n")
-
-                for section in df_cb[df_cb["level"] == level]["section"].dropna().unique():
-                    # find the section_name for the current level and section
-                    section_name = df_cb[(df_cb["level"] == level) & (df_cb["section"] == section)]["section_name"].dropna().unique()[0]
-                    count_section = len(df_cb[(df_cb["level"] == level) & (df_cb["section"] == section)])
-                    section_header = f"### 🏷️ {section}: {section_name} ({count_section} variables) <a name='{section.lower()}'></a>\n"
-                    f.write(section_header)
-                    f.write("\n> ")
-                    for markdown in df_cb[(df_cb["level"] == level) & (df_cb["section"] == section)]["markdown"].unique():
-                        f.write(f"{markdown}; ")
-                        f.write("\n")
-                    f.write(f"\n\n[🔙 Back to Sections](#{level.lower()})\n\n")
-            f.write("\n")
-            f.write("---\n\n")
-            f.close()
-
-            print(f"- Markdown documentation for {year} created at {md_path}\n")
+        md_path = self.write_acs_cb_markdown(year, df_cb, source_hash = self.acs_cb_doc_hash(year) if write_to_disk and record_doc_hash else None)
+        print(f"- Markdown documentation for {year} created at {md_path}\n")
 
         return cb, df_cb
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS variables codebook batch ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_cb_variables_batch(self, years: Optional[list[int]] = None, write_to_disk: bool = True, max_workers: Optional[int] = None) -> dict:
+        """
+        Build the ACS variables codebooks of several years in parallel.
+        Args:
+            years (list[int], optional): The years to build. Defaults to None (all the available ACS5 years).
+            write_to_disk (bool, optional): Whether to write the ocacs_cb_vars_{year}.json files (see acs_cb_variables). Defaults to True.
+            max_workers (int, optional): The number of worker processes. Values of 1 build the years one at a time in this process. Defaults to None (one per year, up to the number of CPUs).
+        Returns:
+            dict: For each year, {"cb": dict, "df": pd.DataFrame, "download": float, "build": float}, with the download and build times in seconds ("cb" and "df" are None if the master variables codebook is missing).
+        Raises:
+            ValueError: If a year is not one of the available ACS5 years.
+        Example:
+            >>> results = acs_cb_variables_batch([2021, 2022, 2023], max_workers = 3)
+            >>> results[2022]["df"].shape
+        Notes:
+            The variables.json payloads of all the years are first downloaded concurrently into the Census API response cache (threads, the downloads are network bound); the worker processes then read them from the cache, which keeps one file per entry, so no payload is downloaded twice. The codebook builds (label normalization, JSON and markdown output) are CPU bound and run in separate processes. The hashes of the written codebooks are returned by the workers and recorded once by this process (see record_acs_cb_doc_hashes). Each worker process builds its own OCACS instance with the project directories, Census API URL, response cache settings and catalog index of this instance (HTTP session settings are not carried over; the workers only download on a cache miss). The workers re-import this module (and arcpy) when they start, so on Windows the caller needs an if __name__ == "__main__" guard. The console output of each year is printed in year order once all the years are built, followed by the per-year timings.
+        """
+        # Validate the years
+        years = list(years) if years is not None else list(self.acs5_years)
+        invalid = [year for year in years if year not in self.acs5_years]
+        if invalid:
+            raise ValueError(f"Years must be among the following: {self.acs5_years} (got {invalid})")
+        if max_workers is None:
+            max_workers = min(len(years), os.cpu_count() or 1)
+
+        # Download the variables.json payloads into the response cache
+        print(f"\nDownloading the ACS variables of {len(years)} year(s)...")
+        def _download(year):
+            start = time.perf_counter()
+            resp = self.cached_get(f"{self.census_api_url}/data/{year}/acs/acs5/variables.json", timeout = 60)
+            resp.raise_for_status()
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers = min(8, len(years)) or 1) as executor:
+            downloads = dict(zip(years, executor.map(_download, years)))
+
+        # Build the codebooks (in worker processes, or in this process)
+        results = {}
+        if max_workers <= 1:
+            for year in years:
+                start = time.perf_counter()
+                cb, df_cb = self.acs_cb_variables(year, write_to_disk = write_to_disk) or (None, None)
+                results[year] = {"cb": cb, "df": df_cb, "download": downloads[year], "build": time.perf_counter() - start}
+        else:
+            print(f"Building the ACS variables codebooks with {max_workers} worker process(es)...")
+            doc_hashes = {}
+            # The state of this instance applied to the instances of the workers
+            state = {
+                "prj_dirs": dict(self.prj_dirs),
+                "census_api_url": self.census_api_url,
+                "http_cache": {"cache_dir": self.http_cache.cache_dir, "max_bytes": self.http_cache.max_bytes, "catalog_ttl": self.http_cache.catalog_ttl, "current_ttl": self.http_cache.current_ttl},
+                "census_catalog": self.load_census_catalog(),
+            }
+            with ProcessPoolExecutor(max_workers = max_workers) as executor:
+                futures = {year: executor.submit(_acs_cb_variables_worker, self.part, self.version, state, year, write_to_disk) for year in years}
+                for year in years:
+                    cb, df_cb, seconds, log, doc_hash = futures[year].result()
+                    print(log, end = "")
+                    results[year] = {"cb": cb, "df": df_cb, "download": downloads[year], "build": seconds}
+                    if doc_hash is not None:
+                        doc_hashes[year] = doc_hash
+            # Record the hashes of the written codebooks once (the workers do not write the shared state file)
+            self.record_acs_cb_doc_hashes(doc_hashes)
+
+        # Report the per-year timings
+        print(f"\n{'year':<8}{'variables':>10}{'download (s)':>14}{'build (s)':>11}")
+        for year in years:
+            print(f"{year:<8}{len(results[year]['cb'] or {}):>10,}{results[year]['download']:>14.2f}{results[year]['build']:>11.2f}")
+        return results
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS codebook documentation hash ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_cb_doc_hash(self, year: int) -> Optional[str]:
+        """
+        Get the hash of the inputs of the markdown documentation of a year: its variables codebook file and the project version.
+        Args:
+            year (int): The ACS year.
+        Returns:
+            str: The SHA-256 hex digest, or None if codebook/ocacs_cb_vars_{year}.json does not exist.
+        Raises:
+            None
+        Example:
+            >>> acs_cb_doc_hash(2022)
+        """
+        cb_path = os.path.join(self.prj_dirs["codebook"], f"ocacs_cb_vars_{year}.json")
+        if not os.path.exists(cb_path):
+            return None
+        digest = hashlib.sha256()
+        with open(cb_path, "rb") as f:
+            digest.update(f.read())
+        digest.update(f"|{self.version}".encode("utf-8"))
+        return digest.hexdigest()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Record ACS codebook documentation hashes ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def record_acs_cb_doc_hashes(self, hashes: dict) -> None:
+        """
+        Record the hashes of the rendered codebooks of several years (see acs_cb_doc_hash) in data/cache/acs_cb_docs.json.
+        Args:
+            hashes (dict): The hash of each rendered year.
+        Returns:
+            None
+        Raises:
+            None
+        Example:
+            >>> record_acs_cb_doc_hashes({2022: acs_cb_doc_hash(2022)})
+        Notes:
+            The state file is read, updated and replaced in one step, so it must be written by one process at a time; the batch methods collect the hashes of their workers and record them once.
+        """
+        if not hashes:
+            return
+        state_path = os.path.join(self.prj_dirs["data_cache"], "acs_cb_docs.json")
+        state = {}
+        if os.path.exists(state_path):
+            try:
+                with open(state_path, "r", encoding = "utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+        state.update({str(year): source_hash for year, source_hash in hashes.items()})
+        os.makedirs(self.prj_dirs["data_cache"], exist_ok = True)
+        tmp_path = f"{state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding = "utf-8") as f:
+            json.dump(state, f, indent = 4)
+        os.replace(tmp_path, state_path)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Write ACS codebook markdown ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def write_acs_cb_markdown(self, year: int, df_cb: pd.DataFrame, source_hash: Optional[str] = None, text: Optional[str] = None) -> str:
+        """
+        Write the markdown documentation of the ACS variables codebook of a year.
+        Args:
+            year (int): The ACS year.
+            df_cb (pd.DataFrame): The variables codebook data frame of the year (see acs_cb_variables).
+            source_hash (str, optional): The hash of the codebook the documentation is rendered from (see acs_cb_doc_hash), recorded so unchanged years are skipped by render_acs_cb_docs. Defaults to None (not recorded).
+            text (str, optional): The already rendered document. Defaults to None (rendered from df_cb).
+        Returns:
+            str: The path of the markdown document (documentation/ocacs_cb_vars_{year}.md).
+        Raises:
+            None
+        Example:
+            >>> md_path = write_acs_cb_markdown(2022, df_cb)
+        """
+        if text is None:
+            text = _render_acs_cb_markdown(year, df_cb, self.version, datetime.datetime.now().strftime('%B %Y'))
+        md_path = os.path.join(self.prj_dirs["documentation"], f"ocacs_cb_vars_{year}.md")
+        with open(md_path, "w", encoding = "utf-8", buffering = 1024 * 1024) as f:
+            f.write(text)
+
+        # Record the hash of the rendered codebook
+        if source_hash is not None:
+            self.record_acs_cb_doc_hashes({year: source_hash})
+        return md_path
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Render ACS codebook documentation ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def render_acs_cb_docs(self, years: Optional[list[int]] = None, max_workers: int = 1, force: bool = False) -> dict:
+        """
+        Regenerate the markdown documentation of the ACS variables codebooks of several years.
+        Args:
+            years (list[int], optional): The years to render. Defaults to None (all the available ACS5 years).
+            max_workers (int, optional): The number of worker processes. Values of 1 render the years in this process. Defaults to 1.
+            force (bool, optional): Whether to render the years whose codebook did not change since their last render. Defaults to False.
+        Returns:
+            dict: For each year, {"status": "rendered", "unchanged" or "missing", "seconds": float}.
+        Raises:
+            None
+        Example:
+            >>> render_acs_cb_docs([2021, 2022, 2023])
+        Notes:
+            Each year is rendered from its codebook/ocacs_cb_vars_{year}.json. The hash of that file and of the project version is recorded after each render (in data/cache/acs_cb_docs.json), and the years whose hash did not change and whose document exists are skipped. A document renders in milliseconds, so the years are rendered in this process by default; worker processes re-import this module (and arcpy) when they start, and on Windows the caller needs an if __name__ == "__main__" guard to use them.
+        """
+        years = list(years) if years is not None else list(self.acs5_years)
+        results = {}
+
+        # Select the years whose codebook changed since their last render
+        state_path = os.path.join(self.prj_dirs["data_cache"], "acs_cb_docs.json")
+        state = {}
+        if os.path.exists(state_path):
+            try:
+                with open(state_path, "r", encoding = "utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+        pending = {}
+        for year in years:
+            source_hash = self.acs_cb_doc_hash(year)
+            md_path = os.path.join(self.prj_dirs["documentation"], f"ocacs_cb_vars_{year}.md")
+            if source_hash is None:
+                results[year] = {"status": "missing", "seconds": 0.0}
+            elif not force and state.get(str(year)) == source_hash and os.path.exists(md_path):
+                results[year] = {"status": "unchanged", "seconds": 0.0}
+            else:
+                pending[year] = source_hash
+
+        # Load the codebooks of the pending years (in the acs_cb_variables order)
+        frames = {}
+        for year in pending:
+            with open(os.path.join(self.prj_dirs["codebook"], f"ocacs_cb_vars_{year}.json"), "r", encoding = "utf-8") as f:
+                cb = json.load(f)
+            frames[year] = pd.DataFrame(list(cb.values())).sort_values(by = ["level", "section", "variable"]).reset_index(drop = True)
+
+        # Render the documents (in worker processes, or in this process) and write them
+        if pending:
+            date_text = datetime.datetime.now().strftime('%B %Y')
+            args = [(year, frames[year], self.version, date_text) for year in pending]
+            if max_workers <= 1:
+                rendered = [_timed_render_acs_cb_markdown(*arg) for arg in args]
+            else:
+                with ProcessPoolExecutor(max_workers = max_workers) as executor:
+                    rendered = list(executor.map(_timed_render_acs_cb_markdown, *zip(*args)))
+            for year, (text, seconds) in zip(pending, rendered):
+                self.write_acs_cb_markdown(year, frames[year], text = text)
+                results[year] = {"status": "rendered", "seconds": seconds}
+            self.record_acs_cb_doc_hashes(pending)
+
+        # Report the per-year results
+        print(f"\n{'year':<8}{'status':<12}{'render (s)':>11}")
+        for year in years:
+            print(f"{year:<8}{results[year]['status']:<12}{results[year]['seconds']:>11.3f}")
+        return results
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: Get ACS variable list ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -3962,20 +5058,23 @@ class OCACS(OCGD):
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: Get geoids ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def get_geoids(self, year: str, fc: str):
+    def get_geoids(self, year: str, fc: str, refresh: bool = False):
         """
         Get the GEOID field name and unique values for a given year and feature class.
         Args:
             year (str): The year of the geodatabase.
             fc (str): The feature class name.
+            refresh (bool, optional): Whether to scan the feature class even if the index is current. Defaults to False.
         Returns:
-            dict: A dictionary containing the GEOID field name and unique values.
+            dict: A dictionary containing the feature dataset ("dataset"), the GEOID field name ("field"), the sorted unique values as a compact numpy string array ("values") and the geodatabase modification time of the index ("gdb_mtime").
         Raises:
             ValueError: If the geodatabase or feature class does not exist, or if no GEOID field is found.
         Examples:
             >>> geoids = get_geoids("2020", "TRACT")
+            >>> geoids["values"][:2]
+            array(['06059001101', '06059001102'], dtype='<U11')
         Notes:
-            This function retrieves the GEOID field name and unique values from the specified feature class in the geodatabase for the given year.
+            This function retrieves the GEOID field name and unique values from the specified feature class in the geodatabase for the given year. The values are indexed in memory and in data/cache/geoids/geoids_{year}_{fc}.json; the index is used as long as the geodatabase modification time is unchanged, so only the first call (or the first after an edit) scans the feature class.
         """
 
         # Set the workspace to the geodatabase for the specified year
@@ -3983,10 +5082,31 @@ class OCACS(OCGD):
         if not os.path.exists(gdb_path):
             raise ValueError(f"Geodatabase for year {year} does not exist at path {gdb_path}.")
 
+        # Return the in-memory index if the geodatabase has not changed (its modification time is rechecked every few seconds)
+        gdb_mtime = self.gdb_modified_time(gdb_path, max_age = 5.0)
+        key = (str(year), fc)
+        entry = self._geoid_index.get(key)
+        if entry is not None and entry["gdb_mtime"] == gdb_mtime and not refresh:
+            return entry
+
+        # Otherwise load the persistent index if it is current
+        index_path = os.path.join(self.prj_dirs["data_cache"], "geoids", f"geoids_{year}_{fc}.json")
+        if os.path.exists(index_path) and not refresh:
+            try:
+                with open(index_path, "r", encoding = "utf-8") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError):
+                stored = None
+            if stored is not None and stored.get("gdb_mtime") == gdb_mtime:
+                entry = self._geoid_entry(stored["dataset"], stored["field"], stored["values"], gdb_mtime)
+                self._geoid_index[key] = entry
+                return entry
+
         # Set the arcpy workspace to the geodatabase
         arcpy.env.workspace = gdb_path
         arcpy.env.overwriteOutput = True
 
+        fc_path = None
         for dataset in arcpy.ListDatasets(feature_type = "Feature"):
             if fc in arcpy.ListFeatureClasses(feature_dataset = dataset):
                 fc_path = os.path.join(dataset, fc)
@@ -4010,263 +5130,795 @@ class OCACS(OCGD):
                 # Convert the geoids to a sorted list
                 geoids = sorted(list(geoids))
 
+                # Save the index (write to a temporary file first so a partial write never replaces a good index)
+                os.makedirs(os.path.dirname(index_path), exist_ok = True)
+                tmp_path = f"{index_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding = "utf-8") as f_index:
+                    json.dump({"gdb_mtime": gdb_mtime, "dataset": fc_dataset, "field": geoid_field, "values": geoids}, f_index)
+                os.replace(tmp_path, index_path)
+
                 # Return the GEOID field name and unique values
-                return {"dataset": fc_dataset, "field": geoid_field, "values": geoids}
+                entry = self._geoid_entry(fc_dataset, geoid_field, geoids, gdb_mtime)
+                self._geoid_index[key] = entry
+                return entry
         raise ValueError(f"No GEOID field found in feature class {fc_path}.")
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    ## fx: Fetch ACS tables ----
+    ## fx: GEOID index entry ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def _geoid_entry(self, dataset: str, field: str, values: list, gdb_mtime: float) -> dict:
+        # Sorted values as a compact fixed-width string array (membership is tested with a hashed isin, see merge_acs_responses)
+        array = np.array(sorted(values), dtype = str)
+        return {"dataset": dataset, "field": field, "values": array, "gdb_mtime": gdb_mtime}
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Get ACS geography clauses ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def fetch_acs_tables(self, year: int, variables: list[str], geography: str = "CO") -> pd.DataFrame:
+    def get_acs_geography_clauses(self, geography: str) -> tuple:
         """
-        Fetch ACS data for a given year and list of variables.
-        This function will chunk requests when `variables` is large and merge
-        results by `GEOID` so the caller receives a single record per geography
-        with all requested variables.
+        Get the Census API 'for' and 'in' clauses for a given geography code.
         Args:
-            year (int): The ACS year (e.g., 2010, 2023).
-            variables (List[str]): List of ACS variable codes to fetch.
-            geography (str): The geography type (e.g., "CO" for county, "TR" for tract). Defaults to "CO".
+            geography (str): The geography type (e.g., "CO" for county, "TR" for tract).
         Returns:
-            DataFrame containing the requested ACS data for each geography.
+            tuple: A tuple containing the for_clause (str) and the in_clause (str or list of str).
         Raises:
-            RuntimeError: If the CENSUS_API_KEY1 environment variable is not set.
+            ValueError: If the geography is not supported.
         Example:
-            >>> df_acs = fetch_acs_tables(2020, ["B01001_001E", "B01001_002E"], geography = "TR")
+            >>> for_clause, in_clause = get_acs_geography_clauses("TR")
         Notes:
-            This function fetches ACS data from the Census API, handling large variable
-            requests by chunking them and merging results based on GEOID.
+            Multiple 'in' values are returned as a list so they can be sent as repeated 'in' parameters.
         """
-        # Get Census API key from environment variable
-        api_key = os.getenv("CENSUS_API_KEY1")
-        if not api_key:
-            raise RuntimeError("Environment variable CENSUS_API_KEY1 is not set")
-
-        # Validate variables parameter
-        if not isinstance(variables, (list, tuple)):
-            raise TypeError("variables must be a list or tuple of ACS variable codes")
-
-        # Base URL for ACS5 API
-        base_url = f"https://api.census.gov/data/{year}/acs/acs5"
-
-        # Census API accepts a maximum of 50 fields per request including GEOID.
-        # Ensure we chunk variables so that each request has at most 49 variables
-        # plus the GEOID field.
-        chunk_size = 40
-
-        # Prepare chunks (exclude GEOID from chunking)
-        def _chunk_list_local(items: list[str], size: int) -> list[list[str]]:
-            return [items[i : i + size] for i in range(0, len(items), size)]
-
-        # Get the chunks
-        chunks = _chunk_list_local(list(variables), chunk_size)
-        if len(chunks) > 1:
-            print(f"Total variables: {len(variables)} split into {len(chunks)} chunk(s)")
-
-        # Dictionary to hold merged results by GEO_ID
-        merged: dict[str, dict[str, str]] = {}
-
         # Determine for_clause and in_clause based on geography
         for_clause: str = ""
         in_clause: Union[str, list[str]] = ""
-        print(f"Fetching data for geography: {geography}")
         match geography:
             case "CO":
                 print("Fetching county data")
-                geoids = self.get_geoids(str(year), "CO")
                 for_clause = "county:059"
                 in_clause = "state:06"
             case "CS":
                 print("Fetching county subdivision data")
-                geoids = self.get_geoids(str(year), "CS")
                 for_clause = "county subdivision:*"
                 in_clause = ["state:06", "county:059"]
             case "TR":
                 print("Fetching census tract data")
-                geoids = self.get_geoids(str(year), "TR")
                 for_clause = "tract:*"
                 in_clause = ["state:06", "county:059"]
             case "PL":
                 print("Fetching cities or places data")
-                geoids = self.get_geoids(str(year), "PL")
                 for_clause = "place:*"
                 in_clause = "state:06"
             case "CD":
                 print("Fetching congressional district data")
-                geoids = self.get_geoids(str(year), "CD")
                 for_clause = "congressional district:*"
                 in_clause = "state:06"
             case "ZC":
                 print("Fetching zip code tabulation areas data")
-                geoids = self.get_geoids(str(year), "ZC")
                 for_clause = "zip code tabulation area:*"
                 in_clause = ""
             case "LL":
                 print("Fetching state assembly legislative districts (lower) data")
-                geoids = self.get_geoids(str(year), "LL")
                 for_clause = "state legislative district (lower chamber):*"
                 in_clause = "state:06"
             case "LU":
                 print("Fetching state senate legislative districts (upper) data")
-                geoids = self.get_geoids(str(year), "LU")
                 for_clause = "state legislative district (upper chamber):*"
                 in_clause = "state:06"
             case "SE":
                 print("Fetching elementary school district data")
-                geoids = self.get_geoids(str(year), "SE")
                 for_clause = "school district (elementary):*"
                 in_clause = "state:06"
             case "SS":
                 print("Fetching secondary school district data")
-                geoids = self.get_geoids(str(year), "SS")
                 for_clause = "school district (secondary):*"
                 in_clause = "state:06"
             case "SU":
                 print("Fetching unified school district data")
-                geoids = self.get_geoids(str(year), "SU")
                 for_clause = "school district (unified):*"
                 in_clause = "state:06"
             case "UA":
                 print("Fetching urban area data")
-                geoids = self.get_geoids(str(year), "UA")
                 for_clause = "urban area:*"
                 in_clause = ""
             case "PU":
                 print("Fetching public use microdata area data")
-                geoids = self.get_geoids(str(year), "PU")
                 for_clause = "public use microdata area:*"
                 in_clause = "state:06"
             case "BG":
                 print("Fetching block group data")
-                geoids = self.get_geoids(str(year), "BG")
                 for_clause = "block group:*"
                 in_clause = ["state:06", "county:059", "tract:*"]
             case _:
                 raise ValueError(f"Unsupported geography: {geography}")
 
-        # Process each chunk and merge results
-        print(f"Processing {len(chunks)}x{chunk_size} chunk(s) of variables...")
-        for chunk in chunks:
+        # Return the clauses
+        return for_clause, in_clause
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Get ACS group index ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_acs_group_index(self, year: int) -> dict:
+        """
+        Get the ACS table (group) index for a given year.
+        Args:
+            year (int): The ACS year (e.g., 2010, 2023).
+        Returns:
+            dict: A dictionary with "variables" (variable -> group) and "groups" (group -> {"estimates": count of estimate variables, "columns": count of columns returned by a group() request}).
+        Raises:
+            requests.RequestException: If the variables.json request fails.
+        Example:
+            >>> index = get_acs_group_index(2022)
+            >>> index["groups"]["B01001"]["estimates"]
+            49
+        Notes:
+            The variable groups are read from the year's variable codebook (codebook/ocacs_cb_vars_{year}.json) when available, and the group sizes from the year's variables.json (through the response cache). The index is built once per year and kept in memory.
+        """
+        if year in self._acs_group_index:
+            return self._acs_group_index[year]
+
+        # Get the group sizes from the variables.json document of the year
+        api_url = f"{self.census_api_url}/data/{year}/acs/acs5/variables.json"
+        resp = self.cached_get(api_url, timeout = 60)
+        resp.raise_for_status()
+        raw_variables = resp.json().get("variables", {})
+
+        # A group() request returns every estimate of the table plus its attributes (margins and annotations)
+        pattern = re.compile(r'^[A-Za-z]\d.*E$')
+        variable_groups = {}
+        groups = {}
+        for var, values in raw_variables.items():
+            group = values.get("group")
+            if not pattern.match(var) or not group or group == "N/A":
+                continue
+            variable_groups[var] = group
+            attributes = [a for a in values.get("attributes", "").split(",") if a]
+            group_info = groups.setdefault(group, {"estimates": 0, "columns": 2})  # GEO_ID and NAME
+            group_info["estimates"] += 1
+            group_info["columns"] += 1 + len(attributes)
+
+        # Prefer the groups recorded in the variable codebook for that year
+        cb_vars_path = os.path.join(self.prj_dirs["codebook"], f"ocacs_cb_vars_{year}.json")
+        if os.path.exists(cb_vars_path):
+            with open(cb_vars_path, "r", encoding = "utf-8") as f:
+                cb_vars = json.load(f)
+            for var, values in cb_vars.items():
+                if values.get("group"):
+                    variable_groups[var] = values["group"]
+
+        self._acs_group_index[year] = {"variables": variable_groups, "groups": groups}
+        return self._acs_group_index[year]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Plan ACS requests ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def plan_acs_requests(self, year: int, variables: list[str], chunk_size: int = 40, rows: int = 1, min_group_share: float = 0.5, request_overhead_bytes: int = 512 * 1024, value_bytes: int = 12) -> list[list[str]]:
+        """
+        Plan the Census API requests for a list of variables, mixing whole-table group() requests and variable chunks.
+        Args:
+            year (int): The ACS year (e.g., 2010, 2023).
+            variables (list[str]): List of ACS variable codes to fetch.
+            chunk_size (int, optional): The maximum number of variables per chunked request. Defaults to 40.
+            rows (int, optional): The expected number of rows (geographies) per response. Defaults to 1.
+            min_group_share (float, optional): The minimum share of a table's estimates that must be selected before a group() request is considered. Defaults to 0.5.
+            request_overhead_bytes (int, optional): The cost of one extra request, expressed in response bytes (roughly what the connection transfers in one round trip). Defaults to 512 KB.
+            value_bytes (int, optional): The average size of one response value in bytes. Defaults to 12.
+        Returns:
+            list[list[str]]: The planned requests; single-item ["group(TABLE)"] requests first, followed by the chunks of the remaining variables.
+        Raises:
+            requests.RequestException: If the variables.json request fails.
+        Example:
+            >>> plan = plan_acs_requests(2022, process_vars, rows = 1843)
+        Notes:
+            Each plan is costed as (requests x request_overhead_bytes) + (columns x rows x value_bytes). Tables are moved to group() requests greedily, densest first, only while the estimated cost keeps dropping, so the plan never costs more than plain chunking. Unselected columns returned by group() requests are dropped when the responses are merged.
+        """
+        group_index = self.get_acs_group_index(year)
+        group_columns = group_index["groups"]
+
+        # Group the selected variables by table, preserving the variable order
+        def _group_of(var: str) -> str:
+            return group_index["variables"].get(var, var.split("_")[0])
+
+        selected: dict[str, list[str]] = {}
+        for var in variables:
+            selected.setdefault(_group_of(var), []).append(var)
+
+        # Estimated cost of a plan that fetches `group_set` with group() requests and chunks the rest
+        def _plan_cost(group_set: set) -> float:
+            chunked = sum(len(v) for g, v in selected.items() if g not in group_set)
+            n_requests = len(group_set) + math.ceil(chunked / chunk_size)
+            n_columns = sum(group_columns[g]["columns"] for g in group_set) + chunked
+            return n_requests * request_overhead_bytes + n_columns * rows * value_bytes
+
+        # Candidate tables where most of the estimates are selected, densest first
+        shares = {g: len(v) / group_columns[g]["estimates"] for g, v in selected.items() if g in group_columns}
+        candidates = sorted((g for g, share in shares.items() if share >= min_group_share), key = lambda g: (-shares[g], g))
+
+        # Greedily move tables to group() requests while the plan cost drops
+        group_set = set()
+        best_cost = chunked_cost = _plan_cost(group_set)
+        for group in candidates:
+            cost = _plan_cost(group_set | {group})
+            if cost < best_cost:
+                group_set.add(group)
+                best_cost = cost
+
+        # Build the requests
+        plan = [[f"group({g})"] for g in sorted(group_set)]
+        remaining = [var for var in variables if _group_of(var) not in group_set]
+        plan += [remaining[i : i + chunk_size] for i in range(0, len(remaining), chunk_size)]
+        print(f"Total variables: {len(variables)} planned as {len(group_set)} group request(s) and {len(plan) - len(group_set)} chunk(s) (estimated {best_cost / max(chunked_cost, 1):.0%} of the chunked cost)")
+
+        # Return the plan
+        return plan
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS request parameters ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_request_params(self, chunk: list[str], for_clause: str, in_clause: Union[str, list[str]], api_key: str) -> list:
+        """
+        Build the query parameters of a Census API data request.
+        Args:
+            chunk (list[str]): The variables to request (GEO_ID is added), or a single-item ["group(TABLE)"] request.
+            for_clause (str): The Census API 'for' clause.
+            in_clause (str | list[str]): The Census API 'in' clause(s).
+            api_key (str): The Census API key.
+        Returns:
+            list: The query parameters as a list of (name, value) tuples.
+        Raises:
+            None
+        Example:
+            >>> params = acs_request_params(["B01001_001E"], "tract:*", ["state:06", "county:059"], api_key)
+        Notes:
+            The parameters are a list of tuples so repeated keys (e.g. multiple 'in=' parameters) are preserved in the query string.
+        """
+        # group() requests already return GEO_ID
+        if chunk and chunk[0].startswith("group("):
+            get_vars = ",".join(chunk)
+        else:
             get_vars = ",".join(["GEO_ID"] + chunk)
-            # Build params as a list of tuples so repeated keys (e.g. multiple
-            # 'in=' parameters) are preserved in the query string.
-            params_list = [("get", get_vars), ("key", api_key)]
-
-            # 'for' is a single value (string)
-            if for_clause:
-                params_list.append(("for", for_clause))
-
-            # Support multiple 'in' values by repeating the 'in' parameter.
-            if in_clause:
-                if isinstance(in_clause, (list, tuple)):
-                    for val in in_clause:
-                        params_list.append(("in", val))
-                else:
-                    params_list.append(("in", in_clause))
+        params_list = [("get", get_vars), ("key", api_key)]
 
-            resp = requests.get(base_url, params = params_list, timeout = 60)
-            if resp.status_code != 200:
-                print(f"Error fetching data: {resp.status_code} {resp.text}")
-                #resp.raise_for_status()
-                if resp.status_code == 400:
-                    print("Bad Request - likely due to invalid parameters. Check if the geography exists for the specified year.")
-                    print("Returning None.")
-                    return None
+        # 'for' is a single value (string)
+        if for_clause:
+            params_list.append(("for", for_clause))
+
+        # Support multiple 'in' values by repeating the 'in' parameter.
+        if in_clause:
+            if isinstance(in_clause, (list, tuple)):
+                for val in in_clause:
+                    params_list.append(("in", val))
+            else:
+                params_list.append(("in", in_clause))
+        return params_list
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Fetch ACS request ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def fetch_acs_request(self, base_url: str, chunk: list[str], for_clause: str, in_clause: Union[str, list[str]], api_key: str, refresh: bool = False) -> tuple:
+        """
+        Send one Census API data request (through the response cache).
+        Args:
+            base_url (str): The dataset URL (e.g. f"{self.census_api_url}/data/2022/acs/acs5").
+            chunk (list[str]): The variables to request (GEO_ID is added), or a single-item ["group(TABLE)"] request.
+            for_clause (str): The Census API 'for' clause.
+            in_clause (str | list[str]): The Census API 'in' clause(s).
+            api_key (str): The Census API key.
+            refresh (bool, optional): Whether to bypass the cached response and re-download it (see cached_get). Defaults to False.
+        Returns:
+            tuple: (status code, array-of-arrays JSON data or None if the request was rejected with a 400 or 414, response time in seconds or 0.0 for a cached response).
+        Raises:
+            RuntimeError: If a response is not valid JSON.
+        Example:
+            >>> status, data, seconds = fetch_acs_request(base_url, ["B01001_001E"], "tract:*", ["state:06", "county:059"], api_key)
+        """
+        resp = self.cached_get(base_url, params = self.acs_request_params(chunk, for_clause, in_clause, api_key), timeout = 60, refresh = refresh)
+        seconds = resp.elapsed.total_seconds() if resp.elapsed is not None else 0.0
+        if resp.status_code != 200:
+            print(f"Error fetching data: {resp.status_code} {resp.text[:500]}")
+            if resp.status_code in (400, 414):
+                return resp.status_code, None, seconds
+
+        try:
+            data = resp.json()
+        except Exception as exc:
+            raise RuntimeError(f"Invalid JSON response from Census API (status={resp.status_code}): {resp.text[:500]}") from exc
+
+        return resp.status_code, data, seconds
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Fetch ACS chunks ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def fetch_acs_chunks(self, year: int, chunks: list[list[str]], for_clause: str, in_clause: Union[str, list[str]] = "", max_workers: int = 1, refresh: bool = False) -> Optional[list]:
+        """
+        Fetch the raw Census API responses for a list of variable chunks.
+        Args:
+            year (int): The ACS year (e.g., 2010, 2023).
+            chunks (list[list[str]]): The variable chunks to fetch (GEO_ID is added to each request), or single-item ["group(TABLE)"] requests.
+            for_clause (str): The Census API 'for' clause.
+            in_clause (str | list[str], optional): The Census API 'in' clause(s). Defaults to "".
+            max_workers (int, optional): The maximum number of requests in flight at once. Values of 1 or less fetch the chunks serially. Defaults to 1.
+            refresh (bool, optional): Whether to bypass the cached responses and re-download them. Defaults to False.
+        Returns:
+            list: The array-of-arrays JSON responses in the same order as `chunks`, or None if the Census API rejected a request (400 or 414).
+        Raises:
+            RuntimeError: If the CENSUS_API_KEY1 environment variable is not set, or if a response is not valid JSON.
+        Example:
+            >>> responses = fetch_acs_chunks(2020, [["B01001_001E"], ["B01001_002E"]], "tract:*", ["state:06", "county:059"], max_workers = 4)
+        Notes:
+            The responses are always returned in chunk order (not completion order), so merging them by GEO_ID is deterministic regardless of the number of workers.
+        """
+        # Get Census API key from environment variable
+        api_key = os.getenv("CENSUS_API_KEY1")
+        if not api_key:
+            raise RuntimeError("Environment variable CENSUS_API_KEY1 is not set")
+
+        # Base URL for ACS5 API
+        base_url = f"{self.census_api_url}/data/{year}/acs/acs5"
+
+        def _fetch_chunk(chunk: list[str]) -> tuple:
+            status, data, _ = self.fetch_acs_request(base_url, chunk, for_clause, in_clause, api_key, refresh = refresh)
+            return status, data
+
+        # Fetch the chunks serially, or through a bounded thread pool
+        if max_workers <= 1 or len(chunks) <= 1:
+            results = []
+            for chunk in chunks:
+                result = _fetch_chunk(chunk)
+                results.append(result)
+                if result[0] in (400, 414):
+                    break
+        else:
+            print(f"- Fetching {len(chunks)} chunk(s) with up to {max_workers} concurrent request(s)")
+            # executor.map yields results in submission order, not completion order
+            with ThreadPoolExecutor(max_workers = min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(_fetch_chunk, chunks))
+
+        # If any request was rejected, the geography is likely not available for this year
+        if any(status in (400, 414) for status, _ in results):
+            print("Bad Request - likely due to invalid parameters. Check if the geography exists for the specified year.")
+            print("Returning None.")
+            return None
+
+        # Return the responses in chunk order
+        return [data for _, data in results]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS chunk sizes ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_chunk_sizes(self, update: Optional[dict] = None) -> dict:
+        """
+        Get (and optionally update) the chunk sizes learned by the adaptive packer for each geography.
+        Args:
+            update (dict, optional): Geography codes mapped to the new learned chunk size; the sizes are saved to disk. Defaults to None.
+        Returns:
+            dict: The learned sizes, mapping each geography code to {"chunk_size": int, "updated": str}.
+        Raises:
+            None
+        Example:
+            >>> acs_chunk_sizes(update = {"BG": 32})["BG"]["chunk_size"]
+            32
+        Notes:
+            The sizes are stored in data/cache/acs_chunk_sizes.json, so later runs start from the last learned size.
+        """
+        sizes_path = os.path.join(self.prj_dirs["data_cache"], "acs_chunk_sizes.json")
+
+        # Load the learned sizes once
+        if self._acs_chunk_sizes is None:
+            self._acs_chunk_sizes = {}
+            if os.path.exists(sizes_path):
+                try:
+                    with open(sizes_path, "r", encoding = "utf-8") as f:
+                        self._acs_chunk_sizes = json.load(f)
+                except (OSError, ValueError):
+                    print("Warning: Could not read the learned ACS chunk sizes. Starting from the request limits.")
+
+        # Record and save the updated sizes
+        if update:
+            for geography, size in update.items():
+                self._acs_chunk_sizes[geography] = {"chunk_size": int(size), "updated": datetime.datetime.now().isoformat(timespec = "seconds")}
+            os.makedirs(self.prj_dirs["data_cache"], exist_ok = True)
+            tmp_path = f"{sizes_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding = "utf-8") as f:
+                json.dump(self._acs_chunk_sizes, f, indent = 4)
+            os.replace(tmp_path, sizes_path)
+
+        return self._acs_chunk_sizes
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Pack ACS chunks ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def pack_acs_chunks(self, base_url: str, variables: list[str], for_clause: str, in_clause: Union[str, list[str]], api_key: str, max_variables: Optional[int] = None) -> list[list[str]]:
+        """
+        Pack variables into requests filled up to the variable count and URL length limits.
+        Args:
+            base_url (str): The dataset URL (e.g. f"{self.census_api_url}/data/2022/acs/acs5").
+            variables (list[str]): The variables to pack, in order.
+            for_clause (str): The Census API 'for' clause.
+            in_clause (str | list[str]): The Census API 'in' clause(s).
+            api_key (str): The Census API key (its length counts toward the URL length).
+            max_variables (int, optional): The maximum number of variables per request. Defaults to self.acs_max_variables.
+        Returns:
+            list[list[str]]: The variable chunks, in variable order.
+        Raises:
+            None
+        Example:
+            >>> chunks = pack_acs_chunks(base_url, variables, "tract:*", ["state:06", "county:059"], api_key, max_variables = 30)
+        Notes:
+            A chunk is closed when adding the next variable would exceed max_variables (capped at self.acs_max_variables, i.e. 50 fields with GEO_ID) or self.acs_max_url_length characters.
+        """
+        max_variables = min(max_variables or self.acs_max_variables, self.acs_max_variables)
+
+        # Length of a request URL with an empty variable list (GEO_ID only)
+        empty_length = len(base_url) + 1 + len(urlencode(self.acs_request_params([], for_clause, in_clause, api_key)))
+
+        chunks = []
+        chunk = []
+        length = empty_length
+        for var in variables:
+            # Each variable adds an encoded comma (%2C) and its encoded name
+            var_length = 3 + len(urlencode([("", var)])) - 1
+            if chunk and (len(chunk) >= max_variables or length + var_length > self.acs_max_url_length):
+                chunks.append(chunk)
+                chunk = []
+                length = empty_length
+            chunk.append(var)
+            length += var_length
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Fetch ACS adaptive ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def fetch_acs_adaptive(self, year: int, variables: list[str], geography: str, for_clause: str, in_clause: Union[str, list[str]] = "", max_workers: int = 1, refresh: bool = False) -> Optional[list]:
+        """
+        Fetch the raw Census API responses for a list of variables with adaptively sized requests.
+        Args:
+            year (int): The ACS year (e.g., 2010, 2023).
+            variables (list[str]): The ACS variable codes to fetch.
+            geography (str): The geography code (e.g., "TR"), used to record the learned chunk size.
+            for_clause (str): The Census API 'for' clause.
+            in_clause (str | list[str], optional): The Census API 'in' clause(s). Defaults to "".
+            max_workers (int, optional): The number of requests sent at once in each wave. Defaults to 1 (serial).
+            refresh (bool, optional): Whether to bypass the cached responses and re-download them. Defaults to False.
+        Returns:
+            list: The array-of-arrays JSON responses (in request order; the retried variables of a rejected request come later), or None if the Census API rejects even the smallest requests (the geography is likely not available for the year).
+        Raises:
+            RuntimeError: If the CENSUS_API_KEY1 environment variable is not set, or if a response is not valid JSON.
+        Example:
+            >>> responses = fetch_acs_adaptive(2022, variables, "BG", "block group:*", ["state:06", "county:059", "tract:*"], max_workers = 4)
+        Notes:
+            The variables are sent in waves of up to max_workers requests, each packed up to the current chunk size and the URL length limit (see pack_acs_chunks). The chunk size starts at the size learned for the geography (or the 49-variable limit) and is adjusted after each wave: a request rejected with a 400 or 414 is split in half and retried, the size shrinks by a quarter when the slowest response of the wave exceeds self.acs_target_seconds, and it grows by a quarter when the slowest response takes less than half of it (cached responses are not timed). The final size is recorded for the geography (see acs_chunk_sizes).
+        """
+        # Get Census API key from environment variable
+        api_key = os.getenv("CENSUS_API_KEY1")
+        if not api_key:
+            raise RuntimeError("Environment variable CENSUS_API_KEY1 is not set")
+
+        # Base URL for ACS5 API
+        base_url = f"{self.census_api_url}/data/{year}/acs/acs5"
+
+        # Start from the learned size for the geography, or from the request limit
+        learned = self.acs_chunk_sizes().get(geography, {}).get("chunk_size", self.acs_max_variables)
+        size = max(self.acs_min_chunk_size, min(learned, self.acs_max_variables))
+        wave_size = max(1, max_workers)
+        print(f"- Adaptive packing of {len(variables)} variable(s), starting at {size} variable(s) per request")
+
+        pending = list(variables)
+        responses = []
+        n_requests = 0
+        while pending:
+            # Pack the next wave of requests from the front of the pending variables
+            wave = self.pack_acs_chunks(base_url, pending, for_clause, in_clause, api_key, max_variables = size)[:wave_size]
+            pending = pending[sum(len(chunk) for chunk in wave):]
+            if len(wave) > 1:
+                with ThreadPoolExecutor(max_workers = len(wave)) as executor:
+                    results = list(executor.map(lambda chunk: self.fetch_acs_request(base_url, chunk, for_clause, in_clause, api_key, refresh = refresh), wave))
+            else:
+                results = [self.fetch_acs_request(base_url, wave[0], for_clause, in_clause, api_key, refresh = refresh)]
+            n_requests += len(wave)
+
+            # Keep the successful responses and put the rejected chunks back at the front of the pending variables
+            rejected = []
+            timings = []
+            for chunk, (status, data, seconds) in zip(wave, results):
+                if status in (400, 414):
+                    if len(chunk) <= self.acs_min_chunk_size:
+                        print("Bad Request - likely due to invalid parameters. Check if the geography exists for the specified year.")
+                        print("Returning None.")
+                        return None
+                    rejected += chunk
+                    size = max(self.acs_min_chunk_size, min(size, len(chunk) // 2))
+                    continue
+                responses.append(data)
+                if seconds > 0:
+                    timings.append(seconds)
+            if rejected:
+                print(f"- Request rejected; retrying with {size} variable(s) per request")
+                pending = rejected + pending
+                continue
+
+            # Shrink after slow responses and grow after fast ones
+            if timings and max(timings) > self.acs_target_seconds:
+                size = max(self.acs_min_chunk_size, size - max(1, size // 4))
+            elif timings and max(timings) < self.acs_target_seconds / 2:
+                size = min(self.acs_max_variables, size + max(1, size // 4))
+
+        # Record the chunk size for the next run
+        self.acs_chunk_sizes(update = {geography: size})
+        print(f"- Fetched {len(variables)} variable(s) in {n_requests} request(s); learned chunk size for {geography}: {size}")
+        return responses
 
-            try:
-                data = resp.json()
-            except Exception as exc:
-                raise RuntimeError(f"Invalid JSON response from Census API (status={resp.status_code}): {resp.text[:500]}") from exc
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Merge ACS responses ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def merge_acs_responses(self, responses: list, variables: list[str], geoids: dict) -> Optional[pd.DataFrame]:
+        """
+        Merge the chunked Census API responses into a single DataFrame with one record per geography.
+        Args:
+            responses (list): The array-of-arrays JSON responses (header row first), in chunk order.
+            variables (list[str]): The ACS variable codes requested by the caller (other columns are dropped).
+            geoids (dict): The GEOID dictionary returned by get_geoids for the geography.
+        Returns:
+            pd.DataFrame: A DataFrame with a GEOID column followed by the requested variables in the order of variables (as strings), or None if no records remain after filtering.
+        Raises:
+            None
+        Example:
+            >>> df = merge_acs_responses(responses, ["B01001_001E"], self.get_geoids("2022", "TR"))
+        Notes:
+            Each response is loaded straight into a columnar frame indexed by GEO_ID and the frames are joined on that index. When a variable or a GEO_ID repeats, the first response to return the variable wins and, within a response, the last row for a GEO_ID wins. The TigerLine GEOID filter is a hashed isin over the index. The columns follow the order of variables, whatever the order of the responses (see fetch_acs_adaptive), so the content hash of the data does not depend on the requests rejected in a run.
+        """
+        # Load each response into a frame indexed by GEO_ID, keeping only the requested variables
+        allowed = set(variables)
+        seen = set()
+        frames = []
+        for data in responses:
             if not data or len(data) < 2:
                 continue
+            frame = pd.DataFrame(data[1:], columns = data[0])
+            frame = frame.loc[:, ~frame.columns.duplicated()]
+            if "GEO_ID" not in frame.columns:
+                continue
+            keep = [col for col in frame.columns if col in allowed and col not in seen]
+            seen.update(keep)
+            # Skip malformed rows and keep the last row of any repeated GEO_ID
+            frame = frame.dropna(subset = ["GEO_ID"]).drop_duplicates(subset = "GEO_ID", keep = "last")
+            frames.append(frame.set_index("GEO_ID")[keep])
+        if not frames:
+            return None
 
-            headers = data[0]
-            for row in data[1:]:
-                rec = dict(zip(headers, row))
-                geo_id = rec.get("GEO_ID")
-                if geo_id is None:
-                    # skip malformed row
-                    continue
-                if geo_id not in merged:
-                    merged[geo_id] = {}
-                # Only keep GEO_ID and variables requested by the caller
-                allowed = set(variables)
-                filtered = {k: v for k, v in rec.items() if k == "GEO_ID" or k in allowed}
-                merged[geo_id].update(filtered)
-        
-        # Get the merged response list
-        print("Merging chunk(s) and filtering results...")
-        merged_list = list(merged.values())
-        len_merged = len(merged_list)
+        # Join the chunk frames on the GEO_ID index (outer join, in order of first appearance) and order the columns as the variables
+        df = pd.concat(frames, axis = 1, join = "outer", sort = False)
+        df = df[[var for var in dict.fromkeys(variables) if var in seen]]
+        len_merged = len(df)
         len_geoids = len(geoids["values"])
-
         if len_merged > len_geoids:
             print(f"- The results have more records ({len_merged}) than the TigerLine geodatabase ({len_geoids}). Filtering results.")
         elif len_merged < len_geoids:
             print(f"- The results have fewer records ({len_merged}) than the TigerLine geodatabase ({len_geoids}). Only the available records will be returned.")
 
-        # If any of the merged_ids are not in the geoids["values"], remove it from the merged_list
-        final_list = [rec for rec in merged_list if rec["GEO_ID"].split("US")[-1] in geoids["values"]]
+        # Count the variables returned for each record (a GEO_ID missing from a chunk has fewer)
+        raw_counts = pd.concat([pd.Series(frame.shape[1], index = frame.index) for frame in frames], axis = 1, sort = False).sum(axis = 1).reindex(df.index)
 
-        # Count of final_list and geoids
-        len_final = len(final_list)
-        len_geoids = len(geoids["values"])
+        # Keep only the geographies in the TigerLine geodatabase (GEOID is the part of GEO_ID after 'US')
+        geoid_index = df.index.str.split("US").str[-1]
+        in_tl = geoid_index.isin(geoids["values"])
+        df = df[in_tl]
+        raw_counts = raw_counts[in_tl]
+        df.index = geoid_index[in_tl]
+        df.index.name = "GEOID"
+        if df.shape[0] == 0:
+            return None
 
-        # Get counts of variables in each record (excluding GEO_ID)
-        raw_counts =[len(d) - 1 for d in final_list]
         # Make sure all counts are the same
-        if len(set(raw_counts)) == 1:
-            print(f"Response has {len_final} records (of {len_geoids} in the TigerLine geodatabase) with {raw_counts[0]} variables each.")
-        elif len(set(raw_counts)) > 1:
-            print("Warning: Inconsistent variable counts in final_list")
+        if raw_counts.nunique() == 1:
+            print(f"Response has {df.shape[0]} records (of {len_geoids} in the TigerLine geodatabase) with {int(raw_counts.iloc[0])} variables each.")
+        elif raw_counts.nunique() > 1:
+            print("Warning: Inconsistent variable counts in the merged records")
 
-        # Convert the results to a DataFrame
-        df = pd.DataFrame(final_list)
-        
-        # Replace the value of the GEO_ID column with only the part after 'US' and rename the column to just the GEOID
-        # Check if GEO_ID is part of the DataFrame columns
-        if "GEO_ID" in df.columns:
-            # get the column name index
-            geo_id_index = df.columns.get_loc("GEO_ID")
-            # Use the index to update the column values
-            df.iloc[:, geo_id_index] = df.iloc[:, geo_id_index].str.split("US").str[-1]
-            # Rename the column by index
-            df.rename(columns={df.columns[geo_id_index]: "GEOID"}, inplace = True)
-            
-        if df.shape[0] == 0:
-            print("No records found after filtering. Returning None.")
-            return None
+        # Return the merged DataFrame with GEOID as the first column
+        return df.reset_index()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Get ACS dtype index ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_acs_dtype_index(self, year: int) -> dict:
+        """
+        Get the variable type index (variable code to "int", "float" or "str") for an ACS year.
+        Args:
+            year (int): The ACS year (e.g., 2010, 2023).
+        Returns:
+            dict: A dictionary mapping each variable code in the acs_variables_{year}.json codebook to its type.
+        Raises:
+            None
+        Example:
+            >>> dtype_index = get_acs_dtype_index(2022)
+            >>> dtype_index["B01001_001E"]
+            'int'
+        Notes:
+            The codebook is read and flattened once per year; later calls return the in-memory index. An empty index is returned (and not memoized) if the codebook does not exist yet.
+        """
+        # Return the in-memory index if it has already been built for the year
+        if year in self._acs_dtype_index:
+            return self._acs_dtype_index[year]
 
-        # Get the acs variable codebook path for that year
-        cb_acs_path = os.path.join(self.prj_dirs["codebook"], f"acs_variables_{year}.json")
         # Load the ACS variables codebook for that year
-        cb_acs = {}
-        if os.path.exists(cb_acs_path):
-            with open(cb_acs_path, "r", encoding = "utf-8") as f:
-                cb_acs = json.load(f)
-        
-        # For each column in the dataframe (except GEOID), get the column type from the codebook and convert the column to that type
+        cb_acs_path = os.path.join(self.prj_dirs["codebook"], f"acs_variables_{year}.json")
+        if not os.path.exists(cb_acs_path):
+            print(f"Warning: ACS variables codebook not found for year {year}")
+            return {}
+        with open(cb_acs_path, "r", encoding = "utf-8") as f:
+            cb_acs = json.load(f)
+
+        # Flatten the categories into a single variable to type dictionary (the first category listing a variable wins)
+        dtype_index = {}
+        for vars_dict in cb_acs.values():
+            for var, values in vars_dict.items():
+                dtype_index.setdefault(var, values.get("type"))
+
+        self._acs_dtype_index[year] = dtype_index
+        return dtype_index
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Coerce ACS dtypes ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def coerce_acs_dtypes(self, df: pd.DataFrame, year: int) -> pd.DataFrame:
+        """
+        Convert the string columns of a merged ACS DataFrame to the types listed in the codebook for the year.
+        Args:
+            df (pd.DataFrame): The merged ACS DataFrame (GEOID column followed by the variables, as strings).
+            year (int): The ACS year (e.g., 2010, 2023).
+        Returns:
+            pd.DataFrame: The DataFrame with the same columns, in the same order, converted to their codebook types.
+        Raises:
+            None
+        Example:
+            >>> df = coerce_acs_dtypes(df, 2022)
+        Notes:
+            All "int" columns are parsed in one vectorized pass and all "float" columns in another, and the Census annotation values (self.acs_sentinels, e.g. -666666666) become missing values in the same pass. Each codebook type maps to one fixed type, whatever the values of the frame, so a variable has the same field type in every geography and year: int columns become Int64 (fractional values in an int column are rounded, with a warning), float columns float64 and str columns string.
+        """
+        # Split the columns by codebook type
+        dtype_index = self.get_acs_dtype_index(year)
+        columns = {"int": [], "float": [], "str": []}
+        missing = []
         for col in df.columns:
             if col == "GEOID":
                 continue
-            # Find the category and variable in the codebook
-            found = False
-            for vars_dict in cb_acs.values():
-                if col in vars_dict:
-                    var_type = vars_dict[col]["type"]
-                    found = True
-                    break
-            if found:
-                if var_type == "int":
-                    df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-                elif var_type == "float":
-                    df[col] = pd.to_numeric(df[col], errors="coerce").astype("float")
-                elif var_type == "str":
-                    df[col] = df[col].astype("string")
+            var_type = dtype_index.get(col)
+            if var_type in columns:
+                columns[var_type].append(col)
             else:
-                print(f"Warning: Variable {col} not found in codebook for year {year}")
+                missing.append(col)
+        if missing:
+            print(f"Warning: {len(missing)} variable(s) not found in codebook for year {year}: {missing}")
+
+        def _to_numeric_block(cols: list[str]) -> np.ndarray:
+            # Parse the whole block at once and blank out the Census annotation values
+            values = pd.to_numeric(df[cols].to_numpy().ravel(), errors = "coerce").astype("float64").reshape(len(df), len(cols))
+            values[np.isin(values, self.acs_sentinels)] = np.nan
+            return values
+
+        converted = {}
+
+        # Integer columns: one parse for the block, then Int64 for every column
+        if columns["int"]:
+            values = _to_numeric_block(columns["int"])
+            fractional = ~np.all(np.isnan(values) | (values == np.floor(values)), axis = 0)
+            if fractional.any():
+                print(f"Warning: {int(fractional.sum())} int variable(s) with fractional values rounded for year {year}: {[col for col, frac in zip(columns['int'], fractional) if frac]}")
+                values = np.round(values)
+            block = pd.DataFrame(values, index = df.index, columns = columns["int"]).astype("Int64")
+            converted.update({col: series for col, series in block.items()})
+
+        # Float columns: one parse for the block
+        if columns["float"]:
+            block = pd.DataFrame(_to_numeric_block(columns["float"]), index = df.index, columns = columns["float"])
+            converted.update({col: series for col, series in block.items()})
+
+        # String columns
+        if columns["str"]:
+            converted.update({col: series for col, series in df[columns["str"]].astype("string").items()})
+
+        # Rebuild the DataFrame in the original column order (unlisted columns are left unchanged)
+        return pd.DataFrame({col: converted.get(col, df[col]) for col in df.columns}, index = df.index)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Fetch ACS tables ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def fetch_acs_tables(self, year: int, variables: list[str], geography: str = "CO", max_workers: int = 1, strategy: str = "chunks", refresh: bool = False, geoids: Optional[dict] = None) -> pd.DataFrame:
+        """
+        Fetch ACS data for a given year and list of variables.
+        This function will chunk requests when `variables` is large and merge
+        results by `GEOID` so the caller receives a single record per geography
+        with all requested variables.
+        Args:
+            year (int): The ACS year (e.g., 2010, 2023).
+            variables (List[str]): List of ACS variable codes to fetch.
+            geography (str): The geography type (e.g., "CO" for county, "TR" for tract). Defaults to "CO".
+            max_workers (int, optional): The maximum number of chunk requests in flight at once. Defaults to 1 (serial).
+            strategy (str, optional): The request strategy: "chunks" fetches fixed 40-variable chunks; "groups" fetches densely selected tables with group() requests and chunks the rest (see plan_acs_requests); "adaptive" fills each request up to the API limits and adjusts the chunk size to the server response times, starting from the size learned for the geography (see fetch_acs_adaptive). Defaults to "chunks".
+            refresh (bool, optional): Whether to bypass the cached Census API responses and re-download them. Defaults to False.
+            geoids (dict, optional): The GEOID index entry of the geography (see get_geoids), loaded by the caller so this function makes no arcpy calls (e.g. on the fetch thread of run_acs_pipeline). Defaults to None (loaded with get_geoids).
+        Returns:
+            DataFrame containing the requested ACS data for each geography.
+        Raises:
+            RuntimeError: If the CENSUS_API_KEY1 environment variable is not set.
+            ValueError: If the geography or the strategy is not supported.
+        Example:
+            >>> df_acs = fetch_acs_tables(2020, ["B01001_001E", "B01001_002E"], geography = "TR", max_workers = 4, strategy = "groups")
+        Notes:
+            This function fetches ACS data from the Census API, handling large variable
+            requests by chunking them and merging results based on GEOID.
+        """
+        # Get Census API key from environment variable
+        api_key = os.getenv("CENSUS_API_KEY1")
+        if not api_key:
+            raise RuntimeError("Environment variable CENSUS_API_KEY1 is not set")
+
+        # Validate variables parameter
+        if not isinstance(variables, (list, tuple)):
+            raise TypeError("variables must be a list or tuple of ACS variable codes")
+
+        # Census API accepts a maximum of 50 fields per request including GEOID.
+        # Ensure we chunk variables so that each request has at most 49 variables
+        # plus the GEOID field.
+        chunk_size = 40
+
+        # Prepare chunks (exclude GEOID from chunking)
+        def _chunk_list_local(items: list[str], size: int) -> list[list[str]]:
+            return [items[i : i + size] for i in range(0, len(items), size)]
+
+        # Determine for_clause and in_clause based on geography
+        print(f"Fetching data for geography: {geography}")
+        for_clause, in_clause = self.get_acs_geography_clauses(geography)
+        if geoids is None:
+            geoids = self.get_geoids(str(year), geography)
+
+        # Get the chunks (fixed-size variable chunks, or a plan mixing group() requests and chunks)
+        match strategy:
+            case "chunks":
+                chunks = _chunk_list_local(list(variables), chunk_size)
+                if len(chunks) > 1:
+                    print(f"Total variables: {len(variables)} split into {len(chunks)} chunk(s)")
+            case "groups":
+                chunks = self.plan_acs_requests(year, list(variables), chunk_size = chunk_size, rows = len(geoids["values"]))
+            case "adaptive":
+                chunks = None
+            case _:
+                raise ValueError(f"Unsupported fetch strategy: {strategy}")
+
+        # Fetch each chunk (in chunk order), or let the adaptive packer size the requests
+        if chunks is None:
+            responses = self.fetch_acs_adaptive(year, list(variables), geography, for_clause, in_clause, max_workers = max_workers, refresh = refresh)
+        else:
+            print(f"Processing {len(chunks)} request(s) of up to {chunk_size} variables or one table each...")
+            responses = self.fetch_acs_chunks(year, chunks, for_clause, in_clause, max_workers = max_workers, refresh = refresh)
+        if responses is None:
+            return None
+
+        # Merge the chunk results and keep the geographies in the TigerLine geodatabase
+        print("Merging chunk(s) and filtering results...")
+        df = self.merge_acs_responses(responses, variables, geoids)
+        if df is None:
+            print("No records found after filtering. Returning None.")
+            return None
+
+        # Convert the columns to their codebook types (batched by type, Census annotation values to missing)
+        df = self.coerce_acs_dtypes(df, year)
 
         # Log the final DataFrame shape
         print(f"Returning DataFrame with {df.shape[0]} rows and {df.shape[1]} columns.")
@@ -4277,12 +5929,13 @@ class OCACS(OCGD):
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: TL to SDF ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def tl_to_sdf(self, year: int, geography: str):
+    def tl_to_sdf(self, year: int, geography: str, cache: bool = True):
         """
         Convert TL tables to spatial data frames for a given year and geography.
         Args:
             year (int): The ACS year (e.g., 2010, 2015, 2020).
             geography (str): The geography type (e.g., "CO", "CS", "PL", etc.).
+            cache (bool, optional): Whether to keep the converted frame in the cache for later conversions (a cached frame is returned either way). Defaults to True.
         Returns:
             pd.DataFrame: A spatial data frame containing the TL data for the specified year and geography.
         Raises:
@@ -4290,13 +5943,20 @@ class OCACS(OCGD):
         Example:
             >>> tl_sdf = tl_to_sdf(2010, "CO")
         Note:
-            Ensure that the TL geodatabase for the specified year exists in the GIS directory.
+            Ensure that the TL geodatabase for the specified year exists in the GIS directory. The spatial data frames are kept in an in-memory LRU cache (self.sdf_cache) keyed by the geodatabase, the feature class and the geodatabase modification time, so repeated conversions in a run are free.
         """
-        print(f"Converting TigerLine feature class to spatial data frame for year: {year} and geography: {geography}...")
-
         # Set the TL geodatabase path
         octl_gdb_path = os.path.join(self.prj_dirs["gis"], f"tl{year}.gdb")
 
+        # Return the cached spatial data frame if the geodatabase has not changed
+        cache_key = (octl_gdb_path, geography, self.gdb_modified_time(octl_gdb_path))
+        tl_sdf = self.sdf_cache.get(cache_key)
+        if tl_sdf is not None:
+            print(f"Using the cached spatial data frame for year: {year} and geography: {geography}")
+            return tl_sdf
+
+        print(f"Converting TigerLine feature class to spatial data frame for year: {year} and geography: {geography}...")
+
         try:
             arcpy.env.workspace = octl_gdb_path
             arcpy.env.overwriteOutput = True
@@ -4306,26 +5966,354 @@ class OCACS(OCGD):
         finally:
             arcpy.env.workspace = os.getcwd()
 
-        # Return the spatial data frame
+        # Cache and return the spatial data frame
+        if cache:
+            self.sdf_cache.put(cache_key, tl_sdf)
         return tl_sdf
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    ## fx: Process ACS data ----
+    ## fx: Write ACS feature class ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def process_acs_data(self, process_year: list[int] = None, all_years: bool = False):
+    def write_acs_feature_class(self, tl_sdf: pd.DataFrame, acs_df: pd.DataFrame, fd_path: str, fc_name: str, cb_acs: dict) -> str:
         """
-        Process ACS data for all years, datasets, and geographies.
+        Join ACS data to a TigerLine spatial data frame and write it as a feature class with the codebook aliases.
+        Args:
+            tl_sdf (pd.DataFrame): The TigerLine spatial data frame of the geography (see tl_to_sdf); it is not modified.
+            acs_df (pd.DataFrame): The ACS data of the geography (GEOID column followed by the variables).
+            fd_path (str): The path of the output feature dataset.
+            fc_name (str): The output feature class name (e.g. "TRD").
+            cb_acs (dict): The ACS variables codebook of the year (category to variables, with aliases).
+        Returns:
+            str: The path of the feature class.
+        Raises:
+            None
+        Example:
+            >>> fc_path = write_acs_feature_class(tl_sdf, acs_df, os.path.join(gdb_path, "Demographic"), "TRD", cb_acs)
+        """
+        # Get the name of the tl_sdf column that contains the GEOID values
+        tl_geoid_col = [col for col in tl_sdf.columns if "GEOID" in col][0]
+        acs_geoid_col = [col for col in acs_df.columns if "GEOID" in col][0]
+
+        # Merge the ACS variables from acs_df (GEOID) to the tl_sdf (GEOID10)
+        out_sdf = tl_sdf.merge(acs_df, left_on = tl_geoid_col, right_on = acs_geoid_col, how="left")
+        print(f"- Merged ACS data with TL SDF for feature class: {fc_name}")
+
+        # Define the output feature class path
+        fc_path = os.path.join(fd_path, fc_name)
+
+        # Set the arcpy environment to the feature dataset
+        arcpy.env.workspace = fd_path
+        arcpy.env.overwriteOutput = True
+
+        # Convert the merged DataFrame to a feature class in the geodatabase
+        out_sdf.spatial.to_featureclass(location = fc_path, overwrite = True, has_z = None, has_m = None, sanitize_columns = False)
+        print(f"- Converted merged DataFrame to feature class: {fc_name}")
+
+        # Set field aliases based on the codebook (the first category listing a variable wins)
+        print(f"- Setting field aliases for feature class: {fc_name}")
+        aliases = {}
+        for vars_dict in cb_acs.values():
+            for var, values in vars_dict.items():
+                aliases.setdefault(var, values["alias"])
+        for field in arcpy.ListFields(fc_path):
+            if field.name in aliases:
+                # Set the field alias
+                arcpy.AlterField_management(fc_path, field.name, new_field_alias = aliases[field.name])
+                print(f"  - Set alias for field {field.name} to {aliases[field.name]}")
+
+        # Return the feature class path
+        return fc_path
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS manifest ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_manifest(self, year: int, manifest: Optional[dict] = None) -> dict:
+        """
+        Load (or save) the checkpoint manifest of the ACS processing of a year.
         Args:
+            year (int): The ACS year.
+            manifest (dict, optional): The manifest to save. If None, the saved manifest is loaded. Defaults to None.
+        Returns:
+            dict: The manifest, {"year": int, "units": {"{dataset}/{geography}": entry}}, where each entry records the feature class ("fc"), its row count ("rows"), the content hash of the ACS data written to it ("hash"), the inputs it was built from ("inputs") and the completion time ("completed").
+        Raises:
+            None
+        Example:
+            >>> manifest = acs_manifest(2022)
+            >>> manifest["units"]["Demographic/TR"]["rows"]
+            614
+        Notes:
+            The manifest is stored in data/cache/acs_manifest_{year}.json and is rewritten (atomically) after each completed unit, so an interrupted run can be resumed (see process_acs_data).
+        """
+        manifest_path = os.path.join(self.prj_dirs["data_cache"], f"acs_manifest_{year}.json")
+
+        # Save the manifest
+        if manifest is not None:
+            os.makedirs(self.prj_dirs["data_cache"], exist_ok = True)
+            tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding = "utf-8") as f:
+                json.dump(manifest, f, indent = 4)
+            os.replace(tmp_path, manifest_path)
+            return manifest
+
+        # Load the manifest (a missing or unreadable manifest has no completed units)
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r", encoding = "utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                print(f"Warning: Could not read the ACS manifest of {year}. Rebuilding all the units.")
+        return {"year": year, "units": {}}
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS content hash ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_content_hash(self, data: Any) -> str:
+        """
+        Get a content hash of ACS data or of the inputs of an ACS output.
+        Args:
+            data (Any): A DataFrame (hashed by its columns and values) or any JSON-serializable object (hashed by its sorted JSON form).
+        Returns:
+            str: The SHA-256 hex digest.
+        Raises:
             None
+        Example:
+            >>> acs_content_hash(acs_df[["GEOID", "B01001_001E"]])
+        """
+        digest = hashlib.sha256()
+        if isinstance(data, pd.DataFrame):
+            digest.update(json.dumps([str(col) for col in data.columns]).encode("utf-8"))
+            digest.update(pd.util.hash_pandas_object(data, index = False).values.tobytes())
+        else:
+            digest.update(json.dumps(data, sort_keys = True, default = str).encode("utf-8"))
+        return digest.hexdigest()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: ACS unit status ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def acs_unit_status(self, manifest: dict, unit: str, fc_path: str, inputs: dict) -> Optional[str]:
+        """
+        Check whether a (dataset, geography) unit of the ACS processing is complete and current.
+        Args:
+            manifest (dict): The checkpoint manifest of the year (see acs_manifest).
+            unit (str): The unit key ("{dataset}/{geography}").
+            fc_path (str): The path of the unit's output feature class.
+            inputs (dict): The current inputs of the unit (compared to the recorded ones).
         Returns:
+            str | None: None if the unit is recorded with the same inputs and its feature class exists with the recorded row count; otherwise the reason to rebuild it ("not built", "feature class missing", "row count changed" or "changed: " and the changed inputs).
+        Raises:
             None
+        Example:
+            >>> acs_unit_status(manifest, "Demographic/TR", os.path.join(gdb_path, "Demographic", "TRD"), inputs)
+            'changed: tl_mtime'
+        """
+        entry = manifest["units"].get(unit)
+        if entry is None:
+            return "not built"
+        changed = [key for key in inputs if entry.get("inputs", {}).get(key) != inputs[key]]
+        if changed:
+            return f"changed: {', '.join(changed)}"
+        if not arcpy.Exists(fc_path):
+            return "feature class missing"
+        if int(arcpy.GetCount_management(fc_path)[0]) != entry.get("rows"):
+            return "row count changed"
+        return None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Record ACS unit ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def record_acs_unit(self, manifest: dict, unit: str, fc_path: str, acs_df: pd.DataFrame, inputs: dict) -> dict:
+        """
+        Record a completed (dataset, geography) unit in the checkpoint manifest and save it.
+        Args:
+            manifest (dict): The checkpoint manifest of the year (see acs_manifest).
+            unit (str): The unit key ("{dataset}/{geography}").
+            fc_path (str): The path of the written feature class.
+            acs_df (pd.DataFrame): The ACS data written to the feature class.
+            inputs (dict): The inputs the unit was built from.
+        Returns:
+            dict: The manifest entry of the unit.
         Raises:
             None
         Example:
-            >>> process_acs_data()
+            >>> record_acs_unit(manifest, "Demographic/TR", fc_path, acs_df, inputs)
+        """
+        entry = {
+            "fc": fc_path,
+            "rows": int(arcpy.GetCount_management(fc_path)[0]),
+            "hash": self.acs_content_hash(acs_df),
+            "inputs": inputs,
+            "completed": datetime.datetime.now().isoformat(timespec = "seconds")
+        }
+        manifest["units"][unit] = entry
+        self.acs_manifest(manifest["year"], manifest)
+        return entry
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Run ACS pipeline ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def run_acs_pipeline(self, year: int, tasks: list, max_workers: int = 1, strategy: str = "chunks", prefetch: int = 1, refresh: bool = False, geometry: bool = True) -> dict:
+        """
+        Run the geometry, fetch and write stages of the ACS processing as a pipeline.
+        Args:
+            year (int): The ACS year.
+            tasks (list): The (geography, variables, write) or (geography, variables, write, fallback) tasks in processing order, where write(tl_sdf, acs_df) merges and writes the feature class(es) of the task, and fallback is a list of variable groups fetched one at a time if the Census API rejects the request of all the variables.
+            max_workers (int, optional): The maximum number of Census API requests in flight at once (see fetch_acs_tables). Defaults to 1.
+            strategy (str, optional): The Census API request strategy (see fetch_acs_tables). Defaults to "chunks".
+            prefetch (int, optional): The number of tasks whose Census data may be fetched ahead of the task being written (the size of the queue between the stages). 0 runs the stages in sequence. Defaults to 1.
+            refresh (bool, optional): Whether to bypass the cached Census API responses and re-download them (see fetch_acs_tables). Defaults to False.
+            geometry (bool, optional): Whether to load the TigerLine geometry of each task; if False, write receives None instead of a spatial data frame. Defaults to True.
+        Returns:
+            dict: The busy and idle seconds of each stage ("geometry", "fetch", "write"), the seconds the fetch stage waited on a full queue and the write stage on an empty one ("queue": {"full", "empty"}) and the wall time ("wall").
+        Raises:
+            Exception: Any exception raised by a stage is raised again on the calling thread.
+        Example:
+            >>> stages = run_acs_pipeline(2022, [("CO", variables, write)], max_workers = 4, prefetch = 2)
+        Notes:
+            A background thread fetches the Census data of the next task(s) while the calling thread loads the TigerLine geometry and writes the current task, so the HTTP waits overlap the feature class writes. All the arcpy work (geometry, GEOID index, writes) stays on the calling thread: the GEOID index entries are loaded before the fetch thread starts and passed to fetch_acs_tables, so the fetch stage never revalidates them (see get_geoids) and only runs HTTP requests and pandas. A full queue means the writes are the bottleneck; an empty queue means the Census API is. When the request of a task with fallback groups is rejected (fetch_acs_tables returns None, e.g. one variable is not available at the geography), each group is fetched separately and the frames of the groups that succeed are joined on GEOID, so one rejected variable only drops the group(s) that contain it (listed in acs_df.attrs["rejected"]).
+        """
+        tasks = [(task[0], task[1], task[2], task[3] if len(task) > 3 else None) for task in tasks]
+        stages = {stage: {"busy": 0.0, "idle": 0.0} for stage in ["geometry", "fetch", "write"]}
+        stages["queue"] = {"full": 0.0, "empty": 0.0}
+        start = time.perf_counter()
+
+        # Load the GEOID index entry of every geography here and hand it to the fetch stage, so the fetch thread never calls arcpy
+        geoid_entries = {geo: self.get_geoids(str(year), geo) for geo in dict.fromkeys(task[0] for task in tasks)}
+
+        def _fetch(geo, variables, fallback):
+            t0 = time.perf_counter()
+            acs_df = self.fetch_acs_tables(year = year, variables = variables, geography = geo, max_workers = max_workers, strategy = strategy, refresh = refresh, geoids = geoid_entries[geo])
+            if acs_df is None and fallback:
+                # Fetch the variable groups one at a time and join the ones returned (a variable shared by groups is kept once)
+                print(f"- The request of {len(variables)} variables for geography {geo} was rejected; fetching its {len(fallback)} variable group(s) separately")
+                rejected = []
+                for group in fallback:
+                    group_df = self.fetch_acs_tables(year = year, variables = group, geography = geo, max_workers = max_workers, strategy = strategy, refresh = refresh, geoids = geoid_entries[geo])
+                    if group_df is None:
+                        print(f"- No ACS data returned for {len(group)} variable(s) of geography {geo} ({', '.join(group[:3])}{', ...' if len(group) > 3 else ''})")
+                        rejected.append(group)
+                    elif acs_df is None:
+                        acs_df = group_df
+                    else:
+                        acs_df = acs_df.merge(group_df[["GEOID"] + [col for col in group_df.columns if col not in acs_df.columns]], on = "GEOID", how = "outer")
+                # The rejected groups are recorded on the frame, so the write stage can skip their outputs
+                if acs_df is not None:
+                    acs_df.attrs["rejected"] = rejected
+            stages["fetch"]["busy"] += time.perf_counter() - t0
+            return acs_df
+
+        # Only the geometries loaded by more than one task are worth caching (the per-dataset mode)
+        geo_tasks = Counter(task[0] for task in tasks)
+
+        def _geometry(geo):
+            if not geometry:
+                return None
+            t0 = time.perf_counter()
+            tl_sdf = self.tl_to_sdf(year, geo, cache = geo_tasks[geo] > 1)
+            print(f"- Converted TL to SDF for geography: {geo}")
+            stages["geometry"]["busy"] += time.perf_counter() - t0
+            return tl_sdf
+
+        def _write(geo, write, tl_sdf, acs_df):
+            # Write the feature class(es) of the task
+            t1 = time.perf_counter()
+            if acs_df is None:
+                print(f"- No ACS data returned for geography: {geo}. Skipping...")
+            else:
+                print(f"- Fetched ACS tables for geography: {geo} with {len(acs_df)} records")
+                write(tl_sdf, acs_df)
+            stages["write"]["busy"] += time.perf_counter() - t1
+
+        if prefetch <= 0:
+            # Sequential stages
+            for geo, variables, write, fallback in tasks:
+                print(f"\nProcessing {year} geography: {geo}")
+                _write(geo, write, _geometry(geo), _fetch(geo, variables, fallback))
+        else:
+            # Bounded queue between the fetch thread and the calling thread
+            results = queue.Queue(maxsize = prefetch)
+            stop = threading.Event()
+
+            def _producer():
+                for geo, variables, _, fallback in tasks:
+                    try:
+                        item = (geo, _fetch(geo, variables, fallback), None)
+                    except Exception as e:
+                        item = (geo, None, e)
+                    # Wait for room in the queue (or for the calling thread to give up)
+                    t0 = time.perf_counter()
+                    while not stop.is_set():
+                        try:
+                            results.put(item, timeout = 0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    stages["queue"]["full"] += time.perf_counter() - t0
+                    if stop.is_set() or item[2] is not None:
+                        return
+
+            producer = threading.Thread(target = _producer, name = f"acs-prefetch-{year}", daemon = True)
+            producer.start()
+            try:
+                for geo, _, write, _ in tasks:
+                    print(f"\nProcessing {year} geography: {geo}")
+                    tl_sdf = _geometry(geo)
+                    # Wait for the Census data of the task
+                    t0 = time.perf_counter()
+                    _, acs_df, error = results.get()
+                    stages["queue"]["empty"] += time.perf_counter() - t0
+                    if error is not None:
+                        raise error
+                    _write(geo, write, tl_sdf, acs_df)
+            finally:
+                stop.set()
+                producer.join()
+
+        # A stage is idle whenever it is not busy
+        wall = time.perf_counter() - start
+        for stage in ["geometry", "fetch", "write"]:
+            stages[stage]["idle"] = max(0.0, wall - stages[stage]["busy"])
+        stages["wall"] = wall
+
+        # Report the stage times
+        print(f"\nACS pipeline for {year} ({len(tasks)} task(s), prefetch {prefetch}): {wall:.1f}s")
+        for stage in ["geometry", "fetch", "write"]:
+            busy = stages[stage]["busy"]
+            print(f"- {stage:<9} busy {busy:8.1f}s  idle {stages[stage]['idle']:8.1f}s  ({100 * busy / wall if wall > 0 else 0:.0f}% of the wall time)")
+        print(f"- queue     full {stages['queue']['full']:8.1f}s (waiting on the writes)  empty {stages['queue']['empty']:8.1f}s (waiting on the Census API)")
+        return stages
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Process ACS data ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def process_acs_data(self, process_year: list[int] = None, all_years: bool = False, coalesce: bool = True, max_workers: int = 1, strategy: str = "chunks", prefetch: int = 1, resume: bool = False, incremental: bool = False, dry_run: bool = False) -> dict:
+        """
+        Process ACS data for all years, datasets, and geographies.
+        Args:
+            process_year (int | list[int], optional): The year(s) to process. Defaults to None.
+            all_years (bool, optional): Whether to process all the available ACS5 years. Defaults to False.
+            coalesce (bool, optional): Whether to load each geography and fetch its variables once for all four datasets, then split the result into the per-dataset feature classes. If False, each dataset and geography pair is loaded and fetched separately. Defaults to True.
+            max_workers (int, optional): The maximum number of Census API requests in flight at once (see fetch_acs_tables). Defaults to 1.
+            strategy (str, optional): The Census API request strategy (see fetch_acs_tables). Defaults to "chunks".
+            prefetch (int, optional): The number of geographies whose Census data is fetched ahead of the one being written (see run_acs_pipeline). 0 runs the stages in sequence. Defaults to 1.
+            resume (bool, optional): Whether to keep the existing geodatabase and skip the (dataset, geography) units completed by an earlier run. If False, the geodatabase is recreated. Defaults to False.
+            incremental (bool, optional): Whether to keep the existing geodatabase and rebuild only the units whose upstream inputs changed: the units that a resumed run would rebuild, and the units whose re-downloaded Census data no longer matches the recorded content hash. Defaults to False.
+            dry_run (bool, optional): Whether to only report the units an incremental run would rebuild (implies incremental; nothing is written). Defaults to False.
+        Returns:
+            dict: The refresh report of each year: a list of {"unit", "action" ("rebuild" or "unchanged"), "reason"} entries for the units that were considered.
+        Raises:
+            ValueError: If neither process_year nor all_years is specified.
+        Example:
+            >>> process_acs_data(process_year = 2022, max_workers = 4, strategy = "groups", prefetch = 2)
+            >>> report = process_acs_data(all_years = True, dry_run = True)
         Notes:
-            This function processes ACS data by creating geodatabases for each year, datasets, and geographies.
+            This function processes ACS data by creating geodatabases for each year, datasets, and geographies. In the coalesced mode the TigerLine geometry, the GEOID scan and the request planning run once per geography instead of once per dataset and geography. The Census requests of the next geography run while the current one is written, and the busy and idle time of each stage is reported for each year. Every written feature class is recorded in a checkpoint manifest (see acs_manifest) with the content hash of its data and the inputs it was built from (the dataset variables and aliases, the variables codebook version and the TigerLine geodatabase modification time); with resume = True a unit is only rebuilt if it is missing, incomplete or its inputs changed. An incremental run also re-downloads the Census data of the remaining units (bypassing the response cache) and rebuilds those whose data hash changed, so the published vintages that did not change are not rewritten.
         """
 
         # Determine the years to process
@@ -4345,6 +6333,11 @@ class OCACS(OCGD):
         else:
             raise ValueError("Either year must be specified or all_years must be True.")
 
+        # An incremental run keeps the geodatabases, and a dry run is an incremental run that writes nothing
+        incremental = incremental or dry_run
+        resume = resume or incremental
+        refresh_report = {}
+
         # Loop through each year
         for year in years:
             print(f"\nProcessing ACS year: {year}")
@@ -4359,10 +6352,14 @@ class OCACS(OCGD):
                 with open(cb_acs_path, "r", encoding = "utf-8") as f:
                     cb_acs = json.load(f)
             
-            # Check if the geodatabase already exists; if so, delete it before creating a new one
-            if not arcpy.Exists(gdb_path):
+            # Check if the geodatabase already exists; if so, delete it before creating a new one (unless the run is resumed)
+            if dry_run:
+                print(f"- Dry run: checking geodatabase: acs{year}.gdb")
+            elif not arcpy.Exists(gdb_path):
                 print(f"- Creating geodatabase: acs{year}.gdb")
                 arcpy.CreateFileGDB_management(self.prj_dirs["gis"], f"acs{year}.gdb")
+            elif resume:
+                print(f"- Resuming geodatabase: acs{year}.gdb")
             else:
                 print(f"- Deleting existing geodatabase: acs{year}.gdb")
                 arcpy.Delete_management(gdb_path)
@@ -4370,7 +6367,7 @@ class OCACS(OCGD):
                 arcpy.CreateFileGDB_management(self.prj_dirs["gis"], f"acs{year}.gdb")
 
             # Within each geodatabase, create feature datasets for each dataset
-            for fd in self.datasets:
+            for fd in ([] if dry_run else self.datasets):
                 # Set the feature dataset path
                 fd_path = os.path.join(gdb_path, fd)
 
@@ -4379,60 +6376,214 @@ class OCACS(OCGD):
                     print(f"\nCreating feature dataset: {fd}")
                     arcpy.CreateFeatureDataset_management(gdb_path, fd, spatial_reference = self.sr)
 
+            # Get the list of variables to process for each dataset
+            dataset_vars = {fd: self.get_acs_list(year, fd) for fd in self.datasets}
+
+            # Load the checkpoint manifest (a new geodatabase starts a new one)
+            manifest = self.acs_manifest(year) if resume else self.acs_manifest(year, {"year": year, "units": {}})
+
+            # The inputs of each dataset's units: its variables and their aliases, the codebook version and the TigerLine geometry
+            aliases = {}
+            for vars_dict in cb_acs.values():
+                for var, values in vars_dict.items():
+                    aliases.setdefault(var, values["alias"])
+            cb_version = self.acs_content_hash(cb_acs)
+            tl_mtime = self.gdb_modified_time(os.path.join(self.prj_dirs["gis"], f"tl{year}.gdb"))
+            dataset_inputs = {fd: {"variables": self.acs_content_hash([[var, aliases.get(var)] for var in dataset_vars[fd]]), "codebook": cb_version, "tl_mtime": tl_mtime} for fd in self.datasets}
+
+            # The reason to rebuild each unit (None if it is complete and current)
+            status = {}
+            for fd in self.datasets:
+                for geo in self.geographies:
+                    status[(fd, geo)] = self.acs_unit_status(manifest, f"{fd}/{geo}", os.path.join(gdb_path, fd, geo + fd[0]), dataset_inputs[fd]) if resume else "new geodatabase"
+            report = refresh_report[year] = []
+
+            def _write_unit(fd, geo, tl_sdf, acs_df):
+                # Compare the Census data of a current unit to the recorded hash (incremental runs)
+                reason = status[(fd, geo)]
+                if reason is None:
+                    if self.acs_content_hash(acs_df) == manifest["units"][f"{fd}/{geo}"]["hash"]:
+                        report.append({"unit": f"{fd}/{geo}", "action": "unchanged", "reason": "Census data unchanged"})
+                        return
+                    reason = "Census data changed"
+                report.append({"unit": f"{fd}/{geo}", "action": "rebuild", "reason": reason})
+                if dry_run:
+                    return
+
+                # Write the feature class of the unit and record it in the manifest
+                fc_path = self.write_acs_feature_class(tl_sdf, acs_df, os.path.join(gdb_path, fd), geo + fd[0], cb_acs)
+                self.record_acs_unit(manifest, f"{fd}/{geo}", fc_path, acs_df, dataset_inputs[fd])
+
+            def _datasets(geo, datasets):
+                # The datasets of a geography to fetch (a dry run reports the units whose inputs changed without fetching them)
+                selected = []
+                for fd in datasets:
+                    if status[(fd, geo)] is None and not incremental:
+                        print(f"- Skipping completed unit: {fd}/{geo}")
+                    elif status[(fd, geo)] is not None and dry_run:
+                        report.append({"unit": f"{fd}/{geo}", "action": "rebuild", "reason": status[(fd, geo)]})
+                    else:
+                        selected.append(fd)
+                return selected
+
+            # Coalesced mode: one geometry load and one Census fetch per geography for all datasets
+            tasks = []
+            if coalesce:
+                # The union of the dataset variables (in dataset order, without duplicates)
+                all_vars = list(dict.fromkeys(var for fd in self.datasets for var in dataset_vars[fd]))
+                print(f"- Retrieved {len(all_vars)} variables for datasets: {', '.join(self.datasets)}")
+
+                def _write_split(geo, datasets):
+                    # Split the result into the per-dataset feature classes
+                    def _write(tl_sdf, acs_df):
+                        for fd in datasets:
+                            if dataset_vars[fd] in acs_df.attrs.get("rejected", []):
+                                # The variables of the dataset were rejected (see run_acs_pipeline)
+                                print(f"- No ACS data returned for dataset {fd} of geography: {geo}. Skipping...")
+                                continue
+                            fd_columns = ["GEOID"] + [var for var in dataset_vars[fd] if var in acs_df.columns]
+                            _write_unit(fd, geo, tl_sdf, acs_df[fd_columns])
+                    return _write
+
                 for geo in self.geographies:
-                    print(f"\nProcessing {year} geography: {geo}")
+                    # Fetch only the variables of the datasets still to be built or checked
+                    datasets = _datasets(geo, self.datasets)
+                    if not datasets:
+                        continue
+                    geo_vars = all_vars if len(datasets) == len(self.datasets) else list(dict.fromkeys(var for fd in datasets for var in dataset_vars[fd]))
+                    # If the Census API rejects the union, each dataset is fetched on its own (a rejected variable only drops its dataset)
+                    fallback = [dataset_vars[fd] for fd in datasets] if len(datasets) > 1 else None
+                    tasks.append((geo, geo_vars, _write_split(geo, datasets), fallback))
 
-                    # Convert TL to SDF for the given year and geography
-                    tl_sdf = self.tl_to_sdf(year, geo)
-                    print(f"- Converted TL to SDF for geography: {geo}")
+            else:
+                # Per-dataset mode: one geometry load and one Census fetch per dataset and geography
+                def _write_dataset(fd, geo):
+                    def _write(tl_sdf, acs_df):
+                        _write_unit(fd, geo, tl_sdf, acs_df)
+                    return _write
 
-                    # Get the list of variables to process for the given dataset
-                    process_vars = self.get_acs_list(year, fd)
-                    print(f"- Retrieved {len(process_vars)} variables for dataset: {fd}")
+                for fd in self.datasets:
+                    print(f"- Retrieved {len(dataset_vars[fd])} variables for dataset: {fd}")
+                    for geo in self.geographies:
+                        if _datasets(geo, [fd]):
+                            tasks.append((geo, dataset_vars[fd], _write_dataset(fd, geo)))
 
-                    # Fetch the ACS tables for the given year, variables, and geography
-                    acs_df = self.fetch_acs_tables(year = year, variables = process_vars, geography = geo)
+            # Fetch the Census data of the next geography while the current one is written
+            self.run_acs_pipeline(year, tasks, max_workers = max_workers, strategy = strategy, prefetch = prefetch, refresh = incremental, geometry = not dry_run)
 
-                    # Check if acs_df is None (no data returned)
-                    if acs_df is None:
-                        print(f"- No ACS data returned for geography: {geo}. Skipping...")
-                        continue
+            # The geometries of the year are not used by the next one (each year has its own TigerLine geodatabase)
+            self.sdf_cache.clear()
 
-                    print(f"- Fetched ACS tables for geography: {geo} with {len(acs_df)} records")
+            # Report the units that were (or would be) rebuilt
+            if incremental:
+                rebuilt = [entry for entry in report if entry["action"] == "rebuild"]
+                print(f"\n{'Would rebuild' if dry_run else 'Rebuilt'} {len(rebuilt)} of {len(report)} checked unit(s) for {year}:")
+                for entry in rebuilt:
+                    print(f"- {entry['unit']}: {entry['reason']}")
 
-                    # Get the name of the tl_sdf column that contains the GEOID values
-                    tl_geoid_col = [col for col in tl_sdf.columns if "GEOID" in col][0]
-                    acs_geoid_col = [col for col in acs_df.columns if "GEOID" in col][0]
+        # Report the Census API response cache usage for the run
+        cache_stats = self.http_cache.stats()
+        print(f"\nCensus API cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es)")
+        sdf_stats = self.sdf_cache.stats()
+        print(f"Spatial data frame cache: {sdf_stats['hits']} hit(s), {sdf_stats['misses']} miss(es), {sdf_stats['evictions']} eviction(s), {sdf_stats['size_bytes'] / 1024 ** 2:.1f} MB of {sdf_stats['max_bytes'] / 1024 ** 2:.0f} MB")
+        self.http_latency_stats(silent = False)
 
-                    # Merge the demographic variables from acs_df (GEOID) to the tl_sdf (GEOID10)
-                    tl_sdf = tl_sdf.merge(acs_df, left_on = tl_geoid_col, right_on = acs_geoid_col, how="left")
-                    print(f"- Merged ACS data with TL SDF for geography: {geo}")
+        return refresh_report
 
-                    # Define the output feature class path
-                    fc_path = os.path.join(fd_path, geo+fd[0])
 
-                    # Set the arcpy environment to the feature dataset
-                    arcpy.env.workspace = fd_path
-                    arcpy.env.overwriteOutput = True
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# OCACS codebook worker ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The OCACS instance of each worker process (constructed on its first task)
+_acs_cb_worker_instances = {}
+
+def _acs_cb_variables_worker(part: int, version: float, state: dict, year: int, write_to_disk: bool) -> tuple:
+    """
+    Build the ACS variables codebook of one year in a worker process (see OCACS.acs_cb_variables_batch).
+    The state of the parent instance (project directories, Census API URL, response cache settings and catalog index) is applied before the build.
+    Returns:
+        tuple: (cb, df_cb, build time in seconds, console output of the build, hash of the written codebook or None).
+    """
+    if (part, version) not in _acs_cb_worker_instances:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _acs_cb_worker_instances[(part, version)] = OCACS(part, version)
+    acs = _acs_cb_worker_instances[(part, version)]
+    acs.prj_dirs = state["prj_dirs"]
+    acs.census_api_url = state["census_api_url"]
+    cache = acs.http_cache
+    if [cache.cache_dir, cache.max_bytes, cache.catalog_ttl, cache.current_ttl] != list(state["http_cache"].values()):
+        acs.http_cache = CensusCache(**state["http_cache"])
+    acs._census_catalog = state["census_catalog"]
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        cb, df_cb = acs.acs_cb_variables(year, write_to_disk = write_to_disk, record_doc_hash = False) or (None, None)
+    doc_hash = acs.acs_cb_doc_hash(year) if write_to_disk and cb is not None else None
+    return cb, df_cb, time.perf_counter() - start, log.getvalue(), doc_hash
 
-                    # Convert the merged DataFrame to a feature class in the geodatabase
-                    tl_sdf.spatial.to_featureclass(location = fc_path, overwrite = True, has_z = None, has_m = None, sanitize_columns = False)
-                    print(f"- Converted merged DataFrame to feature class: {geo+fd[0]}")
 
-                    # Set field aliases based on the codebook
-                    print(f"- Setting field aliases for feature class: {geo+fd[0]}")
-                    for field in arcpy.ListFields(fc_path):
-                        # Find the variable in the codebook to get the alias
-                        found = False
-                        for vars_dict in cb_acs.values():
-                            if field.name in vars_dict:
-                                field_alias = vars_dict[field.name]["alias"]
-                                found = True
-                                break
-                        if found:
-                            # Set the field alias
-                            arcpy.AlterField_management(fc_path, field.name, new_field_alias = field_alias)
-                            print(f"  - Set alias for field {field.name} to {field_alias}")
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# OCACS codebook markdown renderer ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def _render_acs_cb_markdown(year: int, df_cb: pd.DataFrame, version: float, date_text: str) -> str:
+    """
+    Render the markdown documentation of the ACS variables codebook of a year (see OCACS.write_acs_cb_markdown).
+    Returns:
+        str: The markdown document.
+    """
+    # Group the codebook in one pass: the levels and their sections (in order of first appearance), with their variable counts, first section names and distinct markdown entries
+    levels = {}
+    for level, section, section_name, markdown in zip(df_cb["level"], df_cb["section"], df_cb["section_name"], df_cb["markdown"]):
+        level_info = levels.setdefault(level, {"count": 0, "sections": {}})
+        level_info["count"] += 1
+        if pd.isna(section):
+            continue
+        section_info = level_info["sections"].setdefault(section, {"name": None, "count": 0, "markdown": {}})
+        section_info["count"] += 1
+        if section_info["name"] is None and not pd.isna(section_name):
+            section_info["name"] = section_name
+        section_info["markdown"].setdefault(markdown, None)
+
+    out = []
+    out.append("""<img align="left" src="../graphics/ocacs_logo_demographic.jpg" width="300" hspace="25" vspace="15">\n\n""")
+    out.append(f"# Orange County Geodemographics<br>{year} ACS 5-Year Data Documentation\n\n")
+    out.append(f"*Orange County American Community Survey (ACS) Geodemographic Repository <br> Dr. Kostas Alexandridis, GISP. OC Public Works Geospatial Services*<br>Version: {version}, Date: {date_text}\n\n")
+    out.append("[◀️ Back to ReadMe](../README.md)")
+    out.append("\n\n## Geodemographic Tables by Group <a name='tables'></a>\n")
+    out.append("\nFor each of the geographies described in the previous section, four categories of geodemographic characteristics are available:\n\n")
+    for level, level_info in levels.items():
+        level_name = f"{level} Characteristics ({len(level_info['sections'])} sections, {level_info['count']} variables)"
+        out.append(f"- [**{level_name}**](#{level.lower()})\n")
+    out.append("\nEach of the geographies is represented by a separate geodatabase structure. Within of each of the geographic level geodatabases, each of the four characteristics is represented by a _feature class_ respectively. In order to easily identify each of the sub-groups within each category, the name of the original census table field was adjusted by prepending to it the subgroup identification code. For example, the original field B01001e1 would become D01_B01001e1 in the new feature class for the demographic characteristics.\n")
+    out.append("\nMore detailed description of each sub-group within each of the four feature classes representing the ACS table characteristics is provided below. The table's columns represent: the subgroup's code; its descriptive name;the universe (summative) level of the reference; the ACS Census table in which the original fields are located; the fields/variables of the data, and; how many fields are included in the subgroup.\n")
+    out.append("\n---\n")
+    for level, level_info in levels.items():
+        out.append(f"\n\n\n## 📚 {level} Characteristics ({len(level_info['sections'])} sections, {level_info['count']} variables) <a name='{level.lower()}'></a>\n")
+        out.append("\nThe demographic characteristics selected for spatial representation can be found in ACS data tables X1-X5. They are divided in 8 subgroups: total population, sex and age, median age by sex and race, race, race alone or in combination with other races, hispanic or latino, and citizen voting age population.\n")
+        out.append("\nCode | Name | Variable Count |\n| --- | --- | --- |\n")
+        for section, section_info in level_info["sections"].items():
+            out.append(f"| [{section}](#{section.lower()}) | {section_info['name']} | {section_info['count']} |\n")
+        out.append("\n\n[🔙 Back to Tables](#tables)\n\n")
+        for section, section_info in level_info["sections"].items():
+            out.append(f"### 🏷️ {section}: {section_info['name']} ({section_info['count']} variables) <a name='{section.lower()}'></a>\n")
+            out.append("\n> ")
+            for markdown in section_info["markdown"]:
+                out.append(f"{markdown}; \n")
+            out.append(f"\n\n[🔙 Back to Sections](#{level.lower()})\n\n")
+    out.append("\n")
+    out.append("---\n\n")
+    return "".join(out)
+
+
+def _timed_render_acs_cb_markdown(year: int, df_cb: pd.DataFrame, version: float, date_text: str) -> tuple:
+    """
+    Render the markdown documentation of a year in a worker process (see OCACS.render_acs_cb_docs).
+    Returns:
+        tuple: (markdown document, render time in seconds).
+    """
+    start = time.perf_counter()
+    text = _render_acs_cb_markdown(year, df_cb, version, date_text)
+    return text, time.perf_counter() - start
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -4478,6 +6629,9 @@ class OCCR(OCGD):
             "TR"   # Census Tract
         ]
 
+        # Geoid of the ocean side tract removed from the OCCR feature classes
+        self.occr_remove_geoid = "06059990100"
+
         # Define the OCCR DataFrame schema
         self.schema = {
             "GEOID": "object",
@@ -4560,13 +6714,14 @@ class OCCR(OCGD):
             "version": self.version,
             "date": self.data_date,
             "author": "Dr. Kostas Alexandridis, GISP",
-            "years": self.cr_years
+            # The available years are read from the Census catalog on first use (see cr_years)
+            "years": "",
         }
 
         # If not silent, print the metadata
         if not silent:
             print(
-                f"\nProject Metadata:\n- Name: {metadata['name']}\n- Title: {metadata['title']}\n- Description: {metadata['description']}\n- Version: {metadata['version']}\n- Author: {metadata['author']}\n- Date: {metadata['date']}\n- Available CR Years: {metadata['years']}\n"
+                f"\nProject Metadata:\n- Name: {metadata['name']}\n- Title: {metadata['title']}\n- Description: {metadata['description']}\n- Version: {metadata['version']}\n- Author: {metadata['author']}\n- Date: {metadata['date']}\n"
             )
 
         # Return the metadata
@@ -4585,11 +6740,11 @@ class OCCR(OCGD):
         Returns:
             Dictionary containing the OCCR variable metadata.
         Raises:
-            RuntimeError: If the CENSUS_API_KEY1 environment variable is not set.
+            RuntimeError: If the variables document is not valid JSON or does not list one of the variables.
         Example:
             >>> occr_cb = generate_occr_codebook(2020)
         Notes:
-            This function fetches OCCR variable metadata from the Census API.
+            This function fetches the variables document of the year (one request, through the response cache) and keeps the OCCR variables, adding the "name" key of the per-variable endpoint (/variables/{VAR}.json) to each entry.
         """
         # Define a dictionary to hold variable metadata
         occr_cb = dict()
@@ -4597,22 +6752,21 @@ class OCCR(OCGD):
         # Define the headers to fetch metadata for
         var_list = ["GEO_ID", "SUMLEVEL", "GEOCOMP", "NAME", "POPUNI", "PRED0_E", "PRED12_E", "PRED3_E", "PRED0_PE", "PRED12_PE", "PRED3_PE", "PRED0_M", "PRED12_M", "PRED3_M", "PRED0_PM", "PRED12_PM", "PRED3_PM", "STATE", "COUNTY", "TRACT"]
 
-        # Loop through each OCCR variable and fetch its metadata
-        for occr_var in var_list:
-            # Define the URL for the variable metadata
-            occr_info_url = f"https://api.census.gov/data/{year}/cr/variables/{occr_var}.json"
+        # Fetch the variables document of the year
+        occr_info_url = f"{self.census_api_url}/data/{year}/cr/variables.json"
+        info_response = self.cached_get(occr_info_url, timeout = 60)
 
-            # Make the API request for variable metadata
-            info_response = requests.get(occr_info_url, timeout = 60)
-            
-            # Check for valid JSON response
-            try:
-                info_data = info_response.json()
-            except Exception as exc:
-                raise RuntimeError(f"Invalid JSON response from Census API (status={info_response.status_code}): {info_response.text[:500]}") from exc
-            
-            # Add the variable metadata to the dictionary
-            occr_cb[occr_var] = info_data
+        # Check for valid JSON response
+        try:
+            info_data = info_response.json()["variables"]
+        except Exception as exc:
+            raise RuntimeError(f"Invalid JSON response from Census API (status={info_response.status_code}): {info_response.text[:500]}") from exc
+
+        # Slice out the metadata of each OCCR variable (with its name first, as the per-variable endpoint returns it)
+        for occr_var in var_list:
+            if occr_var not in info_data:
+                raise RuntimeError(f"Variable {occr_var} is not listed in the OCCR variables of {year} ({occr_info_url})")
+            occr_cb[occr_var] = {"name": occr_var, **{k: v for k, v in info_data[occr_var].items() if k != "name"}}
 
         # Write the codebook to a JSON file
         occr_cb_path = os.path.join(self.prj_dirs["codebook"], f"occr_cb_{year}.json")
@@ -4624,6 +6778,33 @@ class OCCR(OCGD):
         # Return the codebook dictionary
         return occr_cb
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Generate OCCR codebook batch ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def generate_occr_codebook_batch(self, years: Optional[list[int]] = None, write_to_file: bool = False, max_workers: int = 8) -> dict:
+        """
+        Generate the OCCR codebooks of several years concurrently.
+        Args:
+            years (list[int], optional): The OCCR years. Defaults to None (all the available CR years).
+            write_to_file (bool, optional): Whether to write each codebook to codebook/occr_cb_{year}.json. Defaults to False.
+            max_workers (int, optional): The maximum number of years fetched at once. Defaults to 8.
+        Returns:
+            dict: The codebook of each year (see generate_occr_codebook).
+        Raises:
+            RuntimeError: If the variables document of a year is not valid JSON or does not list one of the variables.
+        Example:
+            >>> occr_cbs = generate_occr_codebook_batch(write_to_file = True)
+        Notes:
+            Each year takes a single request (its variables document), so a full refresh sends one request per CR year.
+        """
+        years = list(years) if years is not None else list(self.cr_years)
+        if not years:
+            return {}
+        with ThreadPoolExecutor(max_workers = max(1, min(max_workers, len(years)))) as executor:
+            codebooks = list(executor.map(lambda year: self.generate_occr_codebook(year, write_to_file = write_to_file), years))
+        return dict(zip(years, codebooks))
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## fx: Fetch OCCR tables ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -4649,10 +6830,10 @@ class OCCR(OCGD):
             raise RuntimeError("Environment variable CENSUS_API_KEY1 is not set")
 
         # Base URL for ACS5 API
-        occr_api_url = f"https://api.census.gov/data/{year}/cr?get=GEO_ID,SUMLEVEL,GEOCOMP,NAME,POPUNI,PRED0_E,PRED12_E,PRED3_E,PRED0_PE,PRED12_PE,PRED3_PE,PRED0_M,PRED12_M,PRED3_M,PRED0_PM,PRED12_PM,PRED3_PM&for=tract:*&in=state:06&in=county:059&key={api_key}"
+        occr_api_url = f"{self.census_api_url}/data/{year}/cr?get=GEO_ID,SUMLEVEL,GEOCOMP,NAME,POPUNI,PRED0_E,PRED12_E,PRED3_E,PRED0_PE,PRED12_PE,PRED3_PE,PRED0_M,PRED12_M,PRED3_M,PRED0_PM,PRED12_PM,PRED3_PM&for=tract:*&in=state:06&in=county:059&key={api_key}"
 
         # Make the API request
-        api_response = requests.get(occr_api_url, timeout = 60)
+        api_response = self.cached_get(occr_api_url, timeout = 60)
         # Check for valid JSON response
         try:
             api_data = api_response.json()
@@ -4706,32 +6887,22 @@ class OCCR(OCGD):
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    ## fx: Create OCCR feature class ----
+    ## fx: Load OCCR tracts ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def create_occr_feature_class(self, year: int):
+    def load_occr_tracts(self, year: int) -> pd.DataFrame:
         """
-        Create OCCR feature class for the specified year.
+        Load the TL tract geometry of the specified year for the OCCR feature classes.
         Args:
-            year (int): The OCCR year (e.g., 2020, 2021, 2022).
+            year (int): The year of the TL geodatabase (octl_ocacs{year}.gdb).
         Returns:
-            None
+            pd.DataFrame: The spatial DataFrame of the Census/TR feature class, without the ocean side tract and with stripped GEOIDs.
         Raises:
             None
         Example:
-            >>> create_occr_feature_class(2020)
+            >>> octl_sdf = load_occr_tracts(2020)
         Notes:
-            This function creates a OCCR feature class by joining OCCR data with TL tract data.
+            The tract geometry only changes with the decennial Census (2010 and 2020 vintages), so a multi-year build loads it once per vintage (see create_occr_feature_classes).
         """
-        # Geoid of the ocean side tract to remove
-        remove_geoid = "06059990100"
-
-        print(f"Creating OCCR feature class for year: {year}...")
-        # Fetch the OCCR tables for the specified year
-        occr_db = self.fetch_occr_tables(year= year)
-
-        print(f"- Removing ocean side tract GEOID: {remove_geoid} if it exists...")
-        # Remove specific GEOID record if it exists
-        occr_db = occr_db[occr_db["GEOID"] != remove_geoid]
         # Path to TL geodatabase
         octl_gdb = os.path.join(self.prj_dirs["gis"], f"octl_ocacs{year}.gdb")
 
@@ -4746,14 +6917,35 @@ class OCCR(OCGD):
         print("- Loading OCTL tract feature class into a spatial DataFrame...")
         # Load OCTL tract feature class into a spatial DataFrame
         octl_sdf = pd.DataFrame.spatial.from_featureclass(octl_tract)
-        print(f"- Removing ocean side tract GEOID: {remove_geoid} from OCTL SDF if it exists...")
+        print(f"- Removing ocean side tract GEOID: {self.occr_remove_geoid} from OCTL SDF if it exists...")
         # Remove specific GEOID record if it exists
-        octl_sdf = octl_sdf[octl_sdf["GEOID"] != remove_geoid]
+        octl_sdf = octl_sdf[octl_sdf["GEOID"] != self.occr_remove_geoid]
 
         # Ensure GEOID columns are comparable (strings without extra whitespace)
         octl_sdf["GEOID"] = octl_sdf["GEOID"].astype(str).str.strip()
-        occr_db["GEOID"] = occr_db["GEOID"].astype(str).str.strip()
 
+        # Return the tract spatial DataFrame
+        return octl_sdf
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Join OCCR tracts ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def join_occr_tracts(self, octl_sdf: pd.DataFrame, occr_db: pd.DataFrame) -> pd.DataFrame:
+        """
+        Join the OCCR data of one year to the TL tract spatial DataFrame.
+        Args:
+            octl_sdf (pd.DataFrame): The tract spatial DataFrame (see load_occr_tracts).
+            occr_db (pd.DataFrame): The OCCR data of the year (see fetch_occr_tables), with stripped GEOIDs.
+        Returns:
+            pd.DataFrame: A new spatial DataFrame with all the tracts and the matching OCCR columns (octl_sdf is left unchanged).
+        Raises:
+            None
+        Example:
+            >>> occr_sdf = join_occr_tracts(octl_sdf, occr_db)
+        Notes:
+            The join is a left join on GEOID, keeping the tract versions of any overlapping columns.
+        """
         print("- Checking if the number of records between TL SDF and CR DB match before join...")
         diff_count = octl_sdf.shape[0] - occr_db.shape[0]
         if diff_count == 0:
@@ -4762,21 +6954,38 @@ class OCCR(OCGD):
             print(f"Warning: TL SDF has {diff_count} more records ({octl_sdf.shape[0]}) than CR DB ({occr_db.shape[0]}).")
         elif diff_count < 0:
             print(f"Warning TL SDF has {-diff_count} fewer records ({octl_sdf.shape[0]}) than CR DB ({occr_db.shape[0]}).")
-        
+
         print("- Joining CR data with TL SDF on GEOID...")
         # Perform a left join: keep all tl_sdf records and add matching cr_db columns
         # If there are overlapping column names besides `GEOID`, keep tl_sdf's versions
         cols_to_merge = [c for c in occr_db.columns if c != "GEOID"]
-        octl_sdf = octl_sdf.merge(occr_db[ ["GEOID"] + cols_to_merge ], on="GEOID", how="left")
-        print(f"- After join, octl_sdf shape: {octl_sdf.shape}")
+        occr_sdf = octl_sdf.merge(occr_db[ ["GEOID"] + cols_to_merge ], on="GEOID", how="left")
+        print(f"- After join, octl_sdf shape: {occr_sdf.shape}")
+
+        # Return the joined spatial DataFrame
+        return occr_sdf
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Write OCCR geodatabase metadata ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def write_occr_gdb_metadata(self) -> None:
+        """
+        Write the metadata of the OCCR geodatabase.
+        Args:
+            None
+        Returns:
+            None
+        Raises:
+            None
+        Example:
+            >>> write_occr_gdb_metadata()
+        Notes:
+            The metadata covers all the CR years, so a multi-year build writes it once.
+        """
         # Path to output CR geodatabase
         occr_gdb = self.prj_dirs["gis_occr_gdb"]
 
-        print(f"- Setting up OCCR geodatabase: {os.path.basename(occr_gdb)}...")
-        # Set the arcpy environment to the feature dataset
-        arcpy.env.workspace = occr_gdb
-        arcpy.env.overwriteOutput = True
-
         # Creating geodatabase metadata
         print("- Creating metadata for OCCR geodatabase...")
         occr_gdb_md = md.Metadata(occr_gdb)
@@ -4789,6 +6998,33 @@ class OCCR(OCGD):
         occr_gdb_md.thumbnailUri = "https://ocpw.maps.arcgis.com/sharing/rest/content/items/67ce28a349d144c9b1e7f0c8b8a1e4/info/iteminfo/thumbnail/thumbnail.png"
         occr_gdb_md.save()
 
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Write OCCR feature class ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def write_occr_feature_class(self, year: int, octl_sdf: pd.DataFrame) -> None:
+        """
+        Write the joined OCCR spatial DataFrame of a year to the TR{year} feature class of the OCCR geodatabase.
+        Args:
+            year (int): The OCCR year (e.g., 2020, 2021, 2022).
+            octl_sdf (pd.DataFrame): The joined spatial DataFrame (see join_occr_tracts).
+        Returns:
+            None
+        Raises:
+            None
+        Example:
+            >>> write_occr_feature_class(2020, occr_sdf)
+        Notes:
+            This function also sets the feature class and field aliases (from the CR codebook) and the feature class metadata.
+        """
+        # Path to output CR geodatabase
+        occr_gdb = self.prj_dirs["gis_occr_gdb"]
+
+        print(f"- Setting up OCCR geodatabase: {os.path.basename(occr_gdb)}...")
+        # Set the arcpy environment to the feature dataset
+        arcpy.env.workspace = occr_gdb
+        arcpy.env.overwriteOutput = True
+
         # Path to output OCCR feature class
         occr_fc = os.path.join(occr_gdb, f"TR{year}")
         print(f"- Creating OCCR feature class: TR{year}...")
@@ -4853,6 +7089,95 @@ class OCCR(OCGD):
         print(f"CR feature class for year {year} created successfully at {occr_fc}.")
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Create OCCR feature class ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def create_occr_feature_class(self, year: int):
+        """
+        Create OCCR feature class for the specified year.
+        Args:
+            year (int): The OCCR year (e.g., 2020, 2021, 2022).
+        Returns:
+            None
+        Raises:
+            None
+        Example:
+            >>> create_occr_feature_class(2020)
+        Notes:
+            This function creates a OCCR feature class by joining OCCR data with TL tract data. Use create_occr_feature_classes to build several years from a single tract load.
+        """
+        print(f"Creating OCCR feature class for year: {year}...")
+        # Fetch the OCCR tables for the specified year
+        occr_db = self.fetch_occr_tables(year= year)
+
+        print(f"- Removing ocean side tract GEOID: {self.occr_remove_geoid} if it exists...")
+        # Remove specific GEOID record if it exists
+        occr_db = occr_db[occr_db["GEOID"] != self.occr_remove_geoid]
+        occr_db["GEOID"] = occr_db["GEOID"].astype(str).str.strip()
+
+        # Load the TL tracts and join the OCCR data
+        octl_sdf = self.load_occr_tracts(year)
+        octl_sdf = self.join_occr_tracts(octl_sdf, occr_db)
+
+        # Write the geodatabase metadata and the feature class
+        self.write_occr_gdb_metadata()
+        self.write_occr_feature_class(year, octl_sdf)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## fx: Create OCCR feature classes ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def create_occr_feature_classes(self, years: Optional[list[int]] = None, max_workers: int = 8) -> dict:
+        """
+        Create the OCCR feature classes of several years from one tract load per Census vintage.
+        Args:
+            years (list[int], optional): The OCCR years. Defaults to None (all the available CR years).
+            max_workers (int, optional): The maximum number of CR years fetched at once. Defaults to 8.
+        Returns:
+            dict: The number of tracts of each year's feature class.
+        Raises:
+            None
+        Example:
+            >>> create_occr_feature_classes([2019, 2020, 2021, 2022])
+        Notes:
+            The CR years are fetched concurrently and concatenated, so the ocean side tract and the GEOID whitespace are removed in one pass. The TL tracts are loaded once per vintage (2010-based before 2020, 2020-based afterwards) from the TL geodatabase of the earliest year of the vintage, and each TR{year} feature class is written from that load. The geodatabase metadata is written once, after all the feature classes.
+        """
+        years = sorted(years) if years is not None else sorted(self.cr_years)
+        if not years:
+            return {}
+        print(f"Creating OCCR feature classes for years: {years}...")
+
+        # Fetch the OCCR tables of all the years concurrently and clean them in one pass
+        with ThreadPoolExecutor(max_workers = max(1, min(max_workers, len(years)))) as executor:
+            occr_dbs = list(executor.map(lambda year: self.fetch_occr_tables(year = year), years))
+        occr_all = pd.concat(occr_dbs, ignore_index = True)
+        occr_all["GEOID"] = occr_all["GEOID"].astype(str).str.strip()
+        print(f"- Removing ocean side tract GEOID: {self.occr_remove_geoid} if it exists...")
+        occr_all = occr_all[occr_all["GEOID"] != self.occr_remove_geoid]
+        occr_by_year = {year: df for year, df in occr_all.groupby("YEAR", sort = False)}
+
+        # Group the years by tract vintage (the tracts change with the decennial Census)
+        vintages = {}
+        for year in years:
+            vintages.setdefault(2010 if year < 2020 else 2020, []).append(year)
+
+        counts = {}
+        for vintage, vintage_years in vintages.items():
+            print(f"\nLoading the {vintage} vintage tracts for years: {vintage_years}...")
+            octl_sdf = self.load_occr_tracts(vintage_years[0])
+            for year in vintage_years:
+                print(f"\nCreating OCCR feature class for year: {year}...")
+                occr_db = occr_by_year.get(year, occr_all.iloc[0:0])
+                occr_sdf = self.join_occr_tracts(octl_sdf, occr_db)
+                self.write_occr_feature_class(year, occr_sdf)
+                counts[year] = occr_sdf.shape[0]
+
+        # Write the geodatabase metadata once
+        print("")
+        self.write_occr_gdb_metadata()
+        return counts
+
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Main ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
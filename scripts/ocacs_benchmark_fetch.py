@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+ocacs_benchmark_fetch.py
+
+Benchmark the serial and concurrent chunk fetching of
+`OCACS.fetch_acs_chunks` against the local Census stand-in server
+(`ocacs_census_standin.py`), so no requests are sent to api.census.gov.
+
+Usage: python scripts/ocacs_benchmark_fetch.py --variables 480 --latency 0.25
+
+Each run fetches the same synthetic variable list at the TR and BG
+geographies with an increasing number of in-flight requests, checks that
+the responses are identical to the serial run, and prints the wall time
+and speedup of each mode. Each run starts with an empty response cache in a
+temporary directory, so every request reaches the stand-in server and no
+response is written to the project cache.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from ocacs_census_standin import start_standin_server  # noqa: E402
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark serial vs concurrent ACS chunk fetching")
+    parser.add_argument("--variables", type = int, default = 480, help = "number of synthetic variables to fetch")
+    parser.add_argument("--latency", type = float, default = 0.25, help = "stand-in server latency per request (seconds)")
+    parser.add_argument("--workers", type = int, nargs = "+", default = [1, 2, 4, 8])
+    parser.add_argument("--year", type = int, default = 2022)
+    args = parser.parse_args()
+
+    # Start the stand-in server and redirect the OCGD classes to it
+    server, _ = start_standin_server(port = 0, latency = args.latency)
+    os.environ["CENSUS_API_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("CENSUS_API_KEY1", "standin")
+
+    from ocgd import OCACS, CensusCache
+
+    acs = OCACS(part = 0)
+
+    # Build the synthetic variable chunks (same 40-variable chunking as fetch_acs_tables)
+    variables = [f"B{9000 + i // 50:05d}_{i % 50 + 1:03d}E" for i in range(args.variables)]
+    chunks = [variables[i : i + 40] for i in range(0, len(variables), 40)]
+
+    print(f"\nFetching {len(variables)} variables in {len(chunks)} chunk(s), server latency {args.latency}s\n")
+    print(f"{'geography':<10}{'workers':>8}{'wall (s)':>12}{'speedup':>10}")
+    for geography in ["TR", "BG"]:
+        for_clause, in_clause = acs.get_acs_geography_clauses(geography)
+        baseline = None
+        baseline_time = None
+        for workers in args.workers:
+            acs.http_cache = CensusCache(tempfile.mkdtemp(prefix = "ocgd_bench_"))
+            start = time.perf_counter()
+            responses = acs.fetch_acs_chunks(args.year, chunks, for_clause, in_clause, max_workers = workers)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline, baseline_time = responses, elapsed
+            elif responses != baseline:
+                print(f"ERROR: responses with {workers} workers differ from the serial run")
+                return 1
+            print(f"{geography:<10}{workers:>8}{elapsed:>12.3f}{baseline_time / elapsed:>9.1f}x")
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+ocacs_benchmark_labels.py
+
+Benchmark of the ACS label normalization of `OCACS.acs_cb_variables`: the
+legacy per-variable `re.sub` chain (see `ocacs_golden_labels.py`) against
+`LabelNormalizer`, over the full variables.json payloads of several years.
+
+Usage: python scripts/ocacs_benchmark_labels.py --years 2018 2019 2020 2021 2022 2023
+       python scripts/ocacs_benchmark_labels.py --variables-json variables.json
+
+By default the payloads are downloaded from the local Census stand-in server
+(`ocacs_census_standin.py`). Use `--variables-json` to benchmark a
+variables.json downloaded from the Census API (~28,000 variables, used for
+every year). The engine is timed without memo (a new normalizer per year) and
+with its memo shared across the years, the way acs_cb_variables uses it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from ocacs_census_standin import start_standin_server  # noqa: E402
+from ocacs_golden_labels import legacy_normalize  # noqa: E402
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark the legacy and vectorized ACS label normalization")
+    parser.add_argument("--years", type = int, nargs = "+", default = list(range(2010, 2025)))
+    parser.add_argument("--variables-json", default = None, help = "a variables.json file to use for every year instead of the stand-in server")
+    args = parser.parse_args()
+
+    from ocgd import LabelNormalizer
+
+    # The raw labels of every year
+    payloads = {}
+    if args.variables_json:
+        with open(args.variables_json, "r", encoding = "utf-8") as f:
+            variables = json.load(f)["variables"]
+        payloads = {year: variables for year in args.years}
+    else:
+        server, _ = start_standin_server(port = 0)
+        for year in args.years:
+            resp = requests.get(f"http://127.0.0.1:{server.server_port}/data/{year}/acs/acs5/variables.json", timeout = 60)
+            resp.raise_for_status()
+            payloads[year] = resp.json()["variables"]
+        server.shutdown()
+    labels = {year: pd.Series({var: str(values.get("label", "")) for var, values in variables.items()}, dtype = object) for year, variables in payloads.items()}
+    total = sum(len(series) for series in labels.values())
+    print(f"\n{total:,} labels in {len(labels)} year(s)\n")
+
+    # Legacy per-variable chain
+    start = time.perf_counter()
+    legacy = {year: series.map(legacy_normalize) for year, series in labels.items()}
+    legacy_time = time.perf_counter() - start
+
+    # Engine without memo across years
+    start = time.perf_counter()
+    for year, series in labels.items():
+        LabelNormalizer().normalize(series)
+    cold_time = time.perf_counter() - start
+
+    # Engine with its memo shared across years
+    normalizer = LabelNormalizer()
+    start = time.perf_counter()
+    shared = {year: normalizer.normalize(series) for year, series in labels.items()}
+    shared_time = time.perf_counter() - start
+
+    if any(not shared[year].equals(legacy[year]) for year in labels):
+        print("ERROR: the normalized labels differ from the legacy implementation")
+        return 1
+
+    stats = normalizer.stats()
+    print(f"{'mode':<24}{'time (s)':>10}{'labels/s':>12}{'speedup':>10}")
+    for mode, seconds in [("legacy re.sub chain", legacy_time), ("engine, memo per year", cold_time), ("engine, shared memo", shared_time)]:
+        print(f"{mode:<24}{seconds:>10.3f}{total / seconds:>12,.0f}{legacy_time / seconds:>9.1f}x")
+    print(f"\nShared memo: {stats['entries']:,} distinct label(s), {stats['hits']:,} hit(s), {stats['misses']:,} miss(es)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+ocacs_benchmark_merge.py
+
+Micro-benchmark of the chunk merge in `OCACS.fetch_acs_tables`: the legacy
+per-row dictionary merge (reproduced below) against the columnar
+`OCACS.merge_acs_responses`, on synthetic responses at block group (BG)
+scale and above.
+
+Usage: python scripts/ocacs_benchmark_merge.py --rows 1843 33791 --variables 480
+
+For each row count the script builds the chunked array-of-arrays responses
+(40 variables per chunk), checks that both merges return the same records,
+and prints the wall time of each and the speedup.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from ocacs_census_standin import start_standin_server  # noqa: E402
+
+
+def legacy_merge(responses: list, variables: list, geoids: dict) -> list:
+    """The per-row merge and linear GEOID filter used before the columnar merge."""
+    merged = {}
+    for data in responses:
+        if not data or len(data) < 2:
+            continue
+        headers = data[0]
+        for row in data[1:]:
+            rec = dict(zip(headers, row))
+            geo_id = rec.get("GEO_ID")
+            if geo_id is None:
+                continue
+            if geo_id not in merged:
+                merged[geo_id] = {}
+            allowed = set(variables)
+            filtered = {k: v for k, v in rec.items() if k == "GEO_ID" or k in allowed}
+            merged[geo_id].update(filtered)
+    merged_list = list(merged.values())
+    return [rec for rec in merged_list if rec["GEO_ID"].split("US")[-1] in geoids["values"]]
+
+
+def synthetic_responses(rows: int, variables: list) -> tuple:
+    """Return (responses, geoids) for `rows` block groups split in 40-variable chunks."""
+    geo_ids = [f"1500000US06059{i:07d}" for i in range(rows)]
+    responses = []
+    for start in range(0, len(variables), 40):
+        chunk = variables[start : start + 40]
+        header = ["GEO_ID"] + chunk + ["state", "county", "tract", "block group"]
+        body = [[geo_id] + [str(i + j) for j in range(len(chunk))] + ["06", "059", "000000", "1"] for i, geo_id in enumerate(geo_ids)]
+        responses.append([header] + body)
+    # The TigerLine geodatabase holds ~95% of the returned geographies
+    values = sorted(g.split("US")[-1] for g in geo_ids[: int(rows * 0.95)])
+    return responses, {"dataset": "Census", "field": "GEOID", "values": values}
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark the legacy and columnar ACS chunk merge")
+    parser.add_argument("--rows", type = int, nargs = "+", default = [614, 1843, 33791])
+    parser.add_argument("--variables", type = int, default = 480)
+    args = parser.parse_args()
+
+    # The OCACS class is constructed against the stand-in server (no Census requests)
+    server, _ = start_standin_server(port = 0)
+    os.environ["CENSUS_API_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("CENSUS_API_KEY1", "standin")
+
+    from ocgd import OCACS
+
+    acs = OCACS(part = 0)
+    variables = [f"B{9000 + i // 50:05d}_{i % 50 + 1:03d}E" for i in range(args.variables)]
+
+    print(f"\n{'rows':>8}{'legacy (s)':>14}{'columnar (s)':>14}{'speedup':>10}")
+    for rows in args.rows:
+        responses, geoids = synthetic_responses(rows, variables)
+
+        start = time.perf_counter()
+        legacy = legacy_merge(responses, variables, geoids)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar = acs.merge_acs_responses(responses, variables, geoids)
+        columnar_time = time.perf_counter() - start
+
+        if len(legacy) != len(columnar) or [r["GEO_ID"].split("US")[-1] for r in legacy] != columnar["GEOID"].tolist():
+            print(f"ERROR: merged records differ at {rows} rows")
+            return 1
+        print(f"{rows:>8}{legacy_time:>14.3f}{columnar_time:>14.3f}{legacy_time / columnar_time:>9.1f}x")
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
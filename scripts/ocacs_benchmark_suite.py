@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+ocacs_benchmark_suite.py
+
+Throughput benchmark of the Census-facing OCGD methods against the local
+Census stand-in server (`ocacs_census_standin.py`), so no requests are sent
+to api.census.gov.
+
+Usage: python scripts/ocacs_benchmark_suite.py --year 2022 --level Demographic --latency 0.1 --workers 8
+
+For every geography (from CO up to BG) the ACS variables of the selected
+codebook level are fetched with each request strategy:
+
+- chunks x1: fixed 40-variable chunks, one request at a time (the original behaviour);
+- chunks xN: fixed 40-variable chunks, N requests in flight;
+- groups xN: the group() request plan of `OCACS.plan_acs_requests`, N requests in flight;
+- adaptive xN: the adaptive packer of `OCACS.fetch_acs_adaptive`, N requests per wave
+  (its learned chunk sizes are kept in a temporary directory, not in data/cache).
+
+Each run starts with an empty response cache, and the server counters give
+the requests (including retries), the bytes transferred and the requests per
+second. The catalog, variables and OCCR endpoints are measured the same way.
+Use `--error-rate` and `--rate-limit` to measure the strategies under
+injected 503 errors and 429 throttling (the shared session retries both).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from ocacs_census_standin import GEOGRAPHY_ROWS, reset_stats, start_standin_server  # noqa: E402
+
+GEOGRAPHIES = ["CO", "CS", "PL", "CD", "LL", "LU", "SE", "SS", "SU", "PU", "UA", "TR", "BG"]
+
+
+def measure(server, cache_cls, obj, func) -> dict:
+    """Run `func` with an empty response cache and return its wall time and the server counters."""
+    obj.http_cache = cache_cls(tempfile.mkdtemp(prefix = "ocgd_bench_"))
+    reset_stats(server)
+    start = time.perf_counter()
+    result = func()
+    wall = time.perf_counter() - start
+    stats = dict(server.stats)
+    return {"ok": result is not None, "wall": wall, "requests": stats["requests"], "bytes": stats["bytes"], "retried": stats["errors_injected"] + stats["throttled"]}
+
+
+def report(label: str, m: dict) -> None:
+    """Print one result row."""
+    rps = m["requests"] / m["wall"] if m["wall"] > 0 else 0.0
+    status = "" if m["ok"] else "  (failed)"
+    print(f"{label:<24}{m['requests']:>9}{m['retried']:>9}{m['bytes'] / 1e6:>11.2f}{m['wall']:>10.2f}{rps:>9.1f}{status}")
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark the Census fetch strategies against the local stand-in server")
+    parser.add_argument("--year", type = int, default = 2022)
+    parser.add_argument("--level", default = "Demographic", help = "codebook level whose variables are fetched (Demographic, Social, Economic, Housing)")
+    parser.add_argument("--geographies", nargs = "+", default = GEOGRAPHIES)
+    parser.add_argument("--workers", type = int, default = 8)
+    parser.add_argument("--latency", type = float, default = 0.1, help = "stand-in server latency per request (seconds)")
+    parser.add_argument("--error-rate", type = float, default = 0.0, help = "fraction of requests answered with a 503")
+    parser.add_argument("--rate-limit", type = float, default = 0.0, help = "requests per second before the server answers 429 (0 = unlimited)")
+    parser.add_argument("--fixtures", default = None, help = "response cache directory to replay instead of synthetic responses")
+    args = parser.parse_args()
+
+    # Start the stand-in server and redirect the OCGD classes to it
+    server, _ = start_standin_server(port = 0, latency = args.latency, error_rate = args.error_rate, rate_limit = args.rate_limit, fixtures = args.fixtures)
+    os.environ["CENSUS_API_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("CENSUS_API_KEY1", "standin")
+
+    from ocgd import OCACS, OCCR, CensusCache
+
+    acs = OCACS(part = 0)
+    acs.configure_http_session(pool_size = max(16, args.workers))
+    acs.prj_dirs["data_cache"] = tempfile.mkdtemp(prefix = "ocgd_bench_sizes_")
+    acs._acs_chunk_sizes = None
+
+    # The variables of the selected level, from the year's variable codebook
+    with open(ROOT / "codebook" / f"ocacs_cb_vars_{args.year}.json", "r", encoding = "utf-8") as f:
+        variables = sorted(var for var, values in json.load(f).items() if values.get("level") == args.level)
+    print(f"\nFetching {len(variables)} {args.level} variables for {args.year} (latency {args.latency}s, error rate {args.error_rate}, rate limit {args.rate_limit or 'none'})")
+
+    # Build the group index once (it is kept in memory), so every run measures the data requests only
+    acs.get_acs_group_index(args.year)
+
+    print(f"\n{'geography / strategy':<24}{'requests':>9}{'retried':>9}{'MB':>11}{'wall (s)':>10}{'req/s':>9}")
+    for geography in args.geographies:
+        for_clause, in_clause = acs.get_acs_geography_clauses(geography)
+        rows = GEOGRAPHY_ROWS.get(for_clause.split(":")[0], ("", 1))[1]
+        chunks = [variables[i : i + 40] for i in range(0, len(variables), 40)]
+        plan = acs.plan_acs_requests(args.year, variables, chunk_size = 40, rows = rows)
+        runs = [
+            ("chunks x1", chunks, 1),
+            (f"chunks x{args.workers}", chunks, args.workers),
+            (f"groups x{args.workers}", plan, args.workers),
+        ]
+        for strategy, requests_plan, workers in runs:
+            m = measure(server, CensusCache, acs, lambda: acs.fetch_acs_chunks(args.year, requests_plan, for_clause, in_clause, max_workers = workers))
+            report(f"{geography:<12}{strategy}", m)
+        m = measure(server, CensusCache, acs, lambda: acs.fetch_acs_adaptive(args.year, variables, geography, for_clause, in_clause, max_workers = args.workers))
+        report(f"{geography:<12}adaptive x{args.workers}", m)
+
+    # The catalog, variables and OCCR endpoints
+    print(f"\n{'endpoint':<24}{'requests':>9}{'retried':>9}{'MB':>11}{'wall (s)':>10}{'req/s':>9}")
+    occr = OCCR(part = 0)
+    endpoints = [
+        ("data.json", acs, lambda: acs.load_census_catalog(refresh = True)),
+        ("acs5 variables.json", acs, lambda: acs.cached_get(f"{acs.census_api_url}/data/{args.year}/acs/acs5/variables.json")),
+        ("cr variables", occr, lambda: occr.generate_occr_codebook(args.year)),
+        ("cr tracts", occr, lambda: occr.fetch_occr_tables(args.year)),
+    ]
+    for label, obj, func in endpoints:
+        m = measure(server, CensusCache, obj, func)
+        report(label, m)
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+ocacs_census_standin.py
+
+A small local stand-in for the Census Data API, used to measure and test the
+OCGD fetch methods offline, without touching api.census.gov. It serves:
+
+- the discovery catalog (`/data.json`, with ETag revalidation);
+- the ACS 5-year data endpoint (`/data/{year}/acs/acs5`), including
+  `group(TABLE)` terms;
+- the ACS 5-year variables document (`/data/{year}/acs/acs5/variables.json`),
+  built from the project codebooks (`codebook/ocacs_cb_vars_{year}.json`)
+  plus a set of synthetic tables;
+- the Community Resilience Estimates data endpoint (`/data/{year}/cr`) and
+  its variables (`/data/{year}/cr/variables.json` and
+  `/data/{year}/cr/variables/{VAR}.json`, from `codebook/occr_cb_*.json`);
+- the TIGERweb REST directory (`/arcgis/rest/services/TIGERweb`), its
+  services and their feature layers, rebuilt from the TIGERweb inventory
+  (`codebook/octl_cb_twr.json`) plus label and group layers that the
+  crawler skips (with ETag revalidation; edit the documents returned by
+  `tigerweb_directory()` to simulate a TIGERweb update).
+
+Responses are synthetic (deterministic) unless a recorded fixture matches the
+request: `--fixtures DIR` loads the entries of a response cache directory
+(e.g. `data/cache` after a run against the real API) and replays them by
+path and query (the API key and host are ignored).
+
+The server can also mimic the real service under load: `--latency` adds a
+fixed delay to every request, `--error-rate` answers that fraction of the
+data requests with a 503, and `--rate-limit` answers requests above that
+rate (requests per second) with a 429 and a Retry-After header.
+
+Usage: python ocacs_census_standin.py --port 8765 --latency 0.25 --error-rate 0.02 --rate-limit 50
+
+Then point the OCGD classes at it before constructing them:
+
+    CENSUS_API_URL=http://127.0.0.1:8765
+    TIGERWEB_URL=http://127.0.0.1:8765/arcgis/rest/services/TIGERweb
+
+This script is written to be importable; call `start_standin_server()` from
+other scripts (e.g. the benchmarks) to run it in a background thread. The
+request, byte and error counters of a running server are in `server.stats`
+(`max_in_flight` is the largest number of requests served at once).
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+CODEBOOK_DIR = ROOT / "codebook"
+
+# Synthetic row counts and summary levels for each Census API 'for' geography
+# (roughly the Orange County, CA counts for a recent vintage).
+GEOGRAPHY_ROWS: Dict[str, Tuple[str, int]] = {
+    "county": ("0500000", 1),
+    "county subdivision": ("0600000", 6),
+    "place": ("1600000", 1618),
+    "congressional district": ("5000000", 52),
+    "zip code tabulation area": ("8600000", 33791),
+    "state legislative district (lower chamber)": ("6200000", 80),
+    "state legislative district (upper chamber)": ("6100000", 40),
+    "school district (elementary)": ("9500000", 525),
+    "school district (secondary)": ("9600000", 76),
+    "school district (unified)": ("9700000", 344),
+    "urban area": ("4000000", 2611),
+    "public use microdata area": ("7950000", 281),
+    "tract": ("1400000", 614),
+    "block group": ("1500000", 1843),
+}
+
+# Years served by the minimal discovery catalog, and its validators for conditional requests
+CATALOG_YEARS = list(range(2010, 2025))
+CATALOG_ETAG = '"ocgd-standin-catalog-1"'
+CATALOG_LAST_MODIFIED = "Mon, 06 Jan 2025 00:00:00 GMT"
+
+# Synthetic ACS tables (B09000 - B09019, 50 estimates each) used by the benchmarks
+SYNTHETIC_TABLES = [f"B{t:05d}" for t in range(9000, 9020)]
+SYNTHETIC_TABLE_SIZE = 50
+
+# The Community Resilience Estimates variables (as requested by OCCR.fetch_occr_tables)
+CR_VARIABLES = ["GEO_ID", "SUMLEVEL", "GEOCOMP", "NAME", "POPUNI", "PRED0_E", "PRED12_E", "PRED3_E", "PRED0_PE", "PRED12_PE", "PRED3_PE", "PRED0_M", "PRED12_M", "PRED3_M", "PRED0_PM", "PRED12_PM", "PRED3_PM", "STATE", "COUNTY", "TRACT"]
+
+
+def synthetic_rows(for_clause: str, variables: List[str]) -> List[List[str]]:
+    """Return an array-of-arrays response for `for_clause` and `variables`.
+
+    Values are deterministic (derived from the row and column positions) so
+    repeated requests return identical payloads.
+    """
+    geography = for_clause.split(":")[0]
+    sumlevel, count = GEOGRAPHY_ROWS.get(geography, ("0000000", 1))
+    rows: List[List[str]] = [list(variables)]
+    for i in range(count):
+        geo_id = f"{sumlevel}US06059{i:07d}"
+        row = []
+        for j, var in enumerate(variables):
+            if var == "GEO_ID":
+                row.append(geo_id)
+            elif var == "NAME":
+                row.append(f"Synthetic {geography} {i}, Orange County, California")
+            elif var.endswith("EA") or var.endswith("MA"):
+                # Annotation attributes are null for published values
+                row.append(None)
+            else:
+                row.append(str((i * 31 + j * 7) % 100000))
+        rows.append(row)
+    return rows
+
+
+def catalog() -> Dict[str, list]:
+    """Return a minimal data.json discovery catalog for the acs5 and cr datasets."""
+    datasets = []
+    for year in CATALOG_YEARS:
+        datasets.append({"c_vintage": year, "c_dataset": ["acs", "acs5"]})
+        if year >= 2019:
+            datasets.append({"c_vintage": year, "c_dataset": ["cr"]})
+    for ds in datasets:
+        ds["distribution"] = [{"accessURL": f"http://api.census.gov/data/{ds['c_vintage']}/{'/'.join(ds['c_dataset'])}"}]
+    return {"dataset": datasets}
+
+
+_acs_variables_memo: Dict[int, dict] = {}
+_acs_variables_lock = threading.Lock()
+
+
+def acs_variables(year: int) -> dict:
+    """Return the ACS 5-year variables.json document for `year`.
+
+    The variables of the project codebook for the year (if present) are
+    served with their concept, type, group and attributes; the synthetic
+    tables are added for every year.
+    """
+    with _acs_variables_lock:
+        if year in _acs_variables_memo:
+            return _acs_variables_memo[year]
+        variables = {
+            "for": {"label": "Census API FIPS 'for' clause", "concept": "Census API Geography Specification", "predicateType": "fips-for", "group": "N/A", "limit": 0, "predicateOnly": True},
+            "in": {"label": "Census API FIPS 'in' clause", "concept": "Census API Geography Specification", "predicateType": "fips-in", "group": "N/A", "limit": 0, "predicateOnly": True},
+            "GEO_ID": {"label": "Geography", "concept": "Geography", "predicateType": "string", "group": "N/A", "limit": 0},
+            "NAME": {"label": "Geographic Area Name", "concept": "Geography", "predicateType": "string", "group": "N/A", "limit": 0},
+        }
+        cb_path = CODEBOOK_DIR / f"ocacs_cb_vars_{year}.json"
+        if cb_path.exists():
+            with open(cb_path, "r", encoding = "utf-8") as f:
+                for var, values in json.load(f).items():
+                    variables[var] = {
+                        "label": "Estimate!!" + re.sub(r"^Estimate: ", "", values.get("label", var)).replace(": ", ":!!"),
+                        "concept": values.get("concept", ""),
+                        "predicateType": values.get("type", "int"),
+                        "group": values.get("group", var.split("_")[0]),
+                        "limit": 0,
+                        "attributes": values.get("attributes", f"{var[:-1]}M"),
+                    }
+        for table in SYNTHETIC_TABLES:
+            for k in range(1, SYNTHETIC_TABLE_SIZE + 1):
+                var = f"{table}_{k:03d}E"
+                variables[var] = {
+                    "label": f"Estimate!!Total:!!Synthetic item {k}",
+                    "concept": f"Synthetic Table {table}",
+                    "predicateType": "int",
+                    "group": table,
+                    "limit": 0,
+                    "attributes": f"{var[:-1]}M,{var}A,{var[:-1]}MA",
+                }
+        _acs_variables_memo[year] = {"variables": variables}
+        return _acs_variables_memo[year]
+
+
+def expand_groups(year: int, get_vars: List[str]) -> List[str]:
+    """Expand the `group(TABLE)` terms of a get clause into the table columns."""
+    expanded: List[str] = []
+    for term in get_vars:
+        match = re.fullmatch(r"group\((\w+)\)", term)
+        if not match:
+            expanded.append(term)
+            continue
+        expanded += ["GEO_ID", "NAME"]
+        for var, values in acs_variables(year)["variables"].items():
+            if values.get("group") == match.group(1):
+                expanded.append(var)
+                expanded += [a for a in values.get("attributes", "").split(",") if a]
+    # Keep the first occurrence of each column
+    return list(dict.fromkeys(expanded))
+
+
+def cr_variables() -> Dict[str, dict]:
+    """Return the Community Resilience Estimates variable metadata (from the project codebook when present)."""
+    for cb_path in sorted(CODEBOOK_DIR.glob("occr_cb_*.json")):
+        with open(cb_path, "r", encoding = "utf-8") as f:
+            return json.load(f)
+    return {var: {"name": var, "label": var, "concept": "Community Resilience Estimates", "predicateType": "int", "group": "CRE", "limit": 0} for var in CR_VARIABLES}
+
+
+@lru_cache(maxsize = 1)
+def tigerweb_directory() -> Tuple[list, Dict[str, dict], Dict[str, dict]]:
+    """Return the TIGERweb (services, service documents, layer documents), rebuilt from the project inventory.
+
+    The service and layer documents are keyed by their path below the
+    TIGERweb directory (`tigerWMS_{name}/{type}` and `.../{id}`). Every
+    service also lists a label layer and a group layer (skipped by the
+    crawler), and the directory lists one service that is not a tigerWMS one.
+    """
+    services = [{"name": "TIGERweb/Generalized_ACS2023", "type": "MapServer"}]
+    service_docs: Dict[str, dict] = {}
+    layer_docs: Dict[str, dict] = {}
+    inventory_path = CODEBOOK_DIR / "octl_cb_twr.json"
+    if not inventory_path.exists():
+        return services, service_docs, layer_docs
+    with open(inventory_path, "r", encoding = "utf-8") as f:
+        inventory = json.load(f)
+    entries = [entry for category in inventory.get("series", {}).values() for entry in category.values()]
+    entries += list(inventory.get("standalone", {}).values())
+    for entry in entries:
+        service_path = f"tigerWMS_{entry['name']}/{entry['type']}"
+        services.append({"name": f"TIGERweb/tigerWMS_{entry['name']}", "type": entry["type"]})
+        layers = [{"id": layer["id"], "name": label, "parentLayerId": -1, "type": layer["type"]} for label, layer in entry.get("layers", {}).items()]
+        layers.append({"id": 900, "name": f"{entry['name']} Labels", "parentLayerId": -1, "type": "Feature Layer"})
+        layers.append({"id": 901, "name": f"{entry['name']} Boundaries", "parentLayerId": -1, "type": "Group Layer"})
+        service_docs[service_path] = {
+            "currentVersion": entry.get("currentVersion"),
+            "cimVersion": entry.get("cimVersion"),
+            "mapName": entry.get("mapName"),
+            "description": entry.get("description"),
+            "spatialReference": {"wkid": 102100, "latestWkid": entry.get("spatialReference")},
+            "layers": layers,
+        }
+        for layer in entry.get("layers", {}).values():
+            layer_docs[f"{service_path}/{layer['id']}"] = {
+                "currentVersion": layer["currentVersion"],
+                "cimVersion": layer["cimVersion"],
+                "id": layer["id"],
+                "name": layer["name"],
+                "type": layer["type"],
+                "description": layer["description"],
+                "geometryType": layer["geometryType"],
+                "fields": [{"name": field, "type": "esriFieldTypeString", "alias": field} for field in layer["fields"]],
+            }
+    return services, service_docs, layer_docs
+
+
+def canonical_request(path: str, query: str) -> str:
+    """Return the canonical form of a request (path plus the sorted query without the API key)."""
+    items = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values = True) if k != "key")
+    return f"{path}?{urlencode(items)}" if items else path
+
+
+def load_fixtures(directory: str) -> Dict[str, Tuple[int, str]]:
+    """Load the recorded responses of a response cache directory, keyed by canonical request."""
+    fixtures: Dict[str, Tuple[int, str]] = {}
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(".json"):
+            continue
+        try:
+            with open(entry.path, "r", encoding = "utf-8") as f:
+                record = json.load(f)
+            parts = urlsplit(record["url"])
+            fixtures[canonical_request(parts.path, parts.query)] = (record["status"], record["content"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # Not a response cache entry (e.g. the catalog index)
+            continue
+    return fixtures
+
+
+def new_stats() -> Dict[str, int]:
+    """Return a zeroed set of server counters."""
+    return {"requests": 0, "bytes": 0, "fixtures": 0, "errors_injected": 0, "throttled": 0, "in_flight": 0, "max_in_flight": 0}
+
+
+class CensusStandinHandler(BaseHTTPRequestHandler):
+    """Request handler serving the recorded or synthetic Census API responses."""
+
+    # Behaviour settings (set by start_standin_server)
+    latency = 0.0
+    error_rate = 0.0
+    rate_limit = 0.0
+    fixtures: Dict[str, Tuple[int, str]] = {}
+    rng = random.Random(0)
+
+    # Shared counters and rate limiting state
+    stats = new_stats()
+    state = {"tokens": 0.0, "updated": 0.0}
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from BaseHTTPRequestHandler
+        # Keep the benchmark output clean
+        pass
+
+    def _send_body(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.lock:
+            self.stats["bytes"] += len(body)
+
+    def _send_json(self, status: int, payload, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_body(status, json.dumps(payload).encode("utf-8"), headers)
+
+    def _throttled(self) -> bool:
+        # Token bucket holding up to one second of requests
+        if self.rate_limit <= 0:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            if self.state["updated"] == 0.0:
+                self.state["tokens"] = self.rate_limit
+            else:
+                self.state["tokens"] = min(self.rate_limit, self.state["tokens"] + (now - self.state["updated"]) * self.rate_limit)
+            self.state["updated"] = now
+            if self.state["tokens"] >= 1:
+                self.state["tokens"] -= 1
+                return False
+            self.stats["throttled"] += 1
+            return True
+
+    def _inject_error(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self.lock:
+            failed = self.rng.random() < self.error_rate
+            if failed:
+                self.stats["errors_injected"] += 1
+        return failed
+
+    def do_GET(self):  # noqa: N802 - method name from BaseHTTPRequestHandler
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        try:
+            self._serve()
+        finally:
+            with self.lock:
+                self.stats["in_flight"] -= 1
+
+    def _serve(self) -> None:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        parts = urlsplit(self.path)
+        path = re.sub(r"/{2,}", "/", parts.path)
+        query = dict(parse_qsl(parts.query, keep_blank_values = True))
+
+        # The discovery catalog (a conditional request carrying the current ETag is answered with 304)
+        if path == "/data.json":
+            if self.headers.get("If-None-Match") == CATALOG_ETAG:
+                self.send_response(304)
+                self.send_header("ETag", CATALOG_ETAG)
+                self.end_headers()
+                return
+            self._send_json(200, catalog(), headers = {"ETag": CATALOG_ETAG, "Last-Modified": CATALOG_LAST_MODIFIED})
+            return
+
+        # Rate limiting and error injection apply to the data and variables endpoints
+        if self._throttled():
+            self._send_json(429, {"error": "rate limit exceeded"}, headers = {"Retry-After": "1"})
+            return
+        if self._inject_error():
+            self._send_json(503, {"error": "injected error"})
+            return
+
+        # Recorded responses take precedence over the synthetic ones
+        fixture = self.fixtures.get(canonical_request(path, parts.query))
+        if fixture is not None:
+            with self.lock:
+                self.stats["fixtures"] += 1
+            self._send_body(fixture[0], fixture[1].encode("utf-8"))
+            return
+
+        # The TIGERweb REST directory, services and layers
+        if path == "/arcgis/rest/services/TIGERweb" or path.startswith("/arcgis/rest/services/TIGERweb/"):
+            services, service_docs, layer_docs = tigerweb_directory()
+            resource = path[len("/arcgis/rest/services/TIGERweb"):].strip("/")
+            if not resource:
+                document = {"currentVersion": 11.3, "folders": [], "services": services}
+            else:
+                document = service_docs.get(resource) or layer_docs.get(resource)
+            if document is None:
+                self._send_json(200, {"error": {"code": 404, "message": "Service not found", "details": []}})
+                return
+            # The documents carry an ETag of their content, and a conditional request carrying the current ETag is answered with 304
+            body = json.dumps(document).encode("utf-8")
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self._send_body(200, body, headers = {"ETag": etag})
+            return
+
+        match = re.fullmatch(r"/data/(\d{4})/(acs/acs5|cr)(/variables\.json|/variables/([^/]+)\.json)?", path)
+        if not match:
+            self._send_json(404, {"error": f"unknown endpoint {path}"})
+            return
+        year, dataset, variables_doc, variable = int(match.group(1)), match.group(2), match.group(3), match.group(4)
+
+        # Variables documents
+        if dataset == "acs/acs5" and variables_doc == "/variables.json":
+            self._send_json(200, acs_variables(year))
+            return
+        if dataset == "cr" and variables_doc == "/variables.json":
+            # The variables document lists the entries without their "name" (only the per-variable endpoint includes it)
+            self._send_json(200, {"variables": {var: {k: v for k, v in info.items() if k != "name"} for var, info in cr_variables().items()}})
+            return
+        if dataset == "cr" and variable:
+            info = cr_variables().get(variable)
+            if info is None:
+                self._send_json(404, {"error": f"unknown variable {variable}"})
+                return
+            self._send_json(200, info)
+            return
+        if variables_doc:
+            self._send_json(404, {"error": f"unknown endpoint {path}"})
+            return
+
+        # Data requests (the real API rejects more than 50 variables, group() terms excepted)
+        requested = [v for v in query.get("get", "").split(",") if v]
+        for_clause = query.get("for", "")
+        if not requested or not for_clause:
+            self._send_json(400, {"error": "missing 'get' or 'for' parameter"})
+            return
+        if len([v for v in requested if not v.startswith("group(")]) > 50:
+            self._send_json(400, {"error": "a maximum of 50 variables may be requested"})
+            return
+        get_vars = expand_groups(year, requested) if dataset == "acs/acs5" else requested
+        self._send_json(200, synthetic_rows(for_clause, get_vars))
+
+
+def start_standin_server(port: int = 0, latency: float = 0.0, error_rate: float = 0.0, rate_limit: float = 0.0, fixtures: Optional[str] = None, seed: int = 0) -> Tuple[ThreadingHTTPServer, threading.Thread]:
+    """Start the stand-in server in a daemon thread and return (server, thread).
+
+    Use `port = 0` to bind a free port; the bound URL is
+    `f"http://127.0.0.1:{server.server_port}"`. `fixtures` is a response
+    cache directory to replay; `seed` makes the injected errors repeatable.
+    The server counters are in `server.stats` (see `reset_stats`).
+    """
+    settings = {
+        "latency": latency,
+        "error_rate": error_rate,
+        "rate_limit": rate_limit,
+        "fixtures": load_fixtures(fixtures) if fixtures else {},
+        "rng": random.Random(seed),
+        "stats": new_stats(),
+        "state": {"tokens": 0.0, "updated": 0.0},
+        "lock": threading.Lock(),
+    }
+    handler = type("ConfiguredCensusStandinHandler", (CensusStandinHandler,), settings)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.stats = handler.stats
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    return server, thread
+
+
+def reset_stats(server: ThreadingHTTPServer) -> None:
+    """Zero the counters of a running stand-in server."""
+    with server.RequestHandlerClass.lock:
+        server.stats.update(new_stats())
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Local stand-in for the Census Data API")
+    parser.add_argument("--port", type = int, default = 8765)
+    parser.add_argument("--latency", type = float, default = 0.25, help = "seconds of latency added to each request")
+    parser.add_argument("--error-rate", type = float, default = 0.0, help = "fraction of data requests answered with a 503")
+    parser.add_argument("--rate-limit", type = float, default = 0.0, help = "requests per second before answering 429 (0 = unlimited)")
+    parser.add_argument("--fixtures", default = None, help = "response cache directory to replay (e.g. data/cache)")
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args()
+    server, _ = start_standin_server(args.port, args.latency, args.error_rate, args.rate_limit, args.fixtures, args.seed)
+    fixtures = len(server.RequestHandlerClass.fixtures)
+    print(f"Census stand-in serving on http://127.0.0.1:{server.server_port} (latency {args.latency}s, {fixtures} recorded fixture(s)). Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+ocacs_golden_labels.py
+
+Golden check of `LabelNormalizer` (the label normalization of
+`OCACS.acs_cb_variables`) against the codebooks in
+`codebook/ocacs_cb_vars_*.json`.
+
+Usage: python scripts/ocacs_golden_labels.py
+
+For every variable of every year the Census API form of the label is rebuilt
+from the codebook label (the "!!" separators of variables.json, as served by
+`ocacs_census_standin.py`) and normalized again, and the result must match the
+codebook label.
+
+The aliases are assigned as `acs_cb_variables` assigns them: the alias of the
+master variables index when the variable is listed there, otherwise the
+label-derived alias of the normalizer. The master index is rebuilt from
+`codebook/ocacs_cb_vars.xlsx` the way `construct_master_variables_dict` and
+`get_acs_variable_index` build it (reproduced below), and every assigned alias
+must match the stored codebook alias. The label-derived alias of every
+variable must also match the legacy per-variable implementation (reproduced
+below), since it is the fallback for the variables missing from the index.
+
+A list of edge-case labels (non-ASCII characters, stray hyphens and colons) is
+also checked against the legacy implementation, together with seeded random
+labels (the engine drops the legacy second cleanup pass, which never changes
+the result). Exits with 1 on any mismatch.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+EDGE_CASES = [
+    "Estimate!!Total:!!Male:!!Under 5 years",
+    "Estimate!!Total:!!Hispanic or Latino:!!Not Hispanic or Latino:",
+    "Estimate!!Median household income in the past 12 months (in 2022 inflation-adjusted dollars)",
+    "Estimate!!Total:!!Householder 15 to 24 years -- Renter occupied",
+    "Estimate!!Total:!!Native Hawaiian and Other Pacific Islander alone - Guamanian or Chamorro",
+    "Estimate!!Total:-:!!Bachelor's degree",
+    "Estimate!!Total::!!Población - Niños",
+    "Estimate!!Total!!!!Male!!:!!- Under 5 years -",
+    "Estimate !! Total :!! Gross rent as a percentage of household income -- 30.0 to 34.9 percent",
+    "Margin of Error!!Total:",
+    "  Estimate!!  Total:  ",
+    "Estimate!!Total:!!Crème brûlée — café",
+    "Estimate:-Total",
+    "--Estimate--",
+    "",
+]
+
+
+def legacy_normalize(label: str) -> str:
+    """The per-variable label cleanup used by acs_cb_variables before LabelNormalizer."""
+    s = str(label)
+    # First pass
+    s = s.replace("!!", ": ")
+    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    s = re.sub(r"[^A-Za-z0-9\s:\-]", "", s)
+    s = re.sub(r"\s*-\s*", "-", s)
+    s = re.sub(r"-{2,}", "-", s)
+    s = re.sub(r"(?<![A-Za-z0-9])-|-(?![A-Za-z0-9])", "", s)
+    s = re.sub(r":{2,}", ":", s)
+    s = re.sub(r"\s*:\s*", ": ", s)
+    s = re.sub(r"\s+", " ", s)
+    s = s.strip(" \t\n\r:-")
+    # Second pass
+    s = re.sub(r"-{2,}", "-", s)
+    s = re.sub(r"(?<![A-Za-z0-9])-|-(?![A-Za-z0-9])", "", s)
+    s = re.sub(r":{2,}", ":", s)
+    s = re.sub(r"\s*:\s*", ": ", s)
+    s = re.sub(r"\s+", " ", s)
+    s = s.strip(" \t\n\r:-")
+    return s
+
+
+def legacy_alias(label: str) -> str:
+    """The label-derived alias used by acs_cb_variables before LabelNormalizer."""
+    return re.sub(r"^Estimate\s*: *", "", label)
+
+
+def master_index(years: list) -> dict:
+    """The variable index (variable to [level, section, section_name, alias]) of each year, built from ocacs_cb_vars.xlsx as construct_master_variables_dict and get_acs_variable_index build it."""
+    df_cb_vars = pd.read_excel(ROOT / "codebook" / "ocacs_cb_vars.xlsx")
+    df_cb_vars = df_cb_vars[df_cb_vars["used"]]
+    df_long = df_cb_vars.melt(id_vars = ["variable", "alias", "level", "section", "section_name"], value_vars = years, var_name = "year", value_name = "included")
+    df_long = df_long[df_long["included"] == True]
+    cb_master = {year: {} for year in years}
+    for year, variable, alias, level, section, section_name in zip(df_long["year"], df_long["variable"], df_long["alias"], df_long["level"], df_long["section"], df_long["section_name"]):
+        section_info = cb_master[year].setdefault(level, {}).setdefault(section, {"section": section, "section_name": section_name, "variables": {}})
+        section_info["variables"].setdefault(variable, alias)
+    index = {}
+    for year, levels in cb_master.items():
+        year_index = index[year] = {}
+        for level in ["Demographic", "Social", "Economic", "Housing"]:
+            for section_info in levels.get(level, {}).values():
+                for var, alias in section_info["variables"].items():
+                    year_index.setdefault(var, [level, section_info["section"], section_info["section_name"], alias])
+    return index
+
+
+def census_label(label: str) -> str:
+    """The Census API (variables.json) form of a codebook label, as served by the stand-in server."""
+    return "Estimate!!" + re.sub(r"^Estimate: ", "", label).replace(": ", ":!!")
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Check the ACS label normalization against the codebooks")
+    parser.add_argument("--random", type = int, default = 100000, help = "number of random labels checked against the legacy implementation")
+    args = parser.parse_args()
+
+    from ocgd import LabelNormalizer
+
+    normalizer = LabelNormalizer()
+    failures = 0
+
+    # The codebook labels and aliases of every year
+    paths = sorted((ROOT / "codebook").glob("ocacs_cb_vars_[0-9][0-9][0-9][0-9].json"))
+    index = master_index([path.stem[-4:] for path in paths])
+    print(f"\n{'year':<8}{'variables':>10}{'labels':>10}{'aliases':>10}{'from index':>12}{'derived':>10}")
+    for path in paths:
+        with open(path, "r", encoding = "utf-8") as f:
+            cb = json.load(f)
+        cb = {var: values for var, values in cb.items() if values.get("label") is not None}
+        raw = pd.Series({var: census_label(values["label"]) for var, values in cb.items()}, dtype = object)
+        labels = normalizer.normalize(raw)
+        aliases = normalizer.aliases(labels)
+        year_index = index[path.stem[-4:]]
+        assigned = {var: year_index[var][3] if var in year_index else aliases[var] for var in cb}
+
+        label_errors = [var for var in cb if labels[var] != cb[var]["label"]]
+        alias_errors = [var for var in cb if assigned[var] != cb[var]["alias"]]
+        derived_errors = [var for var in cb if aliases[var] != legacy_alias(legacy_normalize(raw[var]))]
+        from_index = sum(1 for var in cb if var in year_index)
+        print(f"{path.stem[-4:]:<8}{len(cb):>10,}{len(cb) - len(label_errors):>10,}{len(cb) - len(alias_errors):>10,}{from_index:>12,}{len(cb) - len(derived_errors):>10,}")
+        for var in (label_errors + alias_errors + derived_errors)[:5]:
+            print(f"  - {var}: {labels[var]!r} / {assigned[var]!r} / {aliases[var]!r} (codebook {cb[var]['label']!r} / {cb[var]['alias']!r})")
+        failures += len(label_errors) + len(alias_errors) + len(derived_errors)
+
+    # The edge cases and random labels against the legacy implementation
+    rng = random.Random(0)
+    alphabet = "aB1 :-!\t\n.'(\u00e9\u2014"
+    samples = EDGE_CASES + ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(args.random)]
+    labels = normalizer.normalize(pd.Series(samples, dtype = object))
+    aliases = normalizer.aliases(labels)
+    for raw, label, alias in zip(samples, labels, aliases):
+        if label != legacy_normalize(raw) or alias != legacy_alias(legacy_normalize(raw)):
+            print(f"  - {raw!r}: {label!r} / {alias!r} (legacy {legacy_normalize(raw)!r})")
+            failures += 1
+    print(f"\n{len(EDGE_CASES)} edge-case and {args.random:,} random label(s) checked against the legacy implementation")
+
+    # Normalizing a normalized label must not change it
+    idempotent = normalizer.normalize(labels)
+    failures += int((idempotent != labels).sum())
+
+    print("All labels match." if failures == 0 else f"ERROR: {failures} mismatch(es)")
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+octl_benchmark_crawl.py
+
+Benchmark the serial and concurrent TIGERweb crawl of `OCGD.crawl_tigerweb`
+against the TIGERweb directory of the local stand-in server
+(`ocacs_census_standin.py`), so no requests are sent to tigerweb.geo.census.gov.
+
+Usage: python scripts/octl_benchmark_crawl.py --latency 0.1 --workers 1 4 8 --per-host 4
+
+The stand-in rebuilds the 19 services and their feature layers from the
+project inventory (`codebook/octl_cb_twr.json`). Each run crawls the full
+directory, checks that the inventory is identical to the project inventory
+(the stand-in host replaced by the TIGERweb one, the project metadata
+aside), and prints the requests, the largest number of requests served at
+once, the wall time and the speedup over the first run.
+
+Two incremental refreshes (`OCGD.refresh_tigerweb`) follow, in a temporary
+codebook directory: the first one without validators (one request per
+service) and the second one with the ETag validators of the first (the
+service documents are answered with 304).
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from ocacs_census_standin import reset_stats, start_standin_server  # noqa: E402
+
+TIGERWEB_URL = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb"
+
+
+def same_inventory(inventory: dict, reference: dict, standin_url: str) -> bool:
+    """Return whether a crawled inventory matches the project inventory (ignoring the host and the project metadata)."""
+    crawled = json.loads(json.dumps(inventory).replace(standin_url, TIGERWEB_URL))
+    for key in ("project", "version", "date", "author"):
+        crawled["metadata"][key] = reference["metadata"][key]
+    return json.dumps(crawled, indent = 4) == json.dumps(reference, indent = 4)
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark the serial and concurrent TIGERweb crawl")
+    parser.add_argument("--latency", type = float, default = 0.1, help = "stand-in server latency per request (seconds)")
+    parser.add_argument("--workers", type = int, nargs = "+", default = [1, 4, 8])
+    parser.add_argument("--per-host", type = int, default = 4, help = "maximum requests in flight to the TIGERweb host")
+    args = parser.parse_args()
+
+    # Start the stand-in server and redirect the OCGD classes to it
+    server, _ = start_standin_server(port = 0, latency = args.latency)
+    standin_url = f"http://127.0.0.1:{server.server_port}/arcgis/rest/services/TIGERweb"
+    os.environ["CENSUS_API_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["TIGERWEB_URL"] = standin_url
+    os.environ.setdefault("CENSUS_API_KEY1", "standin")
+
+    from ocgd import OCTL
+
+    octl = OCTL(part = 0)
+    octl.configure_http_session(pool_size = max(16, max(args.workers)))
+    with open(ROOT / "codebook" / "octl_cb_twr.json", "r", encoding = "utf-8") as f:
+        reference = json.load(f)
+
+    print(f"\nCrawling the TIGERweb stand-in (latency {args.latency}s, at most {args.per_host} request(s) in flight per host)\n")
+    print(f"{'workers':>8}{'requests':>10}{'in flight':>11}{'wall (s)':>10}{'speedup':>10}")
+    baseline_time = None
+    for workers in args.workers:
+        reset_stats(server)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            inventory = octl.crawl_tigerweb(export = False, max_workers = workers, per_host = args.per_host)
+        elapsed = time.perf_counter() - start
+        if not same_inventory(inventory, reference, standin_url):
+            print(f"ERROR: the inventory crawled with {workers} workers differs from codebook/octl_cb_twr.json")
+            return 1
+        baseline_time = baseline_time or elapsed
+        print(f"{workers:>8}{server.stats['requests']:>10}{server.stats['max_in_flight']:>11}{elapsed:>10.2f}{baseline_time / elapsed:>9.1f}x")
+
+    # Incremental refreshes of the project inventory (copied to a temporary codebook directory, with the stand-in host)
+    codebook_dir = tempfile.mkdtemp(prefix = "octl_bench_cb_")
+    shutil.copy(ROOT / "codebook" / "octl_cb_master.json", codebook_dir)
+    with open(os.path.join(codebook_dir, "octl_cb_twr.json"), "w", encoding = "utf-8") as f:
+        f.write(json.dumps(reference, indent = 4).replace(TIGERWEB_URL, standin_url))
+    octl.prj_dirs["codebook"] = codebook_dir
+    octl.prj_dirs["data_cache"] = tempfile.mkdtemp(prefix = "octl_bench_cache_")
+    print(f"\n{'refresh':<16}{'requests':>10}{'KB':>9}{'wall (s)':>10}{'changes':>9}")
+    for label in ["no validators", "validators"]:
+        reset_stats(server)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, diff = octl.refresh_tigerweb(export = True, max_workers = max(args.workers), per_host = args.per_host, rebuild_master = False)
+        elapsed = time.perf_counter() - start
+        changes = sum(len(items) for kind in diff.values() for items in kind.values())
+        print(f"{label:<16}{server.stats['requests']:>10}{server.stats['bytes'] / 1e3:>9.1f}{elapsed:>10.2f}{changes:>9}")
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
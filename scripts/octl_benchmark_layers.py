@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+octl_benchmark_layers.py
+
+Micro-benchmark of the TIGERweb layer classification: the legacy substring
+scans and regex chain of `OCGD.crawl_tigerweb` (see `octl_golden_layers.py`)
+against `TWRLayerClassifier`, over the layer names recorded in
+`codebook/octl_cb_twr.json`.
+
+Usage: python scripts/octl_benchmark_layers.py --repeat 200
+
+Each mode classifies the recorded layer names `--repeat` times (one repeat is
+one full crawl). The classifier is timed without memo (a new classifier per
+repeat, the compiled scan of the terms being shared) and with its memo kept
+across repeats, the way the OCGD classes keep one classifier. The master
+codebook lookup is timed the same way: the legacy substring scan of every
+lookup key over every layer against one classifier scan per layer.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from octl_golden_layers import legacy_classify, recorded_layers  # noqa: E402
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Benchmark the legacy and compiled TIGERweb layer classification")
+    parser.add_argument("--repeat", type = int, default = 200)
+    args = parser.parse_args()
+
+    from ocgd import TWRLayerClassifier
+
+    names = [name for name, _ in recorded_layers()]
+    total = len(names) * args.repeat
+    classifier = TWRLayerClassifier()
+    cb_codes = {term: values["code"] for term, values in classifier.terms.items()}
+    group_codes = {term: values["group"] for term, values in classifier.terms.items()}
+    with open(ROOT / "codebook" / "octl_cb_master.json", "r", encoding = "utf-8") as f:
+        lookup_keys = list(json.load(f))
+    print(f"\n{len(names)} recorded layer name(s) ({len(set(names))} distinct), {args.repeat} repeat(s)\n")
+
+    # Layer classification
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy = [legacy_classify(name, cb_codes, group_codes) for name in names]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        cold_classifier = TWRLayerClassifier()
+        cold = [cold_classifier.classify(name) for name in names]
+    cold_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        shared = [classifier.classify(name) for name in names]
+    shared_time = time.perf_counter() - start
+
+    if cold != legacy or shared != legacy:
+        print("ERROR: the classifications differ from the legacy implementation")
+        return 1
+
+    # Master codebook lookup (the lookup keys contained in each layer name)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy_keys = [[key for key in lookup_keys if key in name] for name in names]
+    lookup_legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        lookup = TWRLayerClassifier({key: {} for key in lookup_keys})
+        keys = [lookup.matches(name) for name in names]
+    lookup_time = time.perf_counter() - start
+
+    if [sorted(k) for k in keys] != [sorted(k) for k in legacy_keys]:
+        print("ERROR: the lookup keys differ from the legacy substring scan")
+        return 1
+
+    print(f"{'mode':<32}{'time (s)':>10}{'names/s':>12}{'speedup':>10}")
+    for mode, seconds, baseline in [
+        ("legacy substring scans", legacy_time, legacy_time),
+        ("classifier, memo per repeat", cold_time, legacy_time),
+        ("classifier, shared memo", shared_time, legacy_time),
+        ("master lookup, legacy scan", lookup_legacy_time, lookup_legacy_time),
+        ("master lookup, classifier", lookup_time, lookup_legacy_time),
+    ]:
+        print(f"{mode:<32}{seconds:>10.3f}{total / seconds:>12,.0f}{baseline / seconds:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())
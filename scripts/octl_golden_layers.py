@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+octl_golden_layers.py
+
+Golden check of `TWRLayerClassifier` (the layer classification of
+`OCGD.crawl_tigerweb` and the layer lookup of `OCGD.create_octl_master_cb`)
+against the TIGERweb inventory in `codebook/octl_cb_twr.json`.
+
+Usage: python scripts/octl_golden_layers.py --random 20000
+
+For every recorded layer the (group, code, alias) of the classifier must
+match the inventory and the legacy substring scans (reproduced below), and
+the exclusions must match the legacy exclusion scan. The lookup keys that the
+classifier finds in each layer name must match the substring scan of the
+master codebook over its keys (`codebook/octl_cb_master.json`). A list of
+edge-case names (congress numbers, years, "Corrected", overlapping terms) is
+checked the same way, together with seeded random names built from the terms,
+and a table of overlapping terms checks the lookahead scan of the classifier.
+Exits with 1 on any mismatch.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+EDGE_CASES = [
+    "118th Congressional Districts",
+    "116th Congressional Districts Corrected",
+    "2020 Census Urban Areas - Corrected",
+    "2022 State Legislative Districts - Upper",
+    "2022 State Legislative Districts - Lower",
+    "1234th Congressional Districts",
+    "12th Congressional Districts",
+    "2010 Census ZIP Code Tabulation Areas",
+    "Census Block Groups",
+    "Census Blocks",
+    "Counties Labels",
+    "Urban Areas Urbanized Areas Urban Clusters",
+    "Tracts Counties Blocks",
+    "Corrected",
+    "Roads",
+    "",
+]
+
+
+def legacy_classify(name: str, cb_codes: dict, group_codes: dict) -> tuple:
+    """The per-layer classification used by crawl_tigerweb before TWRLayerClassifier."""
+    layer_group = None
+    layer_alias = None
+    layer_code = None
+    for group_key, group_value in group_codes.items():
+        if group_key in name:
+            layer_group = group_value
+    for cb_code_key, cb_code_value in cb_codes.items():
+        if cb_code_key in name:
+            layer_code = cb_code_value
+            layer_alias = cb_code_key
+    if "Counties" in name:
+        layer_alias = "Orange County"
+    if "Congressional Districts" in name and re.match(r'^\d{3}th', name):
+        layer_congress = int(re.match(r'^\d{3}', name).group())
+        layer_alias = f"Congressional Districts-{layer_congress}th US Congress"
+        layer_code = f"{layer_code}{layer_congress}"
+    if "State Legislative Districts - Upper" in name:
+        layer_alias = "State Senate Legislative Districts"
+    if "State Legislative Districts - Lower" in name:
+        layer_alias = "State Assembly Legislative Districts"
+    if "Corrected" in name:
+        layer_alias = f"{layer_alias} Corrected"
+        layer_code = f"{layer_code}_Corrected"
+    if re.match(r'^\d{4}', name):
+        layer_year = int(re.match(r'^\d{4}', name).group())
+        layer_alias = f"{layer_alias}-{layer_year}"
+        layer_code = f"{layer_code}{layer_year}"
+    return (layer_group, layer_code, layer_alias)
+
+
+def legacy_excluded(name: str, exclusions: list) -> bool:
+    """The exclusion scan used by crawl_tigerweb before TWRLayerClassifier."""
+    return any(exclusion in name for exclusion in exclusions)
+
+
+def recorded_layers() -> list:
+    """Return the recorded layers of the inventory as (name, (group, code, alias)) tuples."""
+    with open(ROOT / "codebook" / "octl_cb_twr.json", "r", encoding = "utf-8") as f:
+        inventory = json.load(f)
+    entries = [entry for category in inventory["series"].values() for entry in category.values()]
+    entries += list(inventory["standalone"].values())
+    return [(layer["name"], (layer["group"], layer["code"], layer["alias"])) for entry in entries for layer in entry.get("layers", {}).values()]
+
+
+def random_names(terms: list, exclusions: list, count: int, seed: int = 0) -> list:
+    """Return seeded random layer names built from the terms, exclusions and name prefixes."""
+    rng = random.Random(seed)
+    prefixes = ["", "", "2020 ", "2010 Census ", "118th ", "1999th ", "12th ", "Census "]
+    suffixes = ["", "", " Corrected", " - Corrected", " Labels", " 2022"]
+    words = terms + exclusions + ["Roads", "Areas", "Districts", "Urban", "State"]
+    return [rng.choice(prefixes) + " ".join(rng.choice(words) for _ in range(rng.randint(1, 3))) + rng.choice(suffixes) for _ in range(count)]
+
+
+def _cli_main() -> int:
+    parser = argparse.ArgumentParser(description = "Golden check of the TIGERweb layer classifier")
+    parser.add_argument("--random", type = int, default = 5000, help = "number of seeded random layer names to check")
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    from ocgd import TWRLayerClassifier
+
+    classifier = TWRLayerClassifier()
+    cb_codes = {term: values["code"] for term, values in classifier.terms.items()}
+    group_codes = {term: values["group"] for term, values in classifier.terms.items()}
+    with open(ROOT / "codebook" / "octl_cb_master.json", "r", encoding = "utf-8") as f:
+        lookup_keys = list(json.load(f))
+    lookup = TWRLayerClassifier({key: {} for key in lookup_keys})
+
+    failures = 0
+    layers = recorded_layers()
+    for name, recorded in layers:
+        got = classifier.classify(name)
+        if got != recorded or got != legacy_classify(name, cb_codes, group_codes):
+            failures += 1
+            print(f"MISMATCH {name!r}: classifier {got}, inventory {recorded}, legacy {legacy_classify(name, cb_codes, group_codes)}")
+    print(f"{len(layers)} recorded layer(s) checked against the inventory")
+
+    names = [name for name, _ in layers] + EDGE_CASES + random_names(list(classifier.terms) + lookup_keys, classifier.EXCLUSIONS, args.random, args.seed)
+    for name in names:
+        if classifier.classify(name) != legacy_classify(name, cb_codes, group_codes):
+            failures += 1
+            print(f"MISMATCH classify {name!r}: {classifier.classify(name)} != {legacy_classify(name, cb_codes, group_codes)}")
+        if classifier.excluded(name) != legacy_excluded(name, classifier.EXCLUSIONS):
+            failures += 1
+            print(f"MISMATCH excluded {name!r}")
+        if sorted(lookup.matches(name)) != sorted(key for key in lookup_keys if key in name):
+            failures += 1
+            print(f"MISMATCH lookup {name!r}: {lookup.matches(name)}")
+    print(f"{len(names)} name(s) checked against the legacy classification, exclusions and master lookup ({len(EDGE_CASES)} edge case(s), {args.random} random)")
+
+    # A table whose terms overlap ("ab" ends where "bc" starts) needs the lookahead scan
+    overlapping = TWRLayerClassifier({"ab": {}, "bc": {}, "b": {}})
+    for name, expected in [("abc", ["ab", "bc", "b"]), ("xbcab", ["ab", "bc", "b"]), ("ac", [])]:
+        if overlapping.matches(name) != expected:
+            failures += 1
+            print(f"MISMATCH overlapping terms {name!r}: {overlapping.matches(name)} != {expected}")
+
+    if failures:
+        print(f"ERROR: {failures} mismatch(es)")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_cli_main())